@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Benchmark the streaming Fluent parser in localization_compile.py.
+
+Generates a synthetic FTL file (default 50k keys, with duplicates, conflicts
+and continuation lines) and parses it in fresh child processes so peak RSS is
+measured per parser:
+  baseline   interpreter + module import only
+  legacy     previous two-pass parser (full read, list of values per key)
+  streaming  parse_fluent_file (line iterator over the file handle)
+
+Usage:
+  python3 tools/bench_localization_fluent.py
+  python3 tools/bench_localization_fluent.py --keys 200000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from localization_compile import parse_fluent_file  # noqa: E402
+
+
+def parse_fluent_legacy(source: str) -> Tuple[
+    Dict[str, str],
+    Dict[str, List[str]],
+    Dict[str, List[str]],
+]:
+    """The two-pass parser localization_compile.py used before the streaming
+    rewrite; kept as the reference for this benchmark and its tests."""
+    entries_by_key: Dict[str, List[str]] = {}
+    current_key = ""
+    for raw_line in source.splitlines():
+        stripped = raw_line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        if raw_line[:1].isspace() and current_key:
+            if current_key in entries_by_key and entries_by_key[current_key]:
+                entries_by_key[current_key][-1] = (
+                    entries_by_key[current_key][-1] + "\n" + stripped
+                )
+            continue
+        sep = raw_line.find("=")
+        if sep <= 0:
+            current_key = ""
+            continue
+        key = raw_line[:sep].strip()
+        value_raw = raw_line[sep + 1 :]
+        if value_raw.startswith(" "):
+            value_raw = value_raw[1:]
+        value = value_raw.replace("\\n", "\n").rstrip("\r")
+        if not key:
+            current_key = ""
+            continue
+        entries_by_key.setdefault(key, []).append(value)
+        current_key = key
+
+    flat: Dict[str, str] = {}
+    duplicate_keys: Dict[str, List[str]] = {}
+    duplicate_conflict_keys: Dict[str, List[str]] = {}
+    for key, values in entries_by_key.items():
+        if not values:
+            continue
+        if len(values) > 1:
+            duplicate_keys[key] = ["fluent" for _ in values]
+            if len(set(values)) > 1:
+                duplicate_conflict_keys[key] = ["fluent" for _ in values]
+        flat[key] = values[-1]
+    return flat, duplicate_keys, duplicate_conflict_keys
+
+
+def _write_synthetic_ftl(path: Path, key_count: int, seed: int) -> None:
+    rng = random.Random(seed)
+    words = ["agent", "stress", "hunger", "shelter", "{name}", "가족", "역경", "warmth", "트라우마"]
+    with path.open("w", encoding="utf-8") as fp:
+        fp.write("# Synthetic benchmark source\n\n")
+        for idx in range(key_count):
+            value = " ".join(rng.choice(words) for _ in range(rng.randint(3, 12)))
+            fp.write(f"BENCH_KEY_{idx:06d} = {value}\n")
+            if idx % 50 == 0:
+                fp.write(f"    {value}\n")
+            if idx % 40 == 0:
+                dup_value = value if idx % 80 == 0 else value + " conflict"
+                fp.write(f"BENCH_KEY_{idx:06d} = {dup_value}\n")
+
+
+def _child(mode: str, path: Path, repeat: int) -> Dict[str, float]:
+    started = time.perf_counter()
+    flat_count = 0
+    duplicate_count = 0
+    for _ in range(repeat):
+        if mode == "legacy":
+            parsed = parse_fluent_legacy(path.read_text(encoding="utf-8"))
+        elif mode == "streaming":
+            parsed = parse_fluent_file(path)
+        else:
+            parsed = ({}, {}, {})
+        flat_count = len(parsed[0])
+        duplicate_count = len(parsed[1])
+    elapsed = time.perf_counter() - started
+    return {
+        "elapsed_s": elapsed / max(repeat, 1),
+        "flat_count": flat_count,
+        "duplicate_count": duplicate_count,
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def _run_child(mode: str, path: Path, repeat: int) -> Dict[str, float]:
+    completed = subprocess.run(
+        [
+            sys.executable,
+            os.path.abspath(__file__),
+            "--child",
+            mode,
+            "--ftl",
+            str(path),
+            "--repeat",
+            str(repeat),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(completed.stdout)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keys", type=int, default=50000, help="synthetic key count")
+    parser.add_argument("--repeat", type=int, default=3, help="parses per child process")
+    parser.add_argument("--seed", type=int, default=7, help="synthetic content seed")
+    parser.add_argument("--ftl", default="", help=argparse.SUPPRESS)
+    parser.add_argument("--child", default="", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(_child(args.child, Path(args.ftl), args.repeat)))
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ftl_path = Path(tmp) / "messages.ftl"
+        _write_synthetic_ftl(ftl_path, args.keys, args.seed)
+        size_kb = ftl_path.stat().st_size / 1024.0
+        print(f"[bench_localization_fluent] keys={args.keys} ftl_size_kb={size_kb:.0f}")
+        baseline = _run_child("baseline", ftl_path, 1)
+        for mode in ("legacy", "streaming"):
+            result = _run_child(mode, ftl_path, args.repeat)
+            rss_delta_kb = result["peak_rss_kb"] - baseline["peak_rss_kb"]
+            print(
+                f"[bench_localization_fluent] {mode}: "
+                f"parse_ms={result['elapsed_s'] * 1000.0:.1f} "
+                f"keys_per_s={result['flat_count'] / max(result['elapsed_s'], 1e-9):.0f} "
+                f"peak_rss_kb={result['peak_rss_kb']:.0f} rss_over_baseline_kb={rss_delta_kb:.0f} "
+                f"keys={result['flat_count']:.0f} duplicates={result['duplicate_count']:.0f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,16 +11,29 @@ derive_composite_violation_stress.py
 - dark tetrad (d_ prefix) violation_stress 절대 덮어쓰지 않음
 - 이미 violation_stress 있는 composite 덮어쓰지 않음
 - 원본 파일 보존, derived.json에만 저장
+
+계산: facet→action 위반 행렬 V (facets x actions)와 composite→facet 멤버십 행렬
+M (composites x facets, 조건에 facet이 나온 횟수)을 희소 행렬로 만들고,
+모든 composite를 diag(decay) @ (M @ V) 한 번으로 구한 뒤 반올림/클램프한다.
+
+--diff 모드는 facet 위반 값을 바꿨을 때 영향받는 composite(M의 해당 열)만
+다시 계산해 변경 내역을 보고하며, 출력 파일은 쓰지 않는다.
+  python3 tools/derive_composite_violation_stress.py --diff f_sincere:lie=12
+  python3 tools/derive_composite_violation_stress.py --diff-source edited.json
 """
 
 from __future__ import annotations
 
+import argparse
 import json
 from collections import defaultdict
 from copy import deepcopy
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+from scipy import sparse
+
 SOURCE_PATH = Path("data/personality/trait_definitions_fixed.json")
 OUTPUT_PATH = Path("data/personality/trait_definitions_derived.json")
 
@@ -148,6 +161,15 @@ def decay_factor_for_composite(composite: dict[str, Any]) -> float:
     return 0.6
 
 
+def round_violation_stress(raw_sum: float, factor: float) -> float:
+    """Decay, round to 0.1 and clamp to [0, 30].
+
+    The raw sum is snapped to 1e-9 first so that summation order (this loop
+    vs. the sparse product in ViolationMatrices) cannot flip a .x5 tie.
+    """
+    return max(0.0, min(30.0, round(round(raw_sum, 9) * factor, 1)))
+
+
 def derive_violation_stress(
     composite: dict[str, Any],
     facet_violation_map: dict[str, dict[str, float]],
@@ -163,55 +185,258 @@ def derive_violation_stress(
 
     derived: dict[str, float] = {}
     for action, raw_value in raw_sums.items():
-        value = round(raw_value * factor, 1)
-        value = max(0.0, min(30.0, value))
+        value = round_violation_stress(raw_value, factor)
         if value >= 1.0:
             derived[action] = value
 
     return derived
 
 
+class ViolationMatrices:
+    """Sparse V (facets x actions) and M (composites x facets) with per-composite decay."""
+
+    def __init__(
+        self,
+        composites: list[dict[str, Any]],
+        facet_violation_map: dict[str, dict[str, float]],
+    ) -> None:
+        self.composite_ids = [str(c.get("id", "")) for c in composites]
+        self.facet_violation_map = {f: dict(v) for f, v in facet_violation_map.items()}
+        referenced = [
+            facet_id
+            for facets in list(AXIS_FACETS.values()) + list(SUBFACET_FACETS.values())
+            for facet_id in facets
+        ]
+        self.facet_ids = list(dict.fromkeys(list(facet_violation_map) + referenced))
+        self.facet_index = {facet_id: idx for idx, facet_id in enumerate(self.facet_ids)}
+        self.actions: list[str] = []
+        self.action_index: dict[str, int] = {}
+        self.violation = self._facet_rows(facet_violation_map)
+
+        rows: list[int] = []
+        cols: list[int] = []
+        # Facets in condition traversal order, for the loop's action key order.
+        self.composite_facets: list[list[str]] = []
+        for row, composite in enumerate(composites):
+            facets: list[str] = []
+            for item in composite.get("condition", {}).get("all", []):
+                for facet_id in resolve_facets_for_condition_item(item):
+                    rows.append(row)
+                    cols.append(self.facet_index[facet_id])
+                    facets.append(facet_id)
+            self.composite_facets.append(facets)
+        # Duplicates add up: a facet reached twice counts twice, as in the loop.
+        self.membership = sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, cols)), shape=(len(composites), len(self.facet_ids))
+        )
+        self.decay = np.array([decay_factor_for_composite(c) for c in composites])
+
+    def _action(self, action: str) -> int:
+        if action not in self.action_index:
+            self.action_index[action] = len(self.actions)
+            self.actions.append(action)
+        return self.action_index[action]
+
+    def _facet_rows(self, facet_map: dict[str, dict[str, float]]) -> sparse.csr_matrix:
+        """(facets x actions) matrix holding `facet_map`; new actions get new columns."""
+        rows: list[int] = []
+        cols: list[int] = []
+        data: list[float] = []
+        for facet_id, violation in facet_map.items():
+            if facet_id not in self.facet_index:
+                raise ValueError(f"unknown facet {facet_id!r}")
+            for action, value in violation.items():
+                rows.append(self.facet_index[facet_id])
+                cols.append(self._action(action))
+                data.append(float(value))
+        return sparse.csr_matrix((data, (rows, cols)), shape=(len(self.facet_ids), len(self.actions)))
+
+    def raw(self, rows: np.ndarray | None = None) -> sparse.csr_matrix:
+        """M @ V for all (or the given) composite rows, before decay and rounding."""
+        if rows is None:
+            return self.membership @ self.violation
+        return self.membership[rows] @ self.violation
+
+    def stress_dicts(self, raw: sparse.csr_matrix, decay: np.ndarray) -> list[dict[str, float]]:
+        """Apply round_violation_stress with each row's decay and keep values >= 1.0."""
+        raw = sparse.csr_matrix(raw)
+        raw.sort_indices()
+        out: list[dict[str, float]] = []
+        for row in range(raw.shape[0]):
+            start, end = raw.indptr[row], raw.indptr[row + 1]
+            factor = float(decay[row])
+            derived: dict[str, float] = {}
+            for col, value in zip(raw.indices[start:end], raw.data[start:end]):
+                value = round_violation_stress(float(value), factor)
+                if value >= 1.0:
+                    derived[self.actions[col]] = value
+            out.append(derived)
+        return out
+
+    def _traversal_order(self, row: int, derived: dict[str, float]) -> dict[str, float]:
+        """Reorder `derived` to the first-seen action order of derive_violation_stress."""
+        order: dict[str, int] = {}
+        for facet_id in self.composite_facets[row]:
+            for action in self.facet_violation_map.get(facet_id, {}):
+                order.setdefault(action, len(order))
+        return dict(sorted(derived.items(), key=lambda item: order[item[0]]))
+
+    def derive_all(self) -> list[dict[str, float]]:
+        derived = self.stress_dicts(self.raw(), self.decay)
+        return [self._traversal_order(row, values) for row, values in enumerate(derived)]
+
+    def diff(self, edited_map: dict[str, dict[str, float]]) -> dict[str, dict[str, list[float | None]]]:
+        """Composites whose derived stress changes when facets get new violation maps.
+
+        `edited_map` holds the full new map of each edited facet. Only the
+        composites whose membership row touches an edited facet are
+        recomputed, as old raw + M[rows] @ (V_new - V_old), then decayed.
+        Returns {composite: {action: [old, new]}} for changed values.
+        """
+        edited = {
+            f: {a: float(v) for a, v in values.items()}
+            for f, values in edited_map.items()
+            if {a: float(v) for a, v in values.items()} != self.facet_violation_map.get(f, {})
+        }
+        if not edited:
+            return {}
+        delta = self._facet_rows(edited) - self._facet_rows(
+            {f: self.facet_violation_map.get(f, {}) for f in edited}
+        )
+        # New actions widen the matrices; the old V gets zero columns for them.
+        self.violation.resize((len(self.facet_ids), len(self.actions)))
+        delta.resize((len(self.facet_ids), len(self.actions)))
+        rows = np.unique(self.membership[:, [self.facet_index[f] for f in edited]].nonzero()[0])
+        if not len(rows):
+            return {}
+        old_raw = self.raw(rows)
+        new_raw = old_raw + self.membership[rows] @ delta
+        decay = self.decay[rows]
+        report: dict[str, dict[str, list[float | None]]] = {}
+        for row, old, new in zip(rows, self.stress_dicts(old_raw, decay), self.stress_dicts(new_raw, decay)):
+            changes = {
+                action: [old.get(action), new.get(action)]
+                for action in sorted(set(old) | set(new))
+                if old.get(action) != new.get(action)
+            }
+            if changes:
+                report[self.composite_ids[row]] = changes
+        return report
+
+
+def load_facet_violation_map(traits: list[dict[str, Any]]) -> dict[str, dict[str, float]]:
+    facet_violation_map: dict[str, dict[str, float]] = {}
+    for facet in traits:
+        if not str(facet.get("id", "")).startswith("f_"):
+            continue
+        violation = facet.get("effects", {}).get("stress_modifiers", {}).get("violation_stress")
+        if isinstance(violation, dict):
+            facet_violation_map[facet["id"]] = {k: float(v) for k, v in violation.items()}
+    return facet_violation_map
+
+
+def parse_diff_edits(items: list[str], base: dict[str, dict[str, float]]) -> dict[str, dict[str, float]]:
+    """["f_sincere:lie=12", ...] -> edited copies of the touched facet maps (value 0 removes)."""
+    edited: dict[str, dict[str, float]] = {}
+    for item in items:
+        facet_id, _sep, assignment = item.partition(":")
+        action, _eq, value = assignment.partition("=")
+        try:
+            number = float(value)
+        except ValueError:
+            number = None
+        if not facet_id or not action or number is None:
+            raise ValueError(f"bad --diff {item!r}; expected <facet>:<action>=<value>")
+        facet = edited.setdefault(facet_id, dict(base.get(facet_id, {})))
+        if number == 0.0:
+            facet.pop(action, None)
+        else:
+            facet[action] = number
+    return edited
+
+
+def run_diff(
+    composites: list[dict[str, Any]],
+    facet_violation_map: dict[str, dict[str, float]],
+    edited_map: dict[str, dict[str, float]],
+) -> None:
+    matrices = ViolationMatrices(composites, facet_violation_map)
+    report = matrices.diff(edited_map)
+    edited = sum(1 for f, v in edited_map.items() if v != facet_violation_map.get(f, {}))
+    print(
+        f"[DERIVE] Diff: {edited} edited facets -> "
+        f"{len(report)} of {len(composites)} derivable composites change"
+    )
+    for comp_id, changes in report.items():
+        parts = ", ".join(f"{action}: {old} -> {new}" for action, (old, new) in changes.items())
+        print(f"  {comp_id}: {parts}")
+
+
 def main() -> None:
-    with SOURCE_PATH.open("r", encoding="utf-8") as fp:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--source", default=SOURCE_PATH.as_posix(), help="trait definitions to derive from")
+    parser.add_argument("--output", default=OUTPUT_PATH.as_posix(), help="derived trait definitions")
+    parser.add_argument(
+        "--diff",
+        action="append",
+        default=[],
+        help="report composites changed by <facet>:<action>=<value> (repeatable); writes nothing",
+    )
+    parser.add_argument(
+        "--diff-source",
+        default="",
+        help="report composites changed by the facet violation_stress of an edited source; writes nothing",
+    )
+    args = parser.parse_args()
+    source_path = Path(args.source)
+    output_path = Path(args.output)
+
+    with source_path.open("r", encoding="utf-8") as fp:
         traits: list[dict[str, Any]] = json.load(fp)
 
     facets = [t for t in traits if str(t.get("id", "")).startswith("f_")]
     composites = [t for t in traits if str(t.get("id", "")).startswith("c_")]
     dark_traits = [t for t in traits if str(t.get("id", "")).startswith("d_")]
-
-    facet_violation_map: dict[str, dict[str, float]] = {}
-    for facet in facets:
-        violation = facet.get("effects", {}).get("stress_modifiers", {}).get("violation_stress")
-        if isinstance(violation, dict):
-            facet_violation_map[facet["id"]] = {k: float(v) for k, v in violation.items()}
+    facet_violation_map = load_facet_violation_map(traits)
+
+    if args.diff or args.diff_source:
+        derivable = [c for c in composites if not has_violation_stress(c)]
+        if args.diff_source:
+            with Path(args.diff_source).open("r", encoding="utf-8") as fp:
+                edited_map = load_facet_violation_map(json.load(fp))
+            edited_map.update({f: {} for f in facet_violation_map if f not in edited_map})
+        else:
+            edited_map = {}
+        try:
+            edited_map.update(parse_diff_edits(args.diff, facet_violation_map))
+            run_diff(derivable, facet_violation_map, edited_map)
+        except ValueError as exc:
+            parser.error(str(exc))
+        return
 
     output_traits = deepcopy(traits)
 
     derived_count = 0
-    skipped_already_set = 0
     skipped_dark_tetrad = len(dark_traits)
     sample_derived: list[tuple[str, dict[str, float]]] = []
 
-    for trait in output_traits:
-        trait_id = str(trait.get("id", ""))
-        if not trait_id.startswith("c_"):
-            continue
-
-        if has_violation_stress(trait):
-            skipped_already_set += 1
-            continue
-
-        derived = derive_violation_stress(trait, facet_violation_map)
-
+    targets = [
+        trait
+        for trait in output_traits
+        if str(trait.get("id", "")).startswith("c_") and not has_violation_stress(trait)
+    ]
+    skipped_already_set = len(composites) - len(targets)
+    matrices = ViolationMatrices(targets, facet_violation_map)
+    for trait, derived in zip(targets, matrices.derive_all()):
         effects = trait.setdefault("effects", {})
         stress_modifiers = effects.setdefault("stress_modifiers", {})
         stress_modifiers["violation_stress"] = derived
 
         derived_count += 1
         if len(sample_derived) < 2:
-            sample_derived.append((trait_id, derived))
+            sample_derived.append((str(trait.get("id", "")), derived))
 
-    with OUTPUT_PATH.open("w", encoding="utf-8") as fp:
+    with output_path.open("w", encoding="utf-8") as fp:
         json.dump(output_traits, fp, ensure_ascii=False, indent=2)
         fp.write("\n")
 
@@ -240,7 +465,7 @@ def main() -> None:
             print(f"  {trait_id}: {json.dumps(values, ensure_ascii=False, sort_keys=True)}")
     else:
         print("  (none)")
-    print(f"[DERIVE] Saved to {OUTPUT_PATH.as_posix()}")
+    print(f"[DERIVE] Saved to {output_path.as_posix()}")
     print(
         "[DERIVE] All derived values in range [0, 30]: "
         f"{'YES' if all_values_in_range else 'NO'}"
@@ -2,9 +2,10 @@
 """
 find_unused_files.py — 미참조 파일 탐지 (삭제하지 않음, 후보 목록만 출력)
 """
-import json
 from pathlib import Path
 
+from localization_model import LocalizationModel
+
 ROOT = Path(__file__).parent.parent
 
 
@@ -33,11 +34,13 @@ def find_unused_data_jsons(src: str) -> list[Path]:
     return unused
 
 
-def find_unused_locale_keys(src: str) -> list[tuple[str, str]]:
+def find_unused_locale_keys(src: str, model: LocalizationModel | None = None) -> list[tuple[str, str]]:
+    # 공유 LocalizationModel: compile/audit과 같은 프로세스에서 쓰면 JSON 재파싱 없음
+    model = model or LocalizationModel(ROOT)
     orphans = []
     for f in (ROOT / "localization").rglob("*.json"):
         try:
-            data = json.loads(f.read_text())
+            data = model.load_json(f)
         except Exception:
             continue
         for key in data:
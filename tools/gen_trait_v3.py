@@ -1621,7 +1621,8 @@ L = {
 # ═══════════════════════════════════════════════════════════════
 #  OUTPUT GENERATION
 # ═══════════════════════════════════════════════════════════════
-def main():
+def build_traits() -> tuple[list, int]:
+    """All v3 trait dicts with EFFECTS merged in, and how many got effects."""
     all_traits = (ARCHETYPE_SINGLE + ARCHETYPE_DUAL + ARCHETYPE_TRIPLE
                   + ARCHETYPE_VALUE + SHADOW + RADIANCE + CORPUS + NOUS
                   + AWAKENED + BLOODLINE + MASTERY + BOND + FATE
@@ -1633,6 +1634,11 @@ def main():
         if t["id"] in EFFECTS:
             t["effects"] = EFFECTS[t["id"]]
             efx_count += 1
+    return all_traits, efx_count
+
+
+def main():
+    all_traits, efx_count = build_traits()
     if efx_count:
         print(f"Merged effects for {efx_count}/{len(all_traits)} traits")
 
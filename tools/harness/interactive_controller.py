@@ -18,16 +18,54 @@ Scenario step parsing rules (explicit > implicit):
 - Numbered steps containing "personality tab" OR "temperament tab" call
   `click_tab` on the detail panel directly (tab index 3).
 
+Scenarios are grouped into sessions by `## Session <name>` headings
+(scenarios before the first heading form the "main" session). A session's
+scenarios run in order over one connection and share its selection history,
+so "Click a different agent" is relative to earlier scenarios of the same
+session only. Sessions are spread round-robin over the `--endpoint`
+host:port list (default: --host/--port) and each endpoint's sessions run on
+their own asyncio worker, so independent sessions on separate Godot
+instances run concurrently. Sessions sharing an endpoint stay sequential —
+selection is global UI state inside one Godot instance. TCI deltas pair
+samples within a session only; with several sessions the top-level
+`cross_scenario_tci_delta` is the largest single-session delta.
+
+Command queries that do not depend on each other's replies are pipelined:
+several newline-delimited commands go out in one `sendall` and the replies,
+which the server writes strictly in order, are matched back by position.
+With `--batch` they are wrapped in one `{"action": "batch", "commands": [...]}`
+envelope instead (reply `{"results": [...]}`); a server that does not know
+`batch` makes the controller fall back to pipelining. `--no-pipeline` restores
+one round trip per command for servers that only read one line per poll.
+Replies are read through one buffered ResponseReader per socket, which keeps
+bytes past the current newline for the next reply (`--recv-size` bytes per
+`recv`).
+
+Snapshot queries ask the server to filter: `get_agents` / `get_buildings`
+carry `rect` (screen px), `margin` (world px, scaled by the camera zoom on
+the server) and a `fields` projection, so only what the click picker can use
+crosses the wire. Servers that ignore these return the full lists, which the
+picker handles unchanged (logged as unfiltered).
+
+Click retries within one step share a tick-stamped SnapshotCache: a retry
+asks only for get_state and reuses the previous snapshot while the server
+tick is within `--snapshot-staleness-ticks` of it, otherwise it refetches
+just the agents (`since_tick` delta where the server supports it). Every
+reuse / refetch decision is written to the step log.
+
 **Any numbered step that does not match a known pattern causes the scenario
 to FAIL.** Silent skipping hides broken scenarios (past regression).
 """
 
 import argparse
+import asyncio
 import json
 import os
 import re
 import socket
 import sys
+import time
+import weakref
 
 # Stable mapping from panel title to tab index (matches v5 _build_tab_bar()).
 TAB_INDEX_OVERVIEW = 0
@@ -35,38 +73,157 @@ TAB_INDEX_NEEDS = 1
 TAB_INDEX_EMOTION = 2
 TAB_INDEX_PERSONALITY = 3
 
-# Shared across scenarios so Scenario 3 can pick a different agent than Scenario 1.
-_selection_history: list = []
-# Parallel to _selection_history: world position of each selected agent at
-# time of click, used for spatial isolation checks in later scenarios.
-_selection_positions: list = []
+DEFAULT_SESSION = "main"
+
+TILE_PX = 16.0
+# renderer.gd `best_dist = 3.0` tiles: a click snaps to any agent this close.
+CLICK_RADIUS_PX = 48.0
+# Separation from previously-selected agents: 5 world-tiles @ 16 px/tile;
+# > 3-tile click radius.
+ISOLATION_PIXELS = 80.0
+
+# Field projections for filtered snapshot queries: everything the pickers read.
+AGENT_FIELDS = ["id", "screen_x", "screen_y", "world_x", "world_y"]
+BUILDING_FIELDS = ["id", "tile_x", "tile_y", "width", "height"]
+# A building within 2 padded tiles of the agent's tile steals the click, so
+# footprints up to 3 tiles beyond the rect still matter.
+BUILDING_MARGIN_PX = 3 * TILE_PX
+# `_empty_space_click_coords` keeps 4 tiles from agents, 1 tile from buildings.
+EMPTY_SPACE_AGENT_MARGIN_PX = 4 * TILE_PX
+EMPTY_SPACE_BUILDING_MARGIN_PX = 2 * TILE_PX
+# Ticks a cached snapshot may lag the server before a click retry refetches
+# agents; one retry waits 2 frames.
+DEFAULT_SNAPSHOT_STALENESS_TICKS = 2
+
+# Wire protocol switches, set from the command line in main().
+_protocol = {"pipeline": True, "batch": False, "recv_size": 65536}
+
+
+class ResponseReader:
+    """Buffered newline-delimited reply reader bound to one socket.
+
+    `recv_into` fills a reusable chunk that is appended to a growing
+    bytearray, so a multi-megabyte `get_agents` reply is copied once rather
+    than re-concatenated per chunk. Bytes after the returned line (the next
+    pipelined reply) stay buffered for the next call.
+    """
+
+    def __init__(self, sock: socket.socket, recv_size: int = 65536):
+        self.sock = sock
+        self.recv_size = max(int(recv_size), 1)
+        self._chunk = memoryview(bytearray(self.recv_size))
+        self._buf = bytearray()
+        # Everything before this offset is known to contain no newline.
+        self._scanned = 0
+
+    def read_line(self) -> bytearray:
+        while True:
+            newline = self._buf.find(b"\n", self._scanned)
+            if newline >= 0:
+                line = self._buf[:newline]
+                del self._buf[: newline + 1]
+                self._scanned = 0
+                return line
+            self._scanned = len(self._buf)
+            received = self.sock.recv_into(self._chunk)
+            if not received:
+                raise ConnectionError("Server disconnected")
+            self._buf += self._chunk[:received]
+
+    def read_response(self) -> dict:
+        return json.loads(self.read_line())
+
+
+_readers: "weakref.WeakKeyDictionary[socket.socket, ResponseReader]" = weakref.WeakKeyDictionary()
+
+
+def _reader_for(sock: socket.socket) -> ResponseReader:
+    reader = _readers.get(sock)
+    if reader is None:
+        reader = _readers[sock] = ResponseReader(sock, _protocol["recv_size"])
+    return reader
 
 
 def send_command(sock: socket.socket, cmd: dict) -> dict:
     """Send a JSON command and receive the response (newline-delimited)."""
     msg = json.dumps(cmd) + "\n"
     sock.sendall(msg.encode("utf-8"))
-    buf = b""
-    while b"\n" not in buf:
-        chunk = sock.recv(8192)
-        if not chunk:
-            raise ConnectionError("Server disconnected")
-        buf += chunk
-    line = buf.split(b"\n")[0]
-    return json.loads(line.decode("utf-8"))
+    return _reader_for(sock).read_response()
+
+
+def _send_pipelined(sock: socket.socket, cmds: list) -> list:
+    """Write every command in one `sendall`, then read one reply line per
+    command. The server answers in order, so reply i belongs to cmds[i]."""
+    payload = "".join(json.dumps(cmd) + "\n" for cmd in cmds)
+    sock.sendall(payload.encode("utf-8"))
+    reader = _reader_for(sock)
+    return [reader.read_response() for _ in cmds]
+
+
+def send_batch(sock: socket.socket, cmds: list) -> list | None:
+    """Send cmds inside one `batch` envelope. Returns the per-command results,
+    or None when the server does not support the envelope."""
+    resp = send_command(sock, {"action": "batch", "commands": cmds})
+    results = resp.get("results") if isinstance(resp, dict) else None
+    if isinstance(results, list) and len(results) == len(cmds):
+        return results
+    return None
+
+
+def send_commands(sock: socket.socket, cmds: list) -> list:
+    """Send independent commands with as few round trips as the protocol
+    switches allow and return their responses in command order."""
+    if not cmds:
+        return []
+    if _protocol["batch"]:
+        results = send_batch(sock, cmds)
+        if results is not None:
+            return results
+        # Older server: remember and use plain pipelining from now on.
+        _protocol["batch"] = False
+    if not _protocol["pipeline"] or len(cmds) == 1:
+        return [send_command(sock, cmd) for cmd in cmds]
+    return _send_pipelined(sock, cmds)
+
+
+class HarnessSession:
+    """Cross-scenario state of one session: the scenarios that run in order
+    over one connection.
+
+    Shared across the session's scenarios so Scenario 3 can pick a different
+    agent than Scenario 1, and so the TCI delta compares their samples.
+    """
+
+    def __init__(self, name: str = DEFAULT_SESSION):
+        self.name = name
+        self.selection_history: list = []
+        # Parallel to selection_history: world position of each selected
+        # agent at time of click, used for spatial isolation checks in later
+        # scenarios.
+        self.selection_positions: list = []
+        self.results: list = []
+        # Last viewport reported by get_state; sizes filtered snapshot queries.
+        self.viewport_size: tuple | None = None
+        self.snapshot_staleness_ticks = DEFAULT_SNAPSHOT_STALENESS_TICKS
+
+    def tci_delta(self) -> dict:
+        return _compute_cross_scenario_tci_delta(self.results)
 
 
 def parse_scenarios(text: str) -> list:
     """Parse interactive scenarios from markdown format."""
     scenarios = []
     current = None
+    session = DEFAULT_SESSION
 
     for line in text.split("\n"):
-        if line.startswith("### Scenario"):
+        if line.startswith("## Session"):
+            session = line[len("## Session"):].strip(" :") or DEFAULT_SESSION
+        elif line.startswith("### Scenario"):
             if current:
                 scenarios.append(current)
             name = line.replace("### ", "").strip()
-            current = {"name": name, "steps": [], "expected": ""}
+            current = {"name": name, "steps": [], "expected": "", "session": session}
         elif current is not None and line.startswith("Expected:"):
             current["expected"] = line.replace("Expected:", "").strip()
         elif current is not None and re.match(r"^\d+\.", line.strip()):
@@ -151,6 +308,16 @@ def _empty_space_click_coords(
     return (vp[0] * 0.12, vp[1] * 0.30)
 
 
+def _building_covers(b: dict, tx: int, ty: int, pad_tiles: int) -> bool:
+    bx = int(b.get("tile_x", 0))
+    by = int(b.get("tile_y", 0))
+    bw = int(b.get("width", 1))
+    bh = int(b.get("height", 1))
+    return (bx - pad_tiles) <= tx <= (bx + bw + pad_tiles - 1) and (
+        by - pad_tiles
+    ) <= ty <= (by + bh + pad_tiles - 1)
+
+
 def _near_building(wx: float, wy: float, buildings: list, pad_tiles: int = 2) -> bool:
     """Return True if (wx, wy) is within ``pad_tiles`` of any building footprint.
 
@@ -166,23 +333,133 @@ def _near_building(wx: float, wy: float, buildings: list, pad_tiles: int = 2) ->
     tx = int(wx // 16)
     ty = int(wy // 16)
     for b in buildings:
-        bx = int(b.get("tile_x", 0))
-        by = int(b.get("tile_y", 0))
-        bw = int(b.get("width", 1))
-        bh = int(b.get("height", 1))
-        if (bx - pad_tiles) <= tx <= (bx + bw + pad_tiles - 1) and (
-            by - pad_tiles
-        ) <= ty <= (by + bh + pad_tiles - 1):
+        if _building_covers(b, tx, ty, pad_tiles):
             return True
     return False
 
 
+class _UniformGrid:
+    """Uniform hash grid over world-pixel space: cell (i, j) holds the items
+    whose point or rectangle touches [i*cell, (i+1)*cell) x [j*cell, (j+1)*cell)."""
+
+    def __init__(self, cell: float):
+        self.cell = cell
+        self.cells: dict = {}
+
+    def insert_point(self, x: float, y: float, item) -> None:
+        key = (int(x // self.cell), int(y // self.cell))
+        self.cells.setdefault(key, []).append(item)
+
+    def insert_rect(self, x0: float, y0: float, x1: float, y1: float, item) -> None:
+        """Insert over the half-open rectangle [x0, x1) x [y0, y1)."""
+        for i in range(int(x0 // self.cell), int((x1 - 1e-9) // self.cell) + 1):
+            for j in range(int(y0 // self.cell), int((y1 - 1e-9) // self.cell) + 1):
+                self.cells.setdefault((i, j), []).append(item)
+
+    def at(self, x: float, y: float) -> list:
+        return self.cells.get((int(x // self.cell), int(y // self.cell)), [])
+
+    def near(self, x: float, y: float, radius: float):
+        """Items in every cell that overlaps the square of half-side radius."""
+        cells = self.cells
+        for i in range(int((x - radius) // self.cell), int((x + radius) // self.cell) + 1):
+            for j in range(int((y - radius) // self.cell), int((y + radius) // self.cell) + 1):
+                yield from cells.get((i, j), ())
+
+
+def _point_grid(points: list) -> _UniformGrid:
+    grid = _UniformGrid(CLICK_RADIUS_PX)
+    for p in points:
+        wx = float(p.get("world_x", 0.0))
+        wy = float(p.get("world_y", 0.0))
+        grid.insert_point(wx, wy, (wx, wy, int(p.get("id", -1))))
+    return grid
+
+
+def _any_within(grid: _UniformGrid, wx: float, wy: float, radius: float, skip_id=None) -> bool:
+    radius_sq = radius * radius
+    for (owx, owy, oid) in grid.near(wx, wy, radius):
+        if oid == skip_id:
+            continue
+        if (wx - owx) ** 2 + (wy - owy) ** 2 < radius_sq:
+            return True
+    return False
+
+
+def _click_region(vp_size: tuple) -> tuple:
+    """(x_min, x_max, y_min, y_max) screen bounds an agent must fall inside to
+    be clicked. Margins keep us off the HUD sidebar and bottom bar."""
+    return (40.0, vp_size[0] * 0.70, 40.0, vp_size[1] - 80.0)
+
+
+def _click_rect(vp_size: tuple) -> tuple:
+    """The click region as a filter rect [x0, y0, x1, y1]."""
+    x_min, x_max, y_min, y_max = _click_region(vp_size)
+    return (x_min, y_min, x_max, y_max)
+
+
+def _viewport_rect(vp_size: tuple) -> tuple:
+    return (0.0, 0.0, float(vp_size[0]), float(vp_size[1]))
+
+
+class _SnapshotIndex:
+    """Hash grids (cell = click radius) over one get_agents/get_buildings
+    snapshot, so isolation and building-adjacency checks only visit the
+    neighbouring cells instead of every agent / building.
+
+    Only candidates inside the click region are ever isolation-tested, so the
+    agent grid holds just the agents within one click radius of those
+    candidates' world bounding box.
+    """
+
+    def __init__(self, agents: list, buildings: list, vp_size: tuple, pad_tiles: int = 2):
+        x_min, x_max, y_min, y_max = _click_region(vp_size)
+        on_screen = [
+            a for a in agents
+            if x_min <= float(a.get("screen_x", -1)) <= x_max
+            and y_min <= float(a.get("screen_y", -1)) <= y_max
+        ]
+        nearby = []
+        if on_screen:
+            wxs = [float(a.get("world_x", 0.0)) for a in on_screen]
+            wys = [float(a.get("world_y", 0.0)) for a in on_screen]
+            lo_x, hi_x = min(wxs) - CLICK_RADIUS_PX, max(wxs) + CLICK_RADIUS_PX
+            lo_y, hi_y = min(wys) - CLICK_RADIUS_PX, max(wys) + CLICK_RADIUS_PX
+            nearby = [
+                a for a in agents
+                if lo_x <= float(a.get("world_x", 0.0)) <= hi_x
+                and lo_y <= float(a.get("world_y", 0.0)) <= hi_y
+            ]
+        self.agents = _point_grid(nearby)
+        self.pad_tiles = pad_tiles
+        self.buildings = _UniformGrid(CLICK_RADIUS_PX)
+        for b in buildings:
+            bx = int(b.get("tile_x", 0))
+            by = int(b.get("tile_y", 0))
+            bw = int(b.get("width", 1))
+            bh = int(b.get("height", 1))
+            self.buildings.insert_rect(
+                (bx - pad_tiles) * TILE_PX,
+                (by - pad_tiles) * TILE_PX,
+                (bx + bw + pad_tiles) * TILE_PX,
+                (by + bh + pad_tiles) * TILE_PX,
+                b,
+            )
+
+    def near_building(self, wx: float, wy: float) -> bool:
+        """Same answer as `_near_building` over the indexed buildings."""
+        tx = int(wx // 16)
+        ty = int(wy // 16)
+        return any(_building_covers(b, tx, ty, self.pad_tiles) for b in self.buildings.at(wx, wy))
+
+
 def _choose_agent_near_center(
     agents: list,
     vp_size: tuple,
     avoid_ids: set,
     avoid_agents: list = None,
     buildings: list = None,
+    index: _SnapshotIndex = None,
 ) -> dict | None:
     """Pick the alive agent whose screen coords are closest to viewport center,
     skipping any id in `avoid_ids` and any agent rendered outside the viewport.
@@ -204,22 +481,18 @@ def _choose_agent_near_center(
     checks a 3x3 tile region for a building BEFORE checking entities, so a
     nearby building will steal the selection. This mirrors the prior
     regression where clicking agent#18's pixel selected a building instead.
+
+    All spatial checks go through `index` (built from this snapshot's
+    `agents` and `buildings` when not supplied); candidates are still visited
+    in list order with a strict `<`, so ties go to the earliest agent.
     """
     cx, cy = vp_size[0] / 2.0, vp_size[1] / 2.0
     # Allow some margin so we don't pick an agent under the HUD sidebar.
-    x_min, x_max = 40.0, vp_size[0] * 0.70
-    y_min, y_max = 40.0, vp_size[1] - 80.0
-    ISOLATION_PIXELS = 80.0  # 5 world-tiles @ 16 px/tile; > 3-tile click radius
-    ISOLATION_PIXELS_SQ = ISOLATION_PIXELS * ISOLATION_PIXELS
-    avoid_agents = avoid_agents or []
+    x_min, x_max, y_min, y_max = _click_region(vp_size)
     buildings = buildings or []
-
-    # Build a fast lookup of (world_x, world_y) for every alive candidate so
-    # we can enforce candidate-vs-candidate isolation too.
-    all_positions = [
-        (float(a.get("world_x", 0.0)), float(a.get("world_y", 0.0)), int(a.get("id", -1)))
-        for a in agents
-    ]
+    if index is None:
+        index = _SnapshotIndex(agents, buildings, vp_size)
+    avoid_grid = _point_grid(avoid_agents or [])
 
     best = None
     best_dist = float("inf")
@@ -235,35 +508,18 @@ def _choose_agent_near_center(
         wy = float(a.get("world_y", 0.0))
         # Reject agents adjacent to a building — the click would land on the
         # building instead (see _near_building doc).
-        if _near_building(wx, wy, buildings):
+        if buildings and index.near_building(wx, wy):
             continue
         # Isolate from previously-clicked agents (defeats ID-mismatch-but-
         # cluster-overlap failure: clicking near agent X could snap onto
         # agent Y = the prior selection because it happens to be closer in
         # world space).
-        too_close_to_avoided = False
-        for avoid in avoid_agents:
-            awx = float(avoid.get("world_x", 0.0))
-            awy = float(avoid.get("world_y", 0.0))
-            dsq = (wx - awx) ** 2 + (wy - awy) ** 2
-            if dsq < ISOLATION_PIXELS_SQ:
-                too_close_to_avoided = True
-                break
-        if too_close_to_avoided:
+        if _any_within(avoid_grid, wx, wy, ISOLATION_PIXELS):
             continue
         # Candidate-vs-candidate isolation: the click must unambiguously
         # resolve to this agent, so no OTHER alive candidate may sit within
         # one click-radius (~3 tiles = 48 px).
-        conflicts = 0
-        for (owx, owy, oid) in all_positions:
-            if oid == aid:
-                continue
-            dsq = (wx - owx) ** 2 + (wy - owy) ** 2
-            if dsq < (48.0 * 48.0):
-                conflicts += 1
-                if conflicts > 0:
-                    break
-        if conflicts > 0:
+        if _any_within(index.agents, wx, wy, CLICK_RADIUS_PX, skip_id=aid):
             continue
         d = (sx - cx) ** 2 + (sy - cy) ** 2
         if d < best_dist:
@@ -278,16 +534,18 @@ def _choose_agent_near_center_loose(
     avoid_ids: set,
     avoid_agents: list,
     buildings: list = None,
+    index: _SnapshotIndex = None,
 ) -> dict | None:
     """Relaxed variant of `_choose_agent_near_center`: enforces the
     avoided-agent spatial separation AND building avoidance but drops the
     candidate-vs-candidate isolation check. Used as a fall-back when every
     candidate has a nearby neighbour (common at high population densities)."""
     cx, cy = vp_size[0] / 2.0, vp_size[1] / 2.0
-    x_min, x_max = 40.0, vp_size[0] * 0.70
-    y_min, y_max = 40.0, vp_size[1] - 80.0
-    ISOLATION_PIXELS_SQ = 80.0 * 80.0
+    x_min, x_max, y_min, y_max = _click_region(vp_size)
     buildings = buildings or []
+    if index is None:
+        index = _SnapshotIndex([], buildings, vp_size)
+    avoid_grid = _point_grid(avoid_agents or [])
 
     best = None
     best_dist = float("inf")
@@ -301,17 +559,9 @@ def _choose_agent_near_center_loose(
             continue
         wx = float(a.get("world_x", 0.0))
         wy = float(a.get("world_y", 0.0))
-        if _near_building(wx, wy, buildings):
+        if buildings and index.near_building(wx, wy):
             continue
-        too_close_to_avoided = False
-        for avoid in avoid_agents:
-            awx = float(avoid.get("world_x", 0.0))
-            awy = float(avoid.get("world_y", 0.0))
-            dsq = (wx - awx) ** 2 + (wy - awy) ** 2
-            if dsq < ISOLATION_PIXELS_SQ:
-                too_close_to_avoided = True
-                break
-        if too_close_to_avoided:
+        if _any_within(avoid_grid, wx, wy, ISOLATION_PIXELS):
             continue
         d = (sx - cx) ** 2 + (sy - cy) ** 2
         if d < best_dist:
@@ -331,15 +581,18 @@ def _pick_target(
     buildings: list,
     must_be_different: bool,
     result: dict,
+    session: HarnessSession,
 ) -> dict | None:
     """Cascade through the three filter tightness levels and return the
-    best candidate, or None if no agent satisfies any tier."""
+    best candidate, or None if no agent satisfies any tier. The snapshot's
+    spatial index is built once and shared by every tier."""
+    index = _SnapshotIndex(agents, buildings, vp_size)
     target = _choose_agent_near_center(
-        agents, vp_size, avoid_ids, avoid_positions, buildings
+        agents, vp_size, avoid_ids, avoid_positions, buildings, index
     )
-    if target is None and not must_be_different and _selection_history:
+    if target is None and not must_be_different and session.selection_history:
         # Second attempt: allow re-selecting an already-selected agent.
-        target = _choose_agent_near_center(agents, vp_size, set(), [], buildings)
+        target = _choose_agent_near_center(agents, vp_size, set(), [], buildings, index)
     if target is None and must_be_different:
         # Second fall-back attempt: drop the candidate-vs-candidate isolation
         # requirement while keeping the ID + avoided-agent spatial check.
@@ -347,7 +600,7 @@ def _pick_target(
             "retry: relaxing candidate-vs-candidate isolation check"
         )
         target = _choose_agent_near_center_loose(
-            agents, vp_size, avoid_ids, avoid_positions, buildings
+            agents, vp_size, avoid_ids, avoid_positions, buildings, index
         )
     if target is None and must_be_different:
         # Third fall-back: also drop the building-adjacency filter.
@@ -355,7 +608,7 @@ def _pick_target(
             "retry: dropping building-adjacency filter (may produce click-steal)"
         )
         target = _choose_agent_near_center_loose(
-            agents, vp_size, avoid_ids, avoid_positions, []
+            agents, vp_size, avoid_ids, avoid_positions, [], index
         )
     return target
 
@@ -366,26 +619,28 @@ def _click_and_read_selection(
     """Issue the click command for the given target, wait briefly, and
     return the HUD's `get_selected_entity` response.  Both events are
     appended to `result["steps_log"]` for evidence traceability."""
-    click_resp = send_command(
+    # The Godot side now invokes `_handle_click` synchronously from the
+    # `click` command handler, so the selection is already settled by the
+    # time it replies. We keep a tiny wait for backwards compatibility with
+    # older Godot builds that fall back to the push_input path. The three
+    # commands are processed in order, so they can share one round trip.
+    click_resp, _wait_resp, sel = send_commands(
         sock,
-        {
-            "action": "click",
-            "x": float(target["screen_x"]),
-            "y": float(target["screen_y"]),
-        },
+        [
+            {
+                "action": "click",
+                "x": float(target["screen_x"]),
+                "y": float(target["screen_y"]),
+            },
+            {"action": "wait_frames", "count": 2},
+            {"action": "get_selected_entity"},
+        ],
     )
     result["steps_log"].append(
         f"click target=agent#{target['id']} at ({target['screen_x']:.1f},"
         f" {target['screen_y']:.1f}) world=({target['world_x']:.1f},"
         f" {target['world_y']:.1f}) resp={click_resp}"
     )
-    # The Godot side now invokes `_handle_click` synchronously from the
-    # `click` command handler, so the selection is already settled by the
-    # time this call returns. We keep a tiny wait for backwards
-    # compatibility with older Godot builds that fall back to the
-    # push_input path.
-    send_command(sock, {"action": "wait_frames", "count": 2})
-    sel = send_command(sock, {"action": "get_selected_entity"})
     result["steps_log"].append(
         f"after-click selection: entity_id={sel.get('entity_id')}"
         f" building_id={sel.get('selected_building_id', -1)}"
@@ -399,49 +654,196 @@ def _click_and_read_selection(
     return sel
 
 
+def _snapshot_queries(rect, agent_margin: float, building_margin: float) -> list:
+    """`get_agents` + `get_buildings` commands, filtered to screen `rect`
+    (grown by the world-px margins) and projected to the picker's fields.
+    With no rect yet (viewport unknown) both queries are unfiltered."""
+    if rect is None:
+        return [{"action": "get_agents"}, {"action": "get_buildings"}]
+    return [
+        {"action": "get_agents", "rect": list(rect), "margin": agent_margin, "fields": AGENT_FIELDS},
+        {"action": "get_buildings", "rect": list(rect), "margin": building_margin, "fields": BUILDING_FIELDS},
+    ]
+
+
+def _filter_note(cmds: list, agents: list) -> str:
+    """Describe whether the server applied the snapshot filter: a server that
+    ignores it sends back fields outside the projection."""
+    if "fields" not in cmds[0]:
+        return "unfiltered"
+    if any(set(a) - set(AGENT_FIELDS) for a in agents[:1]):
+        return "unfiltered (server ignored rect/fields)"
+    return "filtered"
+
+
+def _query_snapshot(
+    sock: socket.socket, session: HarnessSession, rect_of, agent_margin: float, building_margin: float
+) -> tuple:
+    """Pipeline get_state with filtered agent/building queries.
+
+    `rect_of(vp_size)` gives the screen rect to keep (`_click_rect`,
+    `_viewport_rect`). A session's first query is unfiltered because the
+    viewport is not known yet; later ones use the last known viewport, and
+    if get_state reports a different one (resized window) the snapshot is
+    refetched for the right rect. Returns (state, agents_resp,
+    buildings_resp, note)."""
+    vp_known = session.viewport_size
+    queries = _snapshot_queries(
+        rect_of(vp_known) if vp_known else None, agent_margin, building_margin
+    )
+    state, a_resp, b_resp = send_commands(sock, [{"action": "get_state"}] + queries)
+    vp_size = tuple(state.get("viewport_size", [1152, 648]))
+    session.viewport_size = vp_size
+    if vp_known is not None and vp_known != vp_size:
+        queries = _snapshot_queries(rect_of(vp_size), agent_margin, building_margin)
+        a_resp, b_resp = send_commands(sock, queries)
+    agents = a_resp.get("agents", []) if isinstance(a_resp, dict) else []
+    note = _filter_note(queries, agents if isinstance(agents, list) else [])
+    return state, a_resp, b_resp, note
+
+
+def _view_key(state: dict) -> tuple:
+    """What screen coordinates depend on: a change invalidates every agent."""
+    return (
+        tuple(state.get("viewport_size", [1152, 648])),
+        tuple(state.get("camera_pos", [])),
+        state.get("camera_zoom"),
+    )
+
+
+def _merge_agent_delta(agents: list, changed: list, removed: list) -> list:
+    """Apply a `since_tick` delta: changed agents replace their entry in
+    place (keeping list order, which decides pick ties), new ids are
+    appended and removed ids dropped."""
+    updates = {int(a.get("id", -1)): a for a in changed}
+    gone = {int(aid) for aid in removed}
+    merged = []
+    for a in agents:
+        aid = int(a.get("id", -1))
+        if aid in gone:
+            continue
+        merged.append(updates.pop(aid, a))
+    merged.extend(updates.values())
+    return merged
+
+
+class SnapshotCache:
+    """Tick-stamped get_state / get_agents / get_buildings snapshot shared by
+    the click retries of one step.
+
+    The first fetch pipelines all three queries. A retry asks for get_state
+    only and then, logging the decision to `log`:
+      - refetches everything if the view (viewport, camera, zoom) moved, the
+        server reports no tick, or the budget is negative (cache disabled);
+      - reuses the snapshot if the tick is within the session's staleness
+        budget;
+      - otherwise refetches only agents, as a `since_tick` delta merged into
+        the cached list when the server supports it (it echoes
+        `since_tick`), else as a full list. Buildings are kept.
+    """
+
+    def __init__(self, session: HarnessSession, rect_of, agent_margin: float, building_margin: float):
+        self.session = session
+        self.rect_of = rect_of
+        self.agent_margin = agent_margin
+        self.building_margin = building_margin
+        self.state: dict | None = None
+        self.agents: list = []
+        self.b_resp = None
+        self.note = ""
+
+    def _full(self, sock: socket.socket, log: list, why: str) -> None:
+        state, a_resp, self.b_resp, self.note = _query_snapshot(
+            sock, self.session, self.rect_of, self.agent_margin, self.building_margin
+        )
+        self.state = state
+        self.agents = a_resp.get("agents", []) if isinstance(a_resp, dict) else []
+        log.append(f"snapshot: fetched tick={state.get('tick')} ({why})")
+
+    def get(self, sock: socket.socket, log: list) -> tuple:
+        """(state, agents, buildings_resp, filter_note) for this attempt."""
+        if self.state is None or self.session.snapshot_staleness_ticks < 0:
+            self._full(sock, log, "first attempt" if self.state is None else "cache disabled")
+            return self.state, self.agents, self.b_resp, self.note
+        state = send_command(sock, {"action": "get_state"})
+        tick, cached_tick = state.get("tick"), self.state.get("tick")
+        if _view_key(state) != _view_key(self.state):
+            self._full(sock, log, "view changed")
+        elif tick is None or cached_tick is None:
+            self._full(sock, log, "server reports no tick")
+        elif int(tick) - int(cached_tick) <= self.session.snapshot_staleness_ticks:
+            log.append(
+                f"snapshot: reused tick={cached_tick} (server tick={tick},"
+                f" budget={self.session.snapshot_staleness_ticks})"
+            )
+        else:
+            query = dict(
+                _snapshot_queries(
+                    self.rect_of(self.session.viewport_size), self.agent_margin, self.building_margin
+                )[0],
+                since_tick=cached_tick,
+            )
+            a_resp = send_command(sock, query)
+            a_resp = a_resp if isinstance(a_resp, dict) else {}
+            changed = a_resp.get("agents", [])
+            if a_resp.get("since_tick") == cached_tick:
+                removed = a_resp.get("removed", [])
+                self.agents = _merge_agent_delta(self.agents, changed, removed)
+                log.append(
+                    f"snapshot: refetched agent delta tick={cached_tick}->{tick}"
+                    f" (+{len(changed)} changed, -{len(removed)} removed)"
+                )
+            else:
+                self.agents = changed
+                log.append(
+                    f"snapshot: refetched agents tick={cached_tick}->{tick}"
+                    f" (server sent full list of {len(changed)})"
+                )
+            self.state = state
+        return state, self.agents, self.b_resp, self.note
+
+
 def _perform_agent_click(
-    sock: socket.socket, result: dict, must_be_different: bool
+    sock: socket.socket, result: dict, must_be_different: bool, session: HarnessSession
 ) -> dict | None:
     """Query alive agents, pick a target, click its pixel, and record the
     resulting selection.  Returns the target agent dict or None on failure.
 
     If `must_be_different` is True, the target must differ from any id already
-    in `_selection_history`; otherwise any valid agent near center is fine.
+    in the session's selection history; otherwise any valid agent near center
+    is fine.
 
     The routine retries up to `MAX_ATTEMPTS` times when a click lands on no
     entity (possible under heavy renderer load) or selects an entity that
     violates the distinct-id constraint. Each retry widens the `avoid_ids`
-    set so we don't repeatedly click the same failing candidate.
+    set so we don't repeatedly click the same failing candidate. Retries
+    reuse the step's SnapshotCache instead of re-querying everything.
     """
     MAX_ATTEMPTS = 4
 
     tried_target_ids: set[int] = set()
+    snapshots = SnapshotCache(session, _click_rect, CLICK_RADIUS_PX, BUILDING_MARGIN_PX)
 
     for attempt in range(1, MAX_ATTEMPTS + 1):
-        state = send_command(sock, {"action": "get_state"})
+        state, agents, b_resp, note = snapshots.get(sock, result["steps_log"])
         vp_size = tuple(state.get("viewport_size", [1152, 648]))
-        agents_resp = send_command(sock, {"action": "get_agents"})
-        agents = agents_resp.get("agents", [])
         buildings: list = []
-        try:
-            b_resp = send_command(sock, {"action": "get_buildings"})
-            if isinstance(b_resp, dict):
-                b_list = b_resp.get("buildings", [])
-                if isinstance(b_list, list):
-                    buildings = b_list
-        except Exception as exc:
+        b_list = b_resp.get("buildings") if isinstance(b_resp, dict) else None
+        if isinstance(b_list, list):
+            buildings = b_list
+        else:
             # Graceful degrade on older servers that lack `get_buildings`.
             result["steps_log"].append(
-                f"get_buildings unavailable ({exc}); continuing without building filter"
+                f"get_buildings unavailable ({b_resp}); continuing without building filter"
             )
         result["steps_log"].append(
             f"attempt {attempt}: queried {len(agents)} alive agents,"
-            f" {len(buildings)} buildings (vp={vp_size})"
+            f" {len(buildings)} buildings (vp={vp_size}, {note})"
         )
         avoid_ids: set[int] = set(tried_target_ids)
         if must_be_different:
-            avoid_ids |= set(_selection_history)
-        avoid_positions = list(_selection_positions) if must_be_different else []
+            avoid_ids |= set(session.selection_history)
+        avoid_positions = list(session.selection_positions) if must_be_different else []
         target = _pick_target(
             agents,
             vp_size,
@@ -450,6 +852,7 @@ def _perform_agent_click(
             buildings,
             must_be_different,
             result,
+            session,
         )
         if target is None:
             result["result"] = "FAIL"
@@ -469,7 +872,7 @@ def _perform_agent_click(
 
         # Successful selection path — record evidence and return.
         panel_visible = bool(sel.get("panel_visible", False))
-        distinct_ok = (not must_be_different) or (sel_id not in _selection_history)
+        distinct_ok = (not must_be_different) or (sel_id not in session.selection_history)
         if sel_id >= 0 and panel_visible and distinct_ok:
             result.setdefault("tci_samples", []).append(
                 {
@@ -484,8 +887,8 @@ def _perform_agent_click(
                     "panel_visible": sel.get("panel_visible"),
                 }
             )
-            _selection_history.append(sel_id)
-            _selection_positions.append(
+            session.selection_history.append(sel_id)
+            session.selection_positions.append(
                 {
                     "world_x": float(target.get("world_x", 0.0)),
                     "world_y": float(target.get("world_y", 0.0)),
@@ -506,10 +909,10 @@ def _perform_agent_click(
                 f"click at agent#{target['id']} pixel did not select any"
                 f" entity{stolen_by}"
             )
-        elif must_be_different and sel_id in _selection_history:
+        elif must_be_different and sel_id in session.selection_history:
             reason = (
                 f"selection {sel_id} equals a previously-selected agent"
-                f" (history={_selection_history})"
+                f" (history={session.selection_history})"
             )
         elif not panel_visible:
             reason = f"entity {sel_id} selected but detail panel not visible"
@@ -541,10 +944,13 @@ def _perform_agent_click(
     return None
 
 
-def execute_step(sock: socket.socket, step: str, result: dict) -> None:
+def execute_step(
+    sock: socket.socket, step: str, result: dict, session: HarnessSession | None = None
+) -> None:
     """Execute a single numbered step.  Raises RuntimeError on unrecognized
     steps so the scenario fails rather than silently skipping."""
     step_lower = step.lower()
+    session = session or HarnessSession()
 
     # --- Zoom commands -----------------------------------------------------
     zoom_match = re.search(r"(?:set\s+)?zoom\s+(?:to\s+)?z(\d+)", step_lower)
@@ -609,31 +1015,36 @@ def execute_step(sock: socket.socket, step: str, result: dict) -> None:
         # "Click empty space" — close any detail panel.
         if ("empty space" in step_lower or "empty area" in step_lower
                 or "close panel" in step_lower):
-            state = send_command(sock, {"action": "get_state"})
             # Fetch alive agents + building footprints so the empty-space
             # pick avoids landing on either.  A click on a building leaves
             # `_selected_building_id >= 0` which keeps the detail panel open
             # with stale agent data — exactly the regression we hunt here.
-            try:
-                a_resp = send_command(sock, {"action": "get_agents"})
-                agents = a_resp.get("agents", []) if isinstance(a_resp, dict) else []
-            except Exception:
+            state, a_resp, b_resp, _note = _query_snapshot(
+                sock,
+                session,
+                _viewport_rect,
+                EMPTY_SPACE_AGENT_MARGIN_PX,
+                EMPTY_SPACE_BUILDING_MARGIN_PX,
+            )
+            agents = a_resp.get("agents", []) if isinstance(a_resp, dict) else []
+            buildings = b_resp.get("buildings", []) if isinstance(b_resp, dict) else []
+            if not isinstance(agents, list):
                 agents = []
-            try:
-                b_resp = send_command(sock, {"action": "get_buildings"})
-                buildings = (
-                    b_resp.get("buildings", []) if isinstance(b_resp, dict) else []
-                )
-            except Exception:
+            if not isinstance(buildings, list):
                 buildings = []
             x, y = _empty_space_click_coords(state, agents=agents, buildings=buildings)
-            resp = send_command(sock, {"action": "click", "x": x, "y": y})
+            # Log selection afterward to confirm deselect.
+            resp, _wait_resp, sel = send_commands(
+                sock,
+                [
+                    {"action": "click", "x": x, "y": y},
+                    {"action": "wait_frames", "count": 2},
+                    {"action": "get_selected_entity"},
+                ],
+            )
             result["steps_log"].append(
                 f"click empty-space ({x:.1f}, {y:.1f}): {resp}"
             )
-            # Log selection afterward to confirm deselect.
-            send_command(sock, {"action": "wait_frames", "count": 2})
-            sel = send_command(sock, {"action": "get_selected_entity"})
             result["steps_log"].append(
                 f"after empty click: entity_id={sel.get('entity_id')}"
                 f" building_id={sel.get('selected_building_id', -1)}"
@@ -644,12 +1055,12 @@ def execute_step(sock: socket.socket, step: str, result: dict) -> None:
 
         # "Click a different agent" — explicit diff-selection path.
         if "different" in step_lower:
-            _perform_agent_click(sock, result, must_be_different=True)
+            _perform_agent_click(sock, result, must_be_different=True, session=session)
             return
 
         # "Click on an agent" / generic agent click.
         if "agent" in step_lower:
-            _perform_agent_click(sock, result, must_be_different=False)
+            _perform_agent_click(sock, result, must_be_different=False, session=session)
             return
 
         # Plain "click" with no context → fail loudly.
@@ -678,11 +1089,14 @@ def execute_step(sock: socket.socket, step: str, result: dict) -> None:
     raise RuntimeError(f"unrecognized step: {step!r}")
 
 
-def execute_scenario(sock: socket.socket, scenario: dict) -> dict:
+def execute_scenario(
+    sock: socket.socket, scenario: dict, session: HarnessSession | None = None
+) -> dict:
     """Execute a single test scenario and return results.
 
     Unrecognized steps cause the scenario to fail (this used to be a silent
     skip — see prior harness bug where Scenario 1 steps were ignored)."""
+    session = session or HarnessSession()
     name = scenario["name"]
     result = {
         "name": name,
@@ -694,7 +1108,7 @@ def execute_scenario(sock: socket.socket, scenario: dict) -> dict:
 
     for step in scenario["steps"]:
         try:
-            execute_step(sock, step, result)
+            execute_step(sock, step, result, session)
         except RuntimeError as exc:
             result["result"] = "FAIL"
             result["detail"] = str(exc)
@@ -792,13 +1206,124 @@ def _compute_cross_scenario_tci_delta(all_results: list) -> dict:
     }
 
 
+def session_tci_delta(plan: list) -> dict:
+    """Top-level TCI delta for a multi-session run.
+
+    Sessions may run on different Godot instances, so samples are never
+    paired across sessions: this is the delta of the single session with the
+    largest one, tagged with that session's name.
+    """
+    best = None
+    for session, _scenarios in plan:
+        delta = dict(session.tci_delta(), session=session.name)
+        if best is None or (delta["available"], delta["max_axis_delta_pp"]) > (
+            best["available"],
+            best["max_axis_delta_pp"],
+        ):
+            best = delta
+    return best
+
+
+def group_sessions(scenarios: list) -> list:
+    """[(HarnessSession, scenarios)] in order of each session's first scenario."""
+    groups: dict = {}
+    for scenario in scenarios:
+        name = scenario.get("session", DEFAULT_SESSION)
+        if name not in groups:
+            groups[name] = (HarnessSession(name), [])
+        groups[name][1].append(scenario)
+    return list(groups.values())
+
+
+def run_session(
+    sock: socket.socket, session: HarnessSession, scenarios: list, label: str = ""
+) -> HarnessSession:
+    """Execute a session's scenarios in order, appending to session.results.
+    Each scenario's log is printed as one block so concurrent sessions do not
+    interleave mid-scenario."""
+    for scenario in scenarios:
+        try:
+            result = execute_scenario(sock, scenario, session)
+        except Exception as e:
+            result = {
+                "name": scenario["name"],
+                "steps_log": [f"ERROR: {e}"],
+                "result": "FAIL",
+                "detail": str(e),
+                "tci_samples": [],
+            }
+        session.results.append(result)
+        lines = [
+            f"\n--- {label}Executed: {scenario['name']} ---",
+            f"Result: {result['result']} ({result.get('detail', '')})",
+        ]
+        lines += [f"  {log_line}" for log_line in result["steps_log"]]
+        print("\n".join(lines))
+    return session
+
+
+def _run_lane(sock: socket.socket, lane: list, labelled: bool) -> None:
+    for session, scenarios in lane:
+        run_session(sock, session, scenarios, f"[{session.name}] " if labelled else "")
+
+
+async def run_lanes(socks: list, lanes: list, labelled: bool = False) -> None:
+    """Run each endpoint's lane of sessions on its own worker, concurrently.
+    Step execution stays blocking socket code; asyncio only schedules the
+    lanes, so wall time tracks the slowest lane instead of the sum."""
+    await asyncio.gather(
+        *(asyncio.to_thread(_run_lane, sock, lane, labelled) for sock, lane in zip(socks, lanes))
+    )
+
+
+def _parse_endpoint(text: str) -> tuple:
+    host, _sep, port = text.rpartition(":")
+    if not host or not port.isdigit():
+        raise argparse.ArgumentTypeError(f"expected host:port, got {text!r}")
+    return (host, int(port))
+
+
 def main():
     parser = argparse.ArgumentParser(description="WorldSim interactive test controller")
     parser.add_argument("--host", default="127.0.0.1")
     parser.add_argument("--port", type=int, default=9223)
     parser.add_argument("--evidence-dir", required=True)
     parser.add_argument("--scenarios", required=True, help="Path to scenarios markdown file")
+    parser.add_argument(
+        "--endpoint",
+        action="append",
+        type=_parse_endpoint,
+        default=[],
+        help="host:port of a Godot command server (repeatable); sessions are"
+        " spread round-robin and run concurrently across endpoints",
+    )
+    parser.add_argument(
+        "--no-pipeline",
+        action="store_true",
+        help="one round trip per command (servers that read one line per poll)",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="bundle independent commands in a `batch` envelope (falls back to pipelining)",
+    )
+    parser.add_argument(
+        "--snapshot-staleness-ticks",
+        type=int,
+        default=DEFAULT_SNAPSHOT_STALENESS_TICKS,
+        help="click retries reuse the agent snapshot while it lags the server by at most"
+        " this many ticks (negative: refetch everything on every retry)",
+    )
+    parser.add_argument(
+        "--recv-size",
+        type=int,
+        default=65536,
+        help="bytes requested per socket read when receiving replies",
+    )
     args = parser.parse_args()
+    _protocol["pipeline"] = not args.no_pipeline
+    _protocol["batch"] = args.batch
+    _protocol["recv_size"] = args.recv_size
 
     # Read and parse scenarios
     with open(args.scenarios) as f:
@@ -809,51 +1334,56 @@ def main():
         print("No scenarios found in input file")
         sys.exit(1)
 
-    print(f"Parsed {len(scenarios)} scenario(s)")
-
-    # Connect to Godot command server
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    sock.settimeout(20.0)
-    try:
-        sock.connect((args.host, args.port))
-    except ConnectionRefusedError:
-        print(f"ERROR: Could not connect to {args.host}:{args.port}")
-        sys.exit(1)
-    print(f"Connected to {args.host}:{args.port}")
+    plan = group_sessions(scenarios)
+    for session, _scenarios in plan:
+        session.snapshot_staleness_ticks = args.snapshot_staleness_ticks
+    endpoints = args.endpoint or [(args.host, args.port)]
+    print(f"Parsed {len(scenarios)} scenario(s) in {len(plan)} session(s)")
+
+    # One lane (connection) per endpoint; a lane runs its sessions in order.
+    lanes = [lane for lane in (plan[i::len(endpoints)] for i in range(len(endpoints))) if lane]
+    socks = []
+    for host, port in endpoints[: len(lanes)]:
+        # Connect to Godot command server
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.settimeout(20.0)
+        try:
+            sock.connect((host, port))
+        except ConnectionRefusedError:
+            print(f"ERROR: Could not connect to {host}:{port}")
+            sys.exit(1)
+        print(f"Connected to {host}:{port}")
 
-    # Get initial state
-    state = send_command(sock, {"action": "get_state"})
-    print(f"Initial state: {state}")
+        # Get initial state
+        state = send_command(sock, {"action": "get_state"})
+        print(f"Initial state: {state}")
+        socks.append(sock)
 
     # Execute scenarios
-    all_results = []
-    overall_pass = True
-    for scenario in scenarios:
-        print(f"\n--- Executing: {scenario['name']} ---")
-        try:
-            result = execute_scenario(sock, scenario)
-        except Exception as e:
-            result = {
-                "name": scenario["name"],
-                "steps_log": [f"ERROR: {e}"],
-                "result": "FAIL",
-                "detail": str(e),
-                "tci_samples": [],
-            }
-        all_results.append(result)
-        if result["result"] != "PASS":
-            overall_pass = False
-        print(f"Result: {result['result']} ({result.get('detail', '')})")
-        for log_line in result["steps_log"]:
-            print(f"  {log_line}")
+    started = time.perf_counter()
+    asyncio.run(run_lanes(socks, lanes, labelled=len(plan) > 1))
+    elapsed_s = time.perf_counter() - started
 
-    cross = _compute_cross_scenario_tci_delta(all_results)
+    all_results = []
+    for session, _scenarios in plan:
+        for r in session.results:
+            if len(plan) > 1:
+                r["session"] = session.name
+            all_results.append(r)
+    overall_pass = all(r["result"] == "PASS" for r in all_results)
+
+    if len(plan) > 1:
+        cross = session_tci_delta(plan)
+    else:
+        cross = _compute_cross_scenario_tci_delta(all_results)
 
     # Write human-readable results
     output_path = os.path.join(args.evidence_dir, "interactive_results.txt")
     with open(output_path, "w") as f:
         for r in all_results:
             f.write(f"SCENARIO: {r['name']}\n")
+            if "session" in r:
+                f.write(f"SESSION: {r['session']}\n")
             f.write(f"RESULT: {r['result']}\n")
             f.write(f"DETAIL: {r.get('detail', '')}\n")
             f.write("STEPS:\n")
@@ -870,29 +1400,37 @@ def main():
 
     # Also write a structured JSON summary for programmatic consumers
     json_path = os.path.join(args.evidence_dir, "interactive_results.json")
-    with open(json_path, "w") as f:
-        json.dump(
+    summary = {
+        "scenarios": all_results,
+        "cross_scenario_tci_delta": cross,
+        "overall_pass": overall_pass,
+    }
+    if len(plan) > 1:
+        summary["sessions"] = [
             {
-                "scenarios": all_results,
-                "cross_scenario_tci_delta": cross,
-                "overall_pass": overall_pass,
-            },
-            f,
-            indent=2,
-        )
+                "name": session.name,
+                "scenarios": [r["name"] for r in session.results],
+                "cross_scenario_tci_delta": session.tci_delta(),
+            }
+            for session, _scenarios in plan
+        ]
+    with open(json_path, "w") as f:
+        json.dump(summary, f, indent=2)
 
     print(f"\nResults written to: {output_path}")
     print(f"JSON summary: {json_path}")
     print(f"Cross-scenario max TCI delta: {cross.get('max_axis_delta_pp', 0.0):.2f}pp"
           f" (threshold 10.0pp, met={cross.get('threshold_met', False)})")
+    print(f"Wall time: {elapsed_s:.2f}s over {len(lanes)} endpoint(s)")
     print(f"OVERALL: {'PASS' if overall_pass else 'FAIL'}")
 
     # Tell Godot to quit
-    try:
-        send_command(sock, {"action": "quit"})
-    except Exception:
-        pass
-    sock.close()
+    for sock in socks:
+        try:
+            send_command(sock, {"action": "quit"})
+        except Exception:
+            pass
+        sock.close()
 
     if not overall_pass:
         sys.exit(2)
@@ -19,39 +19,18 @@ grep -rohE 'Locale\.ltr\("[A-Z_0-9]+"\)' "$PROJECT_ROOT/scripts" 2>/dev/null \
     | sed -E 's/Locale\.ltr\("([A-Z_0-9]+)"\)/\1/' \
     | sort -u > "$OUT_DIR/used_keys.txt"
 
-# 2. Extract keys from fluent source (primary — compiler uses these)
-for locale in ko en; do
-    cat "$LOCALE_DIR/fluent/$locale"/*.ftl 2>/dev/null \
-        | grep -E '^[A-Z_][A-Z_0-9]+ =' \
-        | sed -E 's/ =.*//' \
-        | sort -u > "$OUT_DIR/fluent_${locale}_keys.txt"
+# 2-5. Fluent, JSON, registry and compiled key lists in one pass: the shared
+# LocalizationModel parses each source file once (tools/localization_model.py).
+python3 "$PROJECT_ROOT/tools/localization_model.py" \
+    --project-root "$PROJECT_ROOT" --locales ko,en --dump-keys "$OUT_DIR/raw" > /dev/null
+
+# Same key shape and sort(1) collation the comm(1) comparisons below expect.
+for name in fluent_ko_keys fluent_en_keys json_ko_keys json_en_keys; do
+    grep -E '^[A-Z_][A-Z_0-9]+$' "$OUT_DIR/raw/$name.txt" \
+        | sort -u > "$OUT_DIR/$name.txt"
 done
-
-# 3. Extract keys from JSON source (secondary — may drift from fluent)
-for locale in ko en; do
-    find "$LOCALE_DIR/$locale" -name "*.json" -exec cat {} + 2>/dev/null \
-        | grep -oE '"[A-Z_][A-Z_0-9]+"[[:space:]]*:' \
-        | sed -E 's/"([^"]+)".*/\1/' \
-        | sort -u > "$OUT_DIR/json_${locale}_keys.txt"
-done
-
-# 4. Extract keys from key_registry.json
-python3 -c "
-import json
-with open('$LOCALE_DIR/key_registry.json') as f:
-    data = json.load(f)
-for k in sorted(data.get('key_to_id', {}).keys()):
-    print(k)
-" > "$OUT_DIR/registry_keys.txt" 2>/dev/null
-
-# 5. Extract keys from compiled JSON
-python3 -c "
-import json
-with open('$LOCALE_DIR/compiled/ko.json') as f:
-    data = json.load(f)
-for k in sorted(data.get('strings', {}).keys()):
-    print(k)
-" > "$OUT_DIR/compiled_keys.txt" 2>/dev/null
+sort -u "$OUT_DIR/raw/registry_keys.txt" > "$OUT_DIR/registry_keys.txt"
+sort -u "$OUT_DIR/raw/compiled_keys.txt" > "$OUT_DIR/compiled_keys.txt"
 
 # Union of fluent ko+en as the canonical source
 sort -u "$OUT_DIR/fluent_ko_keys.txt" "$OUT_DIR/fluent_en_keys.txt" > "$OUT_DIR/fluent_all_keys.txt"
@@ -0,0 +1,470 @@
+#!/usr/bin/env python3
+"""Local stand-in for Godot's TCP command server (port 9223) for harness
+benchmarks and tests.
+
+Speaks the same newline-delimited JSON protocol as the game for the commands
+interactive_controller.py issues: get_state, get_agents, get_buildings,
+click, wait_frames, wait_ticks, get_selected_entity, zoom, screenshot,
+click_tab, quit, plus the `batch` envelope (disable with batch=False to mimic
+older builds, which answer it with an unknown-action error). get_agents /
+get_buildings honour the `rect` / `margin` / `fields` filter unless the
+world's honour_filters is False (older builds ignore it). get_agents with
+`since_tick` answers with only the agents changed since then (echoing
+`since_tick`) unless supports_delta is False. `drift` agents move per tick
+and the next `dropped_clicks` clicks select nothing, to exercise retries.
+
+Godot polls its socket once per frame, so every read is delayed by
+`frame_ms` before all complete lines received so far are answered in one
+write. That makes round trips, not command count, the dominant cost — the
+thing pipelining and batching remove.
+
+Usage:
+  python3 tools/harness/stub_command_server.py --agents 400 --frame-ms 16
+  python3 tools/harness/stub_command_server.py --bench snapshot --agents 10000
+  python3 tools/harness/stub_command_server.py --bench sessions --sessions 3
+  python3 tools/harness/stub_command_server.py --bench filter --agents 10000
+  python3 tools/harness/stub_command_server.py --bench retries --agents 10000
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import socket
+import sys
+import threading
+import time
+
+TILE_PX = 16.0
+CLICK_RADIUS_PX = 48.0
+
+
+class StubWorld:
+    """Synthetic world state: agents on a jittered grid plus a few buildings."""
+
+    def __init__(self, agent_count: int = 200, building_count: int = 12, seed: int = 0):
+        rng = random.Random(seed)
+        self.viewport = [1152, 648]
+        self.camera = [2048.0, 2048.0]
+        self.zoom = 1.0
+        self.tick = 0
+        self.selected = -1
+        self.honour_filters = True
+        self.supports_delta = True
+        self.drift = 0
+        self.dropped_clicks = 0
+        self._rng = rng
+        # Agent id -> tick of its last move, for since_tick deltas.
+        self.changed: dict = {}
+        side = max(1, math.ceil(math.sqrt(agent_count)))
+        spacing = 56.0
+        origin = 2048.0 - side * spacing / 2.0
+        self.agents = []
+        for i in range(agent_count):
+            self.agents.append(
+                {
+                    "id": i,
+                    "world_x": origin + (i % side) * spacing + rng.uniform(-8.0, 8.0),
+                    "world_y": origin + (i // side) * spacing + rng.uniform(-8.0, 8.0),
+                }
+            )
+        self.buildings = [
+            {
+                "id": i,
+                "tile_x": int(origin // TILE_PX) + rng.randrange(0, max(1, int(side * spacing // TILE_PX))),
+                "tile_y": int(origin // TILE_PX) + rng.randrange(0, max(1, int(side * spacing // TILE_PX))),
+                "width": 2,
+                "height": 2,
+            }
+            for i in range(building_count)
+        ]
+
+    def _screen(self, wx: float, wy: float) -> tuple:
+        return (
+            (wx - self.camera[0]) * self.zoom + self.viewport[0] / 2.0,
+            (wy - self.camera[1]) * self.zoom + self.viewport[1] / 2.0,
+        )
+
+    def _filter_rect(self, cmd: dict) -> tuple | None:
+        """Screen rect grown by `margin` world px, or None if unfiltered."""
+        rect = cmd.get("rect")
+        if not self.honour_filters or not rect:
+            return None
+        pad = float(cmd.get("margin", 0.0)) * self.zoom
+        return (rect[0] - pad, rect[1] - pad, rect[2] + pad, rect[3] + pad)
+
+    @staticmethod
+    def _project(item: dict, fields) -> dict:
+        return {k: item[k] for k in fields if k in item} if fields else item
+
+    def _tci(self, aid: int) -> dict:
+        rng = random.Random(aid)
+        return {f"tci_{axis}": round(rng.random(), 3) for axis in ("ns", "ha", "rd", "p")}
+
+    def handle(self, cmd: dict) -> dict:
+        action = cmd.get("action")
+        if action == "get_state":
+            return {
+                "ok": True,
+                "tick": self.tick,
+                "viewport_size": list(self.viewport),
+                "camera_pos": list(self.camera),
+                "camera_zoom": self.zoom,
+                "agent_count": len(self.agents),
+            }
+        if action == "get_agents":
+            rect = self._filter_rect(cmd)
+            fields = cmd.get("fields") if self.honour_filters else None
+            since = cmd.get("since_tick") if self.supports_delta else None
+            out = []
+            for a in self.agents:
+                if since is not None:
+                    # Deltas ignore the rect so agents that left it are updated too.
+                    if self.changed.get(a["id"], -1) <= since:
+                        continue
+                    sx, sy = self._screen(a["world_x"], a["world_y"])
+                else:
+                    sx, sy = self._screen(a["world_x"], a["world_y"])
+                    if rect and not (rect[0] <= sx <= rect[2] and rect[1] <= sy <= rect[3]):
+                        continue
+                out.append(self._project(dict(a, screen_x=sx, screen_y=sy, alive=True), fields))
+            if since is not None:
+                return {"ok": True, "tick": self.tick, "since_tick": since, "agents": out, "removed": []}
+            return {"ok": True, "agents": out}
+        if action == "get_buildings":
+            rect = self._filter_rect(cmd)
+            fields = cmd.get("fields") if self.honour_filters else None
+            out = []
+            for b in self.buildings:
+                x0, y0 = self._screen(b["tile_x"] * TILE_PX, b["tile_y"] * TILE_PX)
+                x1, y1 = self._screen((b["tile_x"] + b["width"]) * TILE_PX, (b["tile_y"] + b["height"]) * TILE_PX)
+                if rect and (x1 < rect[0] or x0 > rect[2] or y1 < rect[1] or y0 > rect[3]):
+                    continue
+                out.append(self._project(dict(b), fields))
+            return {"ok": True, "buildings": out}
+        if action == "click":
+            x, y = float(cmd.get("x", 0.0)), float(cmd.get("y", 0.0))
+            best, best_d = -1, CLICK_RADIUS_PX * CLICK_RADIUS_PX
+            for a in self.agents:
+                sx, sy = self._screen(a["world_x"], a["world_y"])
+                d = (sx - x) ** 2 + (sy - y) ** 2
+                if d < best_d:
+                    best, best_d = a["id"], d
+            if self.dropped_clicks > 0:
+                self.dropped_clicks -= 1
+                best = -1
+            self.selected = best
+            return {"ok": True}
+        if action in ("wait_frames", "wait_ticks"):
+            for _ in range(int(cmd.get("count", 1))):
+                self.tick += 1
+                for a in self._rng.sample(self.agents, min(self.drift, len(self.agents))):
+                    a["world_x"] += self._rng.uniform(-4.0, 4.0)
+                    a["world_y"] += self._rng.uniform(-4.0, 4.0)
+                    self.changed[a["id"]] = self.tick
+            return {"ok": True}
+        if action == "get_selected_entity":
+            out = {
+                "entity_id": self.selected,
+                "selected_building_id": -1,
+                "selected_settlement_id": -1,
+                "name": f"Agent {self.selected}" if self.selected >= 0 else "",
+                "panel_visible": self.selected >= 0,
+                "temperament_label_key": "TEMPERAMENT_STUB",
+            }
+            out.update(self._tci(self.selected) if self.selected >= 0 else
+                       {"tci_ns": -1.0, "tci_ha": -1.0, "tci_rd": -1.0, "tci_p": -1.0})
+            return out
+        if action == "zoom":
+            self.zoom = float(cmd.get("level", 1.0)) or 1.0
+            return {"ok": True}
+        if action in ("screenshot", "click_tab", "quit"):
+            return {"ok": True}
+        return {"ok": False, "error": f"unknown action: {action}"}
+
+
+class StubCommandServer:
+    """Threaded TCP server answering the command protocol from a StubWorld."""
+
+    def __init__(self, world: StubWorld = None, host: str = "127.0.0.1", port: int = 0,
+                 frame_ms: float = 0.0, batch: bool = True):
+        self.world = world or StubWorld()
+        self.frame_ms = frame_ms
+        self.batch = batch
+        self.lines_handled = 0
+        self.polls = 0
+        # Encoded get_agents reply for an unchanged world, so snapshot
+        # benchmarks time the client's reading rather than the stub's dumps.
+        self._agents_line = (None, "")
+        self._lock = threading.Lock()
+        self._listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._listener.bind((host, port))
+        self._listener.listen()
+        self.host, self.port = self._listener.getsockname()[:2]
+        self._thread = threading.Thread(target=self._accept_loop, daemon=True)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def close(self) -> None:
+        self._listener.close()
+
+    def _answer(self, cmd: dict) -> dict:
+        if cmd.get("action") == "batch" and self.batch:
+            return {"ok": True, "results": [self._answer(c) for c in cmd.get("commands", [])]}
+        with self._lock:
+            self.lines_handled += 1
+            return self.world.handle(cmd)
+
+    def _reply_line(self, cmd: dict) -> str:
+        if cmd.get("action") != "get_agents":
+            return json.dumps(self._answer(cmd)) + "\n"
+        world = self.world
+        key = (world.tick, world.zoom, tuple(world.camera), len(world.agents),
+               world.honour_filters, world.supports_delta,
+               json.dumps([cmd.get("rect"), cmd.get("margin"), cmd.get("fields"),
+                           cmd.get("since_tick")]))
+        if self._agents_line[0] != key:
+            self._agents_line = (key, json.dumps(self._answer(cmd)) + "\n")
+        else:
+            with self._lock:
+                self.lines_handled += 1
+        return self._agents_line[1]
+
+    def _accept_loop(self) -> None:
+        while True:
+            try:
+                conn, _addr = self._listener.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn: socket.socket) -> None:
+        pending = b""
+        with conn:
+            while True:
+                try:
+                    data = conn.recv(65536)
+                except OSError:
+                    return
+                if not data:
+                    return
+                if self.frame_ms:
+                    time.sleep(self.frame_ms / 1000.0)
+                self.polls += 1
+                pending += data
+                *lines, pending = pending.split(b"\n")
+                replies = [self._reply_line(json.loads(line)) for line in lines if line.strip()]
+                if replies:
+                    conn.sendall("".join(replies).encode("utf-8"))
+
+
+BENCH_SCENARIOS = """
+### Scenario 1: first agent
+1. Set zoom to Z3
+2. Click on an agent
+3. Screenshot: "first"
+### Scenario 2: second agent
+1. Click a different agent
+2. Screenshot: "second"
+### Scenario 3: deselect
+1. Click empty space
+2. Click a different agent
+"""
+
+
+def run_plan(port: int, scenarios: list, pipeline: bool, batch: bool) -> tuple:
+    """Run scenarios against the stub with the given protocol switches;
+    returns (elapsed_s, results)."""
+    import interactive_controller as ic
+
+    ic._protocol["pipeline"] = pipeline
+    ic._protocol["batch"] = batch
+    session = ic.HarnessSession()
+    with socket.create_connection(("127.0.0.1", port), timeout=20.0) as sock:
+        started = time.perf_counter()
+        results = [ic.execute_scenario(sock, scenario, session) for scenario in scenarios]
+        return time.perf_counter() - started, results
+
+
+def _legacy_read_response(sock: socket.socket) -> dict:
+    """The pre-ResponseReader receive loop (`buf += chunk`, 8 KiB reads,
+    bytes after the first newline dropped), kept as the benchmark baseline."""
+    buf = b""
+    while b"\n" not in buf:
+        chunk = sock.recv(8192)
+        if not chunk:
+            raise ConnectionError("Server disconnected")
+        buf += chunk
+    return json.loads(buf.split(b"\n")[0].decode("utf-8"))
+
+
+def bench_protocol(args) -> None:
+    import interactive_controller as ic
+
+    scenarios = ic.parse_scenarios(BENCH_SCENARIOS)
+    with StubCommandServer(StubWorld(args.agents), frame_ms=args.frame_ms) as server:
+        for mode, pipeline, batch in (("serial", False, False), ("pipeline", True, False), ("batch", True, True)):
+            best = float("inf")
+            outcome = []
+            polls = server.polls
+            for _ in range(max(args.repeat, 1)):
+                elapsed_s, results = run_plan(server.port, scenarios, pipeline, batch)
+                best = min(best, elapsed_s)
+                outcome = [r["result"] for r in results]
+            print(
+                f"[stub_command_server] mode={mode} agents={args.agents} frame_ms={args.frame_ms:g} "
+                f"best_s={best:.3f} polls_per_plan={(server.polls - polls) / max(args.repeat, 1):.0f} "
+                f"results={outcome}"
+            )
+
+
+def bench_snapshot(args) -> None:
+    """Time `get_agents` round trips: legacy loop vs ResponseReader sizes."""
+    import interactive_controller as ic
+
+    request = (json.dumps({"action": "get_agents"}) + "\n").encode("utf-8")
+    with StubCommandServer(StubWorld(args.agents), frame_ms=0.0) as server:
+        payload = len(json.dumps(server.world.handle({"action": "get_agents"}))) + 1
+        readers = [("legacy", None)] + [(f"reader/{size}", size) for size in args.recv_sizes]
+        for label, size in readers:
+            with socket.create_connection(("127.0.0.1", server.port), timeout=20.0) as sock:
+                reader = ic.ResponseReader(sock, size) if size else None
+                best = float("inf")
+                for _ in range(max(args.repeat, 1)):
+                    started = time.perf_counter()
+                    sock.sendall(request)
+                    resp = reader.read_response() if reader else _legacy_read_response(sock)
+                    best = min(best, time.perf_counter() - started)
+                    assert len(resp["agents"]) == args.agents
+            print(
+                f"[stub_command_server] snapshot reader={label} agents={args.agents} "
+                f"payload_kb={payload / 1024:.0f} best_ms={best * 1000:.1f}"
+            )
+
+
+def bench_sessions(args) -> None:
+    """The benchmark plan repeated as N independent sessions: every session on
+    one stub (sequential lane) vs one stub per session (concurrent lanes)."""
+    import asyncio
+    import contextlib
+    import io
+
+    import interactive_controller as ic
+
+    text = "".join(f"## Session s{i}\n{BENCH_SCENARIOS}" for i in range(args.sessions))
+    for endpoints in (1, args.sessions):
+        servers = [StubCommandServer(StubWorld(args.agents), frame_ms=args.frame_ms) for _ in range(endpoints)]
+        for server in servers:
+            server.start()
+        plan = ic.group_sessions(ic.parse_scenarios(text))
+        lanes = [plan[i::endpoints] for i in range(endpoints)]
+        socks = [socket.create_connection(("127.0.0.1", server.port), timeout=20.0) for server in servers]
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            asyncio.run(ic.run_lanes(socks, lanes, labelled=True))
+        elapsed_s = time.perf_counter() - started
+        for sock, server in zip(socks, servers):
+            sock.close()
+            server.close()
+        outcome = [r["result"] for session, _s in plan for r in session.results]
+        print(
+            f"[stub_command_server] sessions={args.sessions} endpoints={endpoints} "
+            f"frame_ms={args.frame_ms:g} elapsed_s={elapsed_s:.3f} "
+            f"passed={outcome.count('PASS')}/{len(outcome)}"
+        )
+
+
+def bench_filter(args) -> None:
+    """Payload and fetch+parse time of one click attempt's snapshot queries,
+    unfiltered vs rect/fields-filtered, with the pick each one leads to."""
+    import interactive_controller as ic
+
+    world = StubWorld(args.agents, building_count=60)
+    vp = tuple(world.viewport)
+    with StubCommandServer(world) as server:
+        with socket.create_connection(("127.0.0.1", server.port), timeout=20.0) as sock:
+            for label, rect in (("unfiltered", None), ("filtered", ic._click_rect(vp))):
+                queries = ic._snapshot_queries(rect, ic.CLICK_RADIUS_PX, ic.BUILDING_MARGIN_PX)
+                payload = sum(len(json.dumps(world.handle(q))) + 1 for q in queries)
+                best = float("inf")
+                for _ in range(max(args.repeat, 1)):
+                    started = time.perf_counter()
+                    a_resp, b_resp = ic.send_commands(sock, queries)
+                    best = min(best, time.perf_counter() - started)
+                pick = ic._pick_target(
+                    a_resp["agents"], vp, set(), [], b_resp["buildings"], True, {"steps_log": []}, ic.HarnessSession()
+                )
+                print(
+                    f"[stub_command_server] snapshot={label} agents={args.agents} "
+                    f"returned={len(a_resp['agents'])} payload_kb={payload / 1024:.1f} "
+                    f"best_ms={best * 1000:.1f} pick={pick and pick['id']}"
+                )
+
+
+def bench_retries(args) -> None:
+    """One click step whose first clicks are dropped, so it retries: cache
+    disabled vs snapshot reuse vs agent deltas (budget 0 with drifting agents)."""
+    import interactive_controller as ic
+
+    step = "1. Click on an agent"
+    for label, budget, drift in (("no-cache", -1, 0), ("reuse", 2, 0), ("delta", 0, 20)):
+        world = StubWorld(args.agents, building_count=60)
+        world.honour_filters = False
+        world.drift = drift
+        with StubCommandServer(world, frame_ms=args.frame_ms) as server:
+            with socket.create_connection(("127.0.0.1", server.port), timeout=20.0) as sock:
+                session = ic.HarnessSession()
+                session.snapshot_staleness_ticks = budget
+                world.dropped_clicks = 3
+                result = {"steps_log": [], "result": "PASS", "detail": "", "tci_samples": []}
+                started = time.perf_counter()
+                ic.execute_step(sock, step, result, session)
+                elapsed_s = time.perf_counter() - started
+        decisions = [line.split(" (")[0] for line in result["steps_log"] if line.startswith("snapshot:")]
+        print(
+            f"[stub_command_server] retries={label} agents={args.agents} result={result['result']} "
+            f"elapsed_ms={elapsed_s * 1000:.0f} decisions={decisions}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Stub command server benchmark")
+    parser.add_argument("--bench", choices=("protocol", "snapshot", "sessions", "filter", "retries"), default="protocol")
+    parser.add_argument("--agents", type=int, default=400)
+    parser.add_argument("--frame-ms", type=float, default=16.0, help="server poll latency per read")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--sessions", type=int, default=3, help="independent sessions for --bench sessions")
+    parser.add_argument(
+        "--recv-sizes",
+        type=lambda text: [int(v) for v in text.split(",")],
+        default=[8192, 65536, 262144],
+        help="comma-separated ResponseReader receive sizes for --bench snapshot",
+    )
+    args = parser.parse_args()
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    if args.bench == "snapshot":
+        bench_snapshot(args)
+    elif args.bench == "sessions":
+        bench_sessions(args)
+    elif args.bench == "filter":
+        bench_filter(args)
+    elif args.bench == "retries":
+        bench_retries(args)
+    else:
+        bench_protocol(args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,15 +10,24 @@ Tests the three defects identified by the Evaluator in the 8th pipeline run:
 """
 import sys
 import os
+import socket
 
 sys.path.insert(0, os.path.dirname(__file__))
+import interactive_controller  # noqa: E402
 from interactive_controller import (  # noqa: E402
+    ResponseReader,
     _choose_agent_near_center,
     _choose_agent_near_center_loose,
     _empty_space_click_coords,
     _near_building,
+    _pick_target,
     execute_step,
+    group_sessions,
+    parse_scenarios,
+    run_lanes,
+    send_commands,
 )
+from stub_command_server import BENCH_SCENARIOS, StubCommandServer, StubWorld  # noqa: E402
 
 
 def _make_agent(aid, sx, sy, wx=0.0, wy=0.0):
@@ -211,6 +220,248 @@ def test_empty_space_avoids_building_and_agents():
     )
 
 
+def test_pipelined_commands_match_responses_in_order():
+    """Pipelined commands share one sendall and replies come back in order."""
+    with StubCommandServer(StubWorld(agent_count=5)) as server:
+        with socket.create_connection(("127.0.0.1", server.port), timeout=5.0) as sock:
+            state, _wait, agents, state2 = send_commands(
+                sock,
+                [
+                    {"action": "get_state"},
+                    {"action": "wait_ticks", "count": 3},
+                    {"action": "get_agents"},
+                    {"action": "get_state"},
+                ],
+            )
+    assert state["tick"] == 0 and state2["tick"] == 3, (state, state2)
+    assert len(agents["agents"]) == 5
+    assert server.lines_handled == 4
+
+
+def test_stub_agents_cache_keys_on_delta_and_filters():
+    """Same tick and camera, but a since_tick request or a flipped capability
+    flag must not be served the cached full snapshot."""
+    world = StubWorld(agent_count=5)
+    with StubCommandServer(world) as server:
+        with socket.create_connection(("127.0.0.1", server.port), timeout=5.0) as sock:
+            full, delta = send_commands(
+                sock, [{"action": "get_agents"}, {"action": "get_agents", "since_tick": 0}]
+            )
+            world.supports_delta = False
+            (legacy,) = send_commands(sock, [{"action": "get_agents", "since_tick": 0}])
+            filtered = {"action": "get_agents", "fields": ["id"]}
+            (narrow,) = send_commands(sock, [filtered])
+            world.honour_filters = False
+            (ignored,) = send_commands(sock, [filtered])
+    assert "since_tick" not in full and delta["since_tick"] == 0, (full, delta)
+    assert "since_tick" not in legacy and len(legacy["agents"]) == 5, legacy
+    assert set(narrow["agents"][0]) == {"id"}, narrow
+    assert "screen_x" in ignored["agents"][0], ignored
+
+
+def test_batch_envelope_falls_back_to_pipelining():
+    """A server without `batch` support answers unknown-action; the client
+    then switches to plain pipelining for the rest of the run."""
+    saved = dict(interactive_controller._protocol)
+    try:
+        for supports_batch in (True, False):
+            interactive_controller._protocol.update(pipeline=True, batch=True)
+            with StubCommandServer(StubWorld(agent_count=3), batch=supports_batch) as server:
+                with socket.create_connection(("127.0.0.1", server.port), timeout=5.0) as sock:
+                    replies = send_commands(sock, [{"action": "get_state"}, {"action": "get_buildings"}])
+            assert "viewport_size" in replies[0] and "buildings" in replies[1], replies
+            assert interactive_controller._protocol["batch"] is supports_batch
+    finally:
+        interactive_controller._protocol.update(saved)
+
+
+def test_response_reader_keeps_leftover_bytes():
+    """Replies split across tiny reads and sharing one read both decode, in order."""
+    left, right = socket.socketpair()
+    with left, right:
+        reader = ResponseReader(left, recv_size=7)
+        right.sendall(b'{"n": 1}\n{"n": 2, "agents": [1, 2, 3]}\n{"n"')
+        assert reader.read_response() == {"n": 1}
+        assert reader.read_response()["agents"] == [1, 2, 3]
+        right.sendall(b': 3}\n')
+        assert reader.read_response() == {"n": 3}
+        right.close()
+        try:
+            reader.read_response()
+            assert False, "closed peer should raise ConnectionError"
+        except ConnectionError:
+            pass
+
+
+def test_multi_session_tci_delta_never_pairs_across_sessions():
+    """Two sessions (possibly two Godot worlds) with one sample each would meet
+    the threshold if pooled; the top-level delta comes from one session only."""
+    from interactive_controller import HarnessSession, session_tci_delta
+
+    def _sample(eid, value):
+        return {
+            "selected_entity_id": eid,
+            "tci_ns": value, "tci_ha": value, "tci_rd": value, "tci_p": value,
+        }
+
+    lone_a, lone_b, pair = HarnessSession("a"), HarnessSession("b"), HarnessSession("c")
+    lone_a.results = [{"tci_samples": [_sample(1, 0.1)]}]
+    lone_b.results = [{"tci_samples": [_sample(2, 0.9)]}]
+    cross = session_tci_delta([(lone_a, []), (lone_b, [])])
+    assert not cross["available"] and not cross["threshold_met"], cross
+
+    pair.results = [{"tci_samples": [_sample(3, 0.2)]}, {"tci_samples": [_sample(4, 0.35)]}]
+    cross = session_tci_delta([(lone_a, []), (pair, []), (lone_b, [])])
+    assert cross["session"] == "c" and cross["threshold_met"], cross
+    assert {p["entity_id"] for p in cross["pair"]} == {3, 4}, cross
+
+
+def test_sessions_keep_separate_selection_history():
+    """`## Session` groups run on their own lanes; "different agent" is only
+    relative to the same session, so each session's plan passes on its own."""
+    import asyncio
+
+    plan = group_sessions(parse_scenarios(
+        "## Session a\n" + BENCH_SCENARIOS + "\n## Session b\n" + BENCH_SCENARIOS
+    ))
+    assert [session.name for session, _ in plan] == ["a", "b"]
+    with StubCommandServer(StubWorld(agent_count=100)) as one, StubCommandServer(StubWorld(agent_count=100)) as two:
+        socks = [socket.create_connection(("127.0.0.1", srv.port), timeout=5.0) for srv in (one, two)]
+        try:
+            asyncio.run(run_lanes(socks, [[plan[0]], [plan[1]]]))
+        finally:
+            for sock in socks:
+                sock.close()
+    for session, scenarios in plan:
+        assert [r["result"] for r in session.results] == ["PASS"] * len(scenarios), session.results
+        assert len(set(session.selection_history)) == len(session.selection_history) == 3
+        assert session.tci_delta()["available"]
+    # Both worlds are identical, so both sessions pick the same first agent.
+    assert plan[0][0].selection_history[0] == plan[1][0].selection_history[0]
+
+
+def _linear_choose(agents, vp, avoid_ids, avoid_agents, buildings, isolate):
+    """Reference: the all-pairs scan the spatial grid replaced."""
+    best, best_dist = None, float("inf")
+    for a in agents:
+        aid = int(a["id"])
+        sx, sy, wx, wy = a["screen_x"], a["screen_y"], a["world_x"], a["world_y"]
+        if aid < 0 or aid in avoid_ids:
+            continue
+        if not (40.0 <= sx <= vp[0] * 0.70 and 40.0 <= sy <= vp[1] - 80.0):
+            continue
+        if _near_building(wx, wy, buildings):
+            continue
+        if any((wx - v["world_x"]) ** 2 + (wy - v["world_y"]) ** 2 < 80.0 ** 2 for v in avoid_agents):
+            continue
+        if isolate and any(
+            int(o["id"]) != aid and (wx - o["world_x"]) ** 2 + (wy - o["world_y"]) ** 2 < 48.0 ** 2
+            for o in agents
+        ):
+            continue
+        d = (sx - vp[0] / 2.0) ** 2 + (sy - vp[1] / 2.0) ** 2
+        if d < best_dist:
+            best, best_dist = a, d
+    return best
+
+
+def test_grid_picking_matches_linear_scan():
+    """Grid-backed choosers pick exactly what the all-pairs scan picks,
+    including ties (mirrored agents equidistant from center go to the first)."""
+    import random
+
+    from interactive_controller import HarnessSession
+
+    rng = random.Random(7)
+    vp = (1000, 600)
+    for trial in range(40):
+        agents = []
+        for i in range(rng.randrange(5, 120)):
+            sx, sy = rng.randrange(0, 1000, 4), rng.randrange(0, 600, 4)
+            agents.append(_make_agent(i, sx, sy, float(sx) + trial, float(sy)))
+            if rng.random() < 0.2:
+                # Mirror through the center: same distance, later in the list.
+                agents.append(_make_agent(1000 + i, 1000 - sx, 600 - sy, 1000.0 - sx + trial, 600.0 - sy))
+        buildings = [
+            {"tile_x": rng.randrange(0, 60), "tile_y": rng.randrange(0, 36), "width": rng.randrange(1, 4),
+             "height": rng.randrange(1, 4)}
+            for _ in range(rng.randrange(0, 6))
+        ]
+        avoid = [{"world_x": float(rng.randrange(0, 1000)), "world_y": float(rng.randrange(0, 600))}
+                 for _ in range(rng.randrange(0, 3))]
+        avoid_ids = {rng.randrange(0, 10)}
+        got = _choose_agent_near_center(agents, vp, avoid_ids, avoid, buildings)
+        assert got is _linear_choose(agents, vp, avoid_ids, avoid, buildings, True), trial
+        got = _choose_agent_near_center_loose(agents, vp, avoid_ids, avoid, buildings)
+        assert got is _linear_choose(agents, vp, avoid_ids, avoid, buildings, False), trial
+
+        # Full cascade: strict, then loose, then loose without buildings.
+        expected = (_linear_choose(agents, vp, avoid_ids, avoid, buildings, True)
+                    or _linear_choose(agents, vp, avoid_ids, avoid, buildings, False)
+                    or _linear_choose(agents, vp, avoid_ids, avoid, [], False))
+        result = {"steps_log": []}
+        got = _pick_target(agents, vp, avoid_ids, avoid, buildings, True, result, HarnessSession())
+        assert got is expected, trial
+
+
+def test_filtered_snapshots_pick_same_agents():
+    """rect/fields-filtered snapshots lead to the same picks as full ones,
+    and a server that ignores the filter degrades to the unfiltered path."""
+    from interactive_controller import HarnessSession, execute_scenario
+
+    plan = parse_scenarios(
+        "### Scenario 1\n1. Set zoom to Z2\n2. Click on an agent\n3. Click a different agent\n"
+        "### Scenario 2\n1. Set zoom to Z4\n2. Click a different agent\n3. Click empty space\n"
+    )
+    picks = {}
+    logs = {}
+    for honour in (True, False):
+        world = StubWorld(agent_count=1500, building_count=30)
+        world.honour_filters = honour
+        session = HarnessSession()
+        with StubCommandServer(world) as server:
+            with socket.create_connection(("127.0.0.1", server.port), timeout=5.0) as sock:
+                results = [execute_scenario(sock, scenario, session) for scenario in plan]
+        assert [r["result"] for r in results] == ["PASS", "PASS"], results
+        picks[honour] = list(session.selection_history)
+        logs[honour] = [line for r in results for line in r["steps_log"] if line.startswith("attempt")]
+    assert picks[True] == picks[False], picks
+    assert "unfiltered)" in logs[True][0] and "filtered)" in logs[True][1], logs[True]
+    assert all("unfiltered" in line for line in logs[False]), logs[False]
+    assert "server ignored" in logs[False][1], logs[False]
+
+
+def test_click_retries_reuse_or_delta_snapshots():
+    """Dropped clicks force retries: with the cache the retries reuse the
+    snapshot or merge agent deltas, pick what a full refetch would, and log
+    each decision."""
+    from interactive_controller import HarnessSession
+
+    runs = {}
+    for budget, supports_delta in ((-1, True), (0, True), (0, False), (2, True)):
+        world = StubWorld(agent_count=800, building_count=20)
+        world.drift = 50
+        world.dropped_clicks = 2
+        world.supports_delta = supports_delta
+        session = HarnessSession()
+        session.snapshot_staleness_ticks = budget
+        result = {"steps_log": [], "result": "PASS", "detail": "", "tci_samples": []}
+        with StubCommandServer(world) as server:
+            with socket.create_connection(("127.0.0.1", server.port), timeout=5.0) as sock:
+                execute_step(sock, "1. Click on an agent", result, session)
+        assert result["result"] == "PASS", result
+        decisions = [line for line in result["steps_log"] if line.startswith("snapshot:")]
+        runs[(budget, supports_delta)] = (session.selection_history, decisions)
+
+    full_pick, decisions = runs[(-1, True)]
+    assert len(decisions) == 3 and all("fetched" in d for d in decisions), decisions
+    for key in ((0, True), (0, False)):
+        assert runs[key][0] == full_pick, (key, runs[key][0], full_pick)
+    assert all("agent delta tick=" in d for d in runs[(0, True)][1][1:]), runs[(0, True)][1]
+    assert all("full list" in d for d in runs[(0, False)][1][1:]), runs[(0, False)][1]
+    assert "reused tick=0" in runs[(2, True)][1][1], runs[(2, True)][1]
+
+
 if __name__ == "__main__":
     tests = [v for k, v in list(globals().items()) if k.startswith("test_") and callable(v)]
     failed = 0
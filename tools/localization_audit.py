@@ -21,7 +21,10 @@ import sys
 from collections import defaultdict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Set, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Set, Tuple
+
+if TYPE_CHECKING:
+    from localization_model import LocalizationModel
 
 
 INLINE_SUFFIXES: Tuple[str, ...] = ("_en", "_ko", "_kr")
@@ -33,46 +36,6 @@ def _load_json(path: Path) -> Any:
         return json.load(fp)
 
 
-def _collect_top_level_keys(locale_dir: Path) -> Dict[str, Set[str]]:
-    result: Dict[str, Set[str]] = {}
-    for file in sorted(locale_dir.glob("*.json")):
-        data = _load_json(file)
-        if not isinstance(data, dict):
-            continue
-        result[file.name] = set(str(k) for k in data.keys())
-    return result
-
-
-def _collect_top_level_entries(locale_dir: Path) -> Dict[str, Dict[str, Any]]:
-    result: Dict[str, Dict[str, Any]] = {}
-    for file in sorted(locale_dir.glob("*.json")):
-        data = _load_json(file)
-        if not isinstance(data, dict):
-            continue
-        result[file.name] = dict(data)
-    return result
-
-
-def _load_compiled_locale_payload(compiled_file: Path) -> Dict[str, Any]:
-    if not compiled_file.exists():
-        return {}
-    data = _load_json(compiled_file)
-    if not isinstance(data, dict):
-        return {}
-    return data
-
-
-def _collect_compiled_strings(compiled_file: Path) -> Dict[str, str]:
-    payload = _load_compiled_locale_payload(compiled_file)
-    raw_strings = payload.get("strings")
-    if not isinstance(raw_strings, dict):
-        return {}
-    strings: Dict[str, str] = {}
-    for key, value in raw_strings.items():
-        strings[str(key)] = str(value)
-    return strings
-
-
 def _find_duplicates(keys_by_file: Dict[str, Set[str]]) -> Dict[str, List[str]]:
     owners: Dict[str, List[str]] = defaultdict(list)
     for file_name, keyset in keys_by_file.items():
@@ -125,8 +88,11 @@ def _walk_json_paths(obj: Any, path: str = "$") -> Iterable[Tuple[str, Any]]:
             yield from _walk_json_paths(value, next_path)
 
 
-def _find_inline_localized_fields(data_file: Path) -> List[Dict[str, str]]:
-    data = _load_json(data_file)
+def _find_inline_localized_fields(
+    data_file: Path,
+    model: LocalizationModel | None = None,
+) -> List[Dict[str, str]]:
+    data = model.load_json(data_file) if model is not None else _load_json(data_file)
     matches: List[Dict[str, str]] = []
     for json_path, node in _walk_json_paths(data):
         if not isinstance(node, dict):
@@ -143,8 +109,11 @@ def _find_inline_localized_fields(data_file: Path) -> List[Dict[str, str]]:
     return matches
 
 
-def _find_inline_localized_groups(data_file: Path) -> List[Dict[str, Any]]:
-    data = _load_json(data_file)
+def _find_inline_localized_groups(
+    data_file: Path,
+    model: LocalizationModel | None = None,
+) -> List[Dict[str, Any]]:
+    data = model.load_json(data_file) if model is not None else _load_json(data_file)
     groups: List[Dict[str, Any]] = []
     for json_path, node in _walk_json_paths(data):
         if not isinstance(node, dict):
@@ -196,13 +165,27 @@ def _find_inline_localized_groups(data_file: Path) -> List[Dict[str, Any]]:
     return groups
 
 
-def run_audit(project_root: Path) -> Dict[str, Any]:
+def run_audit(
+    project_root: Path,
+    locales: List[str] | None = None,
+    include_data_scan: bool = True,
+    model: LocalizationModel | None = None,
+) -> Dict[str, Any]:
+    """Build the audit report.
+
+    `locales` restricts parity/duplicate checks to those locales (the parity
+    baseline is still loaded); `include_data_scan=False` skips the data/*.json
+    inline-field scan. Both are used by the compile watch loop. `model` shares
+    already-loaded files with the compiler (see localization_verify.py).
+    """
+    if model is None:
+        from localization_model import LocalizationModel
+
+        model = LocalizationModel(project_root)
     generated_at_utc = datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
     localization_root = project_root / "localization"
-    en_dir = localization_root / "en"
-    ko_dir = localization_root / "ko"
     data_dir = project_root / "data"
-    manifest = _load_manifest_dict(project_root)
+    manifest = model.manifest_raw
     supported_locales: List[str] = ["ko", "en"]
     raw_locales = manifest.get("supported_locales")
     if isinstance(raw_locales, list):
@@ -217,23 +200,26 @@ def run_audit(project_root: Path) -> Dict[str, Any]:
     source_format = str(raw_source_format).strip().lower() if str(raw_source_format).strip() else "json"
     compiled_dir_name = str(manifest.get("compiled_dir", "compiled")).strip() or "compiled"
     use_compiled_mode = source_format in FLUENT_SOURCE_FORMATS
-    compiled_root = localization_root / compiled_dir_name
+    audit_locales = [
+        locale for locale in supported_locales if locales is None or locale in locales
+    ]
 
     parity_issues: List[Dict[str, Any]] = []
     if use_compiled_mode:
         compiled_keysets: Dict[str, Set[str]] = {}
+        expected_baseline = "en" if "en" in supported_locales else sorted(supported_locales)[0]
         for locale in supported_locales:
-            compiled_file = compiled_root / f"{locale}.json"
-            if not compiled_file.exists():
-                compiled_keysets[locale] = set()
+            if locale not in audit_locales and locale != expected_baseline:
                 continue
-            compiled_strings = _collect_compiled_strings(compiled_file)
+            compiled_strings = model.compiled_strings(locale)
             compiled_keysets[locale] = set(compiled_strings.keys())
         baseline_locale = "en" if "en" in compiled_keysets else (
             sorted(compiled_keysets.keys())[0] if compiled_keysets else ""
         )
         baseline_set = compiled_keysets.get(baseline_locale, set())
         for locale in sorted(compiled_keysets.keys()):
+            if locale not in audit_locales:
+                continue
             locale_set = compiled_keysets.get(locale, set())
             missing_in_locale = sorted(baseline_set - locale_set)
             extra_in_locale = sorted(locale_set - baseline_set)
@@ -250,8 +236,8 @@ def run_audit(project_root: Path) -> Dict[str, Any]:
                     }
                 )
     else:
-        en_keys = _collect_top_level_keys(en_dir)
-        ko_keys = _collect_top_level_keys(ko_dir)
+        en_keys = model.category_keys("en")
+        ko_keys = model.category_keys("ko")
         all_files = sorted(set(en_keys.keys()) | set(ko_keys.keys()))
         for file_name in all_files:
             en_set = en_keys.get(file_name, set())
@@ -275,16 +261,15 @@ def run_audit(project_root: Path) -> Dict[str, Any]:
 
     duplicate_locale_summary: Dict[str, Dict[str, Any]] = {}
     all_localization_keys: Set[str] = set()
-    for locale in supported_locales:
+    for locale in audit_locales:
         if use_compiled_mode:
-            compiled_file = compiled_root / f"{locale}.json"
-            if not compiled_file.exists():
+            payload = model.compiled_payload(locale)
+            if not payload:
                 continue
-            payload = _load_compiled_locale_payload(compiled_file)
             meta = payload.get("meta")
             if not isinstance(meta, dict):
                 meta = {}
-            strings = _collect_compiled_strings(compiled_file)
+            strings = model.compiled_strings(locale)
             all_localization_keys.update(strings.keys())
             duplicate_locale_summary[locale] = {
                 "duplicate_key_count": _to_int(meta.get("duplicate_key_count", 0)),
@@ -297,11 +282,11 @@ def run_audit(project_root: Path) -> Dict[str, Any]:
         locale_dir = localization_root / locale
         if not locale_dir.exists():
             continue
-        locale_keys = _collect_top_level_keys(locale_dir)
+        locale_keys = model.category_keys(locale)
         for keyset in locale_keys.values():
             all_localization_keys.update(keyset)
         locale_duplicates = _find_duplicates(locale_keys)
-        locale_duplicate_details = _find_duplicate_details(_collect_top_level_entries(locale_dir))
+        locale_duplicate_details = _find_duplicate_details(model.category_entries(locale))
         locale_conflict_count = sum(
             1
             for item in locale_duplicate_details.values()
@@ -347,11 +332,12 @@ def run_audit(project_root: Path) -> Dict[str, Any]:
 
     inline_localized_fields: List[Dict[str, str]] = []
     inline_localized_groups: List[Dict[str, Any]] = []
-    for json_file in sorted(data_dir.rglob("*.json")):
+    data_files = sorted(data_dir.rglob("*.json")) if include_data_scan else []
+    for json_file in data_files:
         if json_file.name.startswith("localization_"):
             continue
-        inline_localized_fields.extend(_find_inline_localized_fields(json_file))
-        inline_localized_groups.extend(_find_inline_localized_groups(json_file))
+        inline_localized_fields.extend(_find_inline_localized_fields(json_file, model))
+        inline_localized_groups.extend(_find_inline_localized_groups(json_file, model))
 
     keyable_groups = [item for item in inline_localized_groups if bool(item.get("keyable_group", False))]
     non_keyable_groups = [
@@ -361,10 +347,10 @@ def run_audit(project_root: Path) -> Dict[str, Any]:
         1 for item in keyable_groups if bool(item.get("has_key_field", False))
     )
     keyable_group_without_key_count = len(keyable_groups) - keyable_group_with_key_count
-    owner_policy_path = _resolve_manifest_key_owner_policy_path(project_root)
+    owner_policy_path = model.key_owners_path
     owner_policy_payload: Any = {}
     if owner_policy_path.exists():
-        owner_policy_payload = _load_json(owner_policy_path)
+        owner_policy_payload = model.load_json(owner_policy_path)
     owner_policy_map = _extract_owner_map(owner_policy_payload)
     duplicate_key_union: Set[str] = set()
     for item in duplicate_locale_summary.values():
@@ -422,25 +408,6 @@ def run_audit(project_root: Path) -> Dict[str, Any]:
     }
 
 
-def _load_manifest_dict(project_root: Path) -> Dict[str, Any]:
-    manifest_path = project_root / "localization" / "manifest.json"
-    if not manifest_path.exists():
-        return {}
-    payload = _load_json(manifest_path)
-    if not isinstance(payload, dict):
-        return {}
-    return payload
-
-
-def _resolve_manifest_key_owner_policy_path(project_root: Path) -> Path:
-    manifest = _load_manifest_dict(project_root)
-    localization_root = project_root / "localization"
-    rel = "key_owners.json"
-    if "key_owners_path" in manifest:
-        rel = str(manifest.get("key_owners_path") or rel)
-    return (localization_root / rel).resolve()
-
-
 def _print_report(report: Dict[str, Any]) -> None:
     print("== Localization Audit ==")
     print(f"source_format: {report.get('localization_source_format', 'json')}")
@@ -570,12 +537,18 @@ def _category_from_file_name(file_name: str) -> str:
     return file_name
 
 
-def _build_key_owner_policy_payload(report: Dict[str, Any]) -> Dict[str, Any]:
+def _build_key_owner_policy_payload(
+    report: Dict[str, Any],
+    model: LocalizationModel | None = None,
+) -> Dict[str, Any]:
     if str(report.get("localization_audit_mode", "")) == "compiled":
         owner_policy_path = Path(str(report.get("owner_policy_path", "")))
         existing_payload: Any = {}
         if owner_policy_path.exists():
-            existing_payload = _load_json(owner_policy_path)
+            if model is not None:
+                existing_payload = model.load_json(owner_policy_path)
+            else:
+                existing_payload = _load_json(owner_policy_path)
         existing_owners = _extract_owner_map(existing_payload)
         return {
             "version": 1,
@@ -734,7 +707,7 @@ def _build_owner_policy_markdown(report: Dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
-def main() -> int:
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser()
     parser.add_argument("--project-root", default=".", help="WorldSim project root")
     parser.add_argument(
@@ -792,12 +765,18 @@ def main() -> int:
         action="store_true",
         help="write generated owner policy to key_owners_path from localization/manifest.json",
     )
-    args = parser.parse_args()
+    return parser
+
 
+def run_cli(args: argparse.Namespace, model: LocalizationModel | None = None) -> int:
     project_root = Path(args.project_root).resolve()
-    report = run_audit(project_root)
+    if model is None:
+        from localization_model import LocalizationModel
+
+        model = LocalizationModel(project_root)
+    report = run_audit(project_root, model=model)
     _print_report(report)
-    owner_policy_payload = _build_key_owner_policy_payload(report)
+    owner_policy_payload = _build_key_owner_policy_payload(report, model)
 
     if args.report_json:
         out = (project_root / args.report_json).resolve()
@@ -825,8 +804,9 @@ def main() -> int:
         out = (project_root / args.owner_policy_markdown).resolve()
         _write_text(out, _build_owner_policy_markdown(report))
     if args.refresh_key_owner_policy_auto:
-        out = _resolve_manifest_key_owner_policy_path(project_root)
+        out = model.key_owners_path
         _write_json(out, owner_policy_payload)
+        model.invalidate(out)
         print(f"[localization_audit] key-owner-policy refreshed: {out}")
 
     owner_policy_mismatch = False
@@ -835,12 +815,12 @@ def main() -> int:
     if args.compare_key_owner_policy:
         compare_path = (project_root / args.compare_key_owner_policy).resolve()
     elif args.compare_key_owner_policy_auto:
-        compare_path = _resolve_manifest_key_owner_policy_path(project_root)
+        compare_path = model.key_owners_path
 
     if compare_path is not None:
         compare_payload: Any = {}
         if compare_path.exists():
-            compare_payload = _load_json(compare_path)
+            compare_payload = model.load_json(compare_path)
         generated_owners = _extract_owner_map(owner_policy_payload)
         existing_owners = _extract_owner_map(compare_payload)
         compare_result = _compare_owner_maps(generated_owners, existing_owners)
@@ -906,5 +886,9 @@ def main() -> int:
     return 0
 
 
+def main() -> int:
+    return run_cli(build_parser().parse_args())
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Binary compiled-locale format (`localization/compiled/<locale>.bin`).
+
+The JSON output of localization_compile.py has to be parsed in full before the
+first lookup. This format lets a loader mmap the file and resolve a key in O(1)
+using the stable integer ids from `key_registry.json` (`key_to_id`).
+
+Layout (all integers little-endian):
+  header       magic b"WSLB", u32 version, u32 key_count,
+               u32 table_offset, u32 pool_offset, u32 pool_size
+  offset table key_count x (u32 offset, u32 length) indexed by key id;
+               offset is relative to pool_offset, MISSING_OFFSET = no string
+  string pool  UTF-8 bytes of every string, concatenated (no separators)
+
+Usage:
+  python3 tools/localization_binary.py localization/compiled/ko.bin ACE_SCORE_LABEL
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import mmap
+import struct
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+MAGIC = b"WSLB"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sIIIII")
+TABLE_ENTRY = struct.Struct("<II")
+MISSING_OFFSET = 0xFFFFFFFF
+
+
+def encode_compiled_locale(strings: Dict[str, str], registry_keys: List[str]) -> bytes:
+    table = bytearray(TABLE_ENTRY.size * len(registry_keys))
+    pool = bytearray()
+    for key_id, key in enumerate(registry_keys):
+        value = strings.get(key)
+        if value is None:
+            TABLE_ENTRY.pack_into(table, key_id * TABLE_ENTRY.size, MISSING_OFFSET, 0)
+            continue
+        encoded = str(value).encode("utf-8")
+        TABLE_ENTRY.pack_into(table, key_id * TABLE_ENTRY.size, len(pool), len(encoded))
+        pool += encoded
+    table_offset = HEADER.size
+    pool_offset = table_offset + len(table)
+    header = HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        len(registry_keys),
+        table_offset,
+        pool_offset,
+        len(pool),
+    )
+    return header + bytes(table) + bytes(pool)
+
+
+def load_key_to_id(key_registry_path: Path) -> Dict[str, int]:
+    with key_registry_path.open("r", encoding="utf-8") as fp:
+        data = json.load(fp)
+    if not isinstance(data, dict):
+        return {}
+    raw = data.get("key_to_id")
+    if isinstance(raw, dict):
+        return {str(key): int(key_id) for key, key_id in raw.items()}
+    keys = data.get("keys")
+    if isinstance(keys, list):
+        return {str(key): idx for idx, key in enumerate(keys)}
+    return {}
+
+
+class CompiledLocaleReader:
+    """mmap-backed reader; strings are decoded lazily, one lookup at a time."""
+
+    def __init__(self, path: Path, key_to_id: Dict[str, int] | None = None) -> None:
+        self.path = Path(path)
+        self.key_to_id: Dict[str, int] = dict(key_to_id or {})
+        if self.path.stat().st_size < HEADER.size:
+            raise ValueError(f"not a compiled locale binary: {self.path}")
+        self._fp = self.path.open("rb")
+        self._mm = mmap.mmap(self._fp.fileno(), 0, access=mmap.ACCESS_READ)
+        (
+            magic,
+            version,
+            self.key_count,
+            self._table_offset,
+            self._pool_offset,
+            self._pool_size,
+        ) = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(
+                f"unsupported compiled locale binary: {self.path} "
+                f"(magic={magic!r} version={version})"
+            )
+        if self._pool_offset + self._pool_size > len(self._mm):
+            self.close()
+            raise ValueError(f"truncated compiled locale binary: {self.path}")
+
+    def __enter__(self) -> "CompiledLocaleReader":
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.key_count
+
+    def close(self) -> None:
+        if not self._mm.closed:
+            self._mm.close()
+        if not self._fp.closed:
+            self._fp.close()
+
+    def string_at(self, key_id: int) -> str | None:
+        if key_id < 0 or key_id >= self.key_count:
+            return None
+        offset, length = TABLE_ENTRY.unpack_from(
+            self._mm, self._table_offset + key_id * TABLE_ENTRY.size
+        )
+        if offset == MISSING_OFFSET:
+            return None
+        start = self._pool_offset + offset
+        return self._mm[start : start + length].decode("utf-8")
+
+    def get(self, key: str, default: str | None = None) -> str | None:
+        key_id = self.key_to_id.get(key)
+        if key_id is None:
+            return default
+        value = self.string_at(key_id)
+        return default if value is None else value
+
+    def to_dict(self) -> Dict[str, str]:
+        strings: Dict[str, str] = {}
+        for key, key_id in self.key_to_id.items():
+            value = self.string_at(key_id)
+            if value is not None:
+                strings[key] = value
+        return strings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("binary", help="path to compiled/<locale>.bin")
+    parser.add_argument("keys", nargs="*", help="keys to resolve")
+    parser.add_argument(
+        "--key-registry",
+        default="",
+        help="key_registry.json path (default: ../key_registry.json next to the binary)",
+    )
+    args = parser.parse_args()
+
+    binary_path = Path(args.binary)
+    registry_path = (
+        Path(args.key_registry)
+        if args.key_registry
+        else binary_path.parent.parent / "key_registry.json"
+    )
+    with CompiledLocaleReader(binary_path, load_key_to_id(registry_path)) as reader:
+        print(f"[localization_binary] {binary_path}: key_count={len(reader)}")
+        for key in args.keys:
+            print(f"{key} = {reader.get(key, '<missing>')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,19 +4,41 @@
 This keeps authoring ergonomics (split files by category) while giving runtime
 fast O(1) lookup from a single loaded JSON payload.
 
+Per-locale compile results are cached under `compile_cache_dir` keyed by the
+locale's source file hashes plus the manifest and key_owners hashes, so a
+no-op run skips Fluent/JSON parsing for every unchanged locale. Locales that do
+need compiling can be fanned out to a process pool with `--jobs`; the parent
+merges the results into the shared key registry and enforces the `max_*` gates.
+
+With `emit_binary` enabled in the manifest, a memory-mappable
+`compiled/<locale>.bin` is written next to each JSON (see localization_binary.py).
+
 Usage:
   python3 tools/localization_compile.py --project-root .
   python3 tools/localization_compile.py --project-root . --strict-duplicates
+  python3 tools/localization_compile.py --project-root . --no-cache
+  python3 tools/localization_compile.py --project-root . --jobs 0
+  python3 tools/localization_compile.py --project-root . --watch --watch-audit
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
+import io
 import json
+import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Tuple
+
+from localization_binary import encode_compiled_locale
+
+if TYPE_CHECKING:
+    from localization_model import LocalizationModel
 
 
 DEFAULT_MANIFEST: Dict[str, Any] = {
@@ -41,11 +63,13 @@ DEFAULT_MANIFEST: Dict[str, Any] = {
         "data_generated",
     ],
     "compiled_dir": "compiled",
+    "compile_cache_dir": ".compile_cache",
     "include_sources": False,
     "key_registry_path": "key_registry.json",
     "key_owners_path": "key_owners.json",
     "preserve_key_ids": True,
     "embed_keys": False,
+    "emit_binary": False,
     "max_duplicate_key_count": None,
     "max_duplicate_conflict_count": None,
     "max_missing_key_fill_count": None,
@@ -56,6 +80,8 @@ DEFAULT_MANIFEST: Dict[str, Any] = {
 
 FLUENT_SOURCE_FORMATS: set[str] = {"fluent", "fluent_preferred"}
 SUPPORTED_SOURCE_FORMATS: set[str] = FLUENT_SOURCE_FORMATS | {"json"}
+# Bump when the shape of _compile_locale output changes so stale caches miss.
+COMPILE_CACHE_VERSION = 1
 
 
 def _load_json(path: Path) -> Any:
@@ -70,21 +96,182 @@ def _write_json(path: Path, data: Any) -> None:
         fp.write("\n")
 
 
-def _write_json_if_changed(path: Path, data: Any) -> bool:
+def _digest_sidecar_path(path: Path, digest_dir: Path) -> Path:
+    # Sidecars live under the gitignored compile cache, not next to the output.
+    return digest_dir / f"{path.name}.digest"
+
+
+def _atomic_write_bytes(path: Path, payload: bytes) -> None:
+    """Write via temp file + rename so readers (e.g. a Godot hot reload) never
+    observe a half-written file."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    rendered = json.dumps(data, ensure_ascii=False, indent=2, sort_keys=True) + "\n"
-    if path.exists():
-        existing = path.read_text(encoding="utf-8")
-        if existing == rendered:
-            return False
-    path.write_text(rendered, encoding="utf-8")
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_path.open("wb") as fp:
+            fp.write(payload)
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def _write_digest_sidecar(
+    path: Path, digest_dir: Path, payload_digest: str, payload_size: int
+) -> None:
+    stat = path.stat()
+    sidecar = {
+        "sha256": payload_digest,
+        "size": payload_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+    _atomic_write_bytes(
+        _digest_sidecar_path(path, digest_dir),
+        (json.dumps(sidecar, sort_keys=True) + "\n").encode("utf-8"),
+    )
+
+
+def _output_matches(path: Path, digest_dir: Path, payload: bytes, payload_digest: str) -> bool:
+    if not path.exists():
+        return False
+    stat = path.stat()
+    if stat.st_size != len(payload):
+        return False
+    sidecar_path = _digest_sidecar_path(path, digest_dir)
+    if sidecar_path.exists():
+        try:
+            sidecar = _load_json(sidecar_path)
+        except (OSError, ValueError):
+            sidecar = None
+        # The sidecar is only trusted while the output is untouched since it
+        # was written (same size and mtime); otherwise fall back to a full read.
+        if (
+            isinstance(sidecar, dict)
+            and sidecar.get("size") == stat.st_size
+            and sidecar.get("mtime_ns") == stat.st_mtime_ns
+        ):
+            return sidecar.get("sha256") == payload_digest
+    if path.read_bytes() != payload:
+        return False
+    _write_digest_sidecar(path, digest_dir, payload_digest, len(payload))
+    return True
+
+
+def _write_bytes_if_changed(path: Path, payload: bytes, digest_dir: Path) -> bool:
+    payload_digest = hashlib.sha256(payload).hexdigest()
+    if _output_matches(path, digest_dir, payload, payload_digest):
+        return False
+    _atomic_write_bytes(path, payload)
+    _write_digest_sidecar(path, digest_dir, payload_digest, len(payload))
     return True
 
 
+def _write_json_if_changed(path: Path, data: Any, digest_dir: Path) -> bool:
+    rendered = json.dumps(data, ensure_ascii=False, indent=2, sort_keys=True) + "\n"
+    return _write_bytes_if_changed(path, rendered.encode("utf-8"), digest_dir)
+
+
+def _load_output_meta(path: Path) -> Dict[str, Any] | None:
+    """The "meta" block of a compiled locale output, or None if unreadable."""
+    try:
+        data = _load_json(path)
+    except (OSError, ValueError):
+        return None
+    meta = data.get("meta") if isinstance(data, dict) else None
+    return meta if isinstance(meta, dict) else None
+
+
+def _hash_file(path: Path) -> str:
+    if not path.exists():
+        return "missing"
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _locale_source_paths(
+    localization_root: Path,
+    locale: str,
+    fallback_locale: str,
+    source_format: str,
+    categories: List[str],
+) -> List[Path]:
+    paths: List[Path] = []
+    if source_format in FLUENT_SOURCE_FORMATS:
+        paths.append(localization_root / "fluent" / locale / "messages.ftl")
+        paths.append(localization_root / "fluent" / fallback_locale / "messages.ftl")
+    if source_format != "fluent":
+        for category in categories:
+            paths.append(localization_root / locale / f"{category}.json")
+            paths.append(localization_root / fallback_locale / f"{category}.json")
+    return paths
+
+
+def _locale_cache_fingerprint(
+    localization_root: Path,
+    locale: str,
+    fallback_locale: str,
+    source_format: str,
+    categories: List[str],
+    manifest_digest: str,
+    key_owners_digest: str,
+) -> Dict[str, Any]:
+    source_digests: Dict[str, str] = {}
+    for path in _locale_source_paths(
+        localization_root=localization_root,
+        locale=locale,
+        fallback_locale=fallback_locale,
+        source_format=source_format,
+        categories=categories,
+    ):
+        rel = path.relative_to(localization_root).as_posix()
+        if rel not in source_digests:
+            source_digests[rel] = _hash_file(path)
+    return {
+        "version": COMPILE_CACHE_VERSION,
+        "locale": locale,
+        "manifest": manifest_digest,
+        "key_owners": key_owners_digest,
+        "sources": source_digests,
+    }
+
+
+def _load_cached_locale(
+    cache_root: Path,
+    locale: str,
+    fingerprint: Dict[str, Any],
+) -> Dict[str, Any] | None:
+    cache_path = cache_root / f"{locale}.json"
+    if not cache_path.exists():
+        return None
+    try:
+        data = _load_json(cache_path)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("fingerprint") != fingerprint:
+        return None
+    compiled = data.get("compiled")
+    if not isinstance(compiled, dict):
+        return None
+    return compiled
+
+
+def _store_cached_locale(
+    cache_root: Path,
+    locale: str,
+    fingerprint: Dict[str, Any],
+    compiled: Dict[str, Any],
+) -> None:
+    payload = json.dumps({"fingerprint": fingerprint, "compiled": compiled}, ensure_ascii=False)
+    _atomic_write_bytes(cache_root / f"{locale}.json", payload.encode("utf-8"))
+
+
 def _load_manifest(manifest_path: Path) -> Dict[str, Any]:
     if not manifest_path.exists():
         return dict(DEFAULT_MANIFEST)
-    data = _load_json(manifest_path)
+    return load_manifest_payload(_load_json(manifest_path))
+
+
+def load_manifest_payload(data: Any) -> Dict[str, Any]:
     if not isinstance(data, dict):
         return dict(DEFAULT_MANIFEST)
 
@@ -98,17 +285,19 @@ def _load_category_data(
     locale: str,
     category: str,
     fallback_locale: str,
+    model: LocalizationModel | None = None,
 ) -> Tuple[Dict[str, Any], str]:
+    load_json = model.load_json if model is not None else _load_json
     locale_file = localization_root / locale / f"{category}.json"
     if locale_file.exists():
-        data = _load_json(locale_file)
+        data = load_json(locale_file)
         if isinstance(data, dict):
             return data, locale
         return {}, locale
 
     fallback_file = localization_root / fallback_locale / f"{category}.json"
     if fallback_file.exists():
-        data = _load_json(fallback_file)
+        data = load_json(fallback_file)
         if isinstance(data, dict):
             return data, fallback_locale
         return {}, fallback_locale
@@ -116,23 +305,34 @@ def _load_category_data(
     return {}, ""
 
 
-def _parse_fluent_source(source: str) -> Tuple[
+def _parse_fluent_lines(lines: Iterable[str]) -> Tuple[
     Dict[str, str],
     Dict[str, List[str]],
     Dict[str, List[str]],
 ]:
-    entries_by_key: Dict[str, List[str]] = {}
+    """Single pass over FTL lines (a file handle works) keeping only the last
+    value per key; duplicates keep the first complete value so conflicts can be
+    decided inline without storing every occurrence."""
+    flat: Dict[str, str] = {}
+    occurrence_counts: Dict[str, int] = {}
+    first_values: Dict[str, str] = {}
+    conflict_keys: set[str] = set()
     current_key = ""
-    for raw_line in source.splitlines():
+
+    def _finish_entry(key: str) -> None:
+        if key in first_values and key not in conflict_keys:
+            if flat[key] != first_values[key]:
+                conflict_keys.add(key)
+
+    for raw_line in lines:
+        raw_line = raw_line.rstrip("\n")
         stripped = raw_line.strip()
         if not stripped or stripped.startswith("#"):
             continue
         if raw_line[:1].isspace() and current_key:
-            if current_key in entries_by_key and entries_by_key[current_key]:
-                entries_by_key[current_key][-1] = (
-                    entries_by_key[current_key][-1] + "\n" + stripped
-                )
+            flat[current_key] = flat[current_key] + "\n" + stripped
             continue
+        _finish_entry(current_key)
         sep = raw_line.find("=")
         if sep <= 0:
             current_key = ""
@@ -145,41 +345,74 @@ def _parse_fluent_source(source: str) -> Tuple[
         if not key:
             current_key = ""
             continue
-        entries_by_key.setdefault(key, []).append(value)
+        if key in flat:
+            if key not in first_values:
+                first_values[key] = flat[key]
+            occurrence_counts[key] = occurrence_counts.get(key, 1) + 1
+        flat[key] = value
         current_key = key
+    _finish_entry(current_key)
 
-    flat: Dict[str, str] = {}
     duplicate_keys: Dict[str, List[str]] = {}
     duplicate_conflict_keys: Dict[str, List[str]] = {}
-    for key, values in entries_by_key.items():
-        if not values:
+    for key in flat:
+        count = occurrence_counts.get(key, 1)
+        if count <= 1:
             continue
-        if len(values) > 1:
-            duplicate_keys[key] = ["fluent" for _ in values]
-            if len(set(values)) > 1:
-                duplicate_conflict_keys[key] = ["fluent" for _ in values]
-        flat[key] = values[-1]
+        duplicate_keys[key] = ["fluent"] * count
+        if key in conflict_keys:
+            duplicate_conflict_keys[key] = ["fluent"] * count
     return flat, duplicate_keys, duplicate_conflict_keys
 
 
+def _parse_fluent_source(source: str) -> Tuple[
+    Dict[str, str],
+    Dict[str, List[str]],
+    Dict[str, List[str]],
+]:
+    # Split on universal newlines only (\n, \r\n, \r), the same as iterating a
+    # text-mode file. str.splitlines() would also break on \x0b, \x0c,
+    # \x1c-\x1e, \x85, \u2028 and \u2029; those stay inside the value, as
+    # in Fluent itself.
+    return _parse_fluent_lines(io.StringIO(source, newline=None))
+
+
+def parse_fluent_file(path: Path) -> Tuple[
+    Dict[str, str],
+    Dict[str, List[str]],
+    Dict[str, List[str]],
+]:
+    # Text-mode iteration splits on universal newlines; see _parse_fluent_source.
+    with path.open("r", encoding="utf-8") as fp:
+        return _parse_fluent_lines(fp)
+
+
 def _load_fluent_locale_data(
     localization_root: Path,
     locale: str,
     fallback_locale: str,
+    model: LocalizationModel | None = None,
 ) -> Tuple[
     Dict[str, str],
     Dict[str, List[str]],
     Dict[str, List[str]],
     str,
 ]:
+    if model is not None:
+        for candidate in (locale, fallback_locale):
+            parsed_source = model.fluent_source(candidate)
+            if parsed_source is not None:
+                return parsed_source[0], parsed_source[1], parsed_source[2], candidate
+        return {}, {}, {}, ""
+
     locale_file = localization_root / "fluent" / locale / "messages.ftl"
     if locale_file.exists():
-        parsed = _parse_fluent_source(locale_file.read_text(encoding="utf-8"))
+        parsed = parse_fluent_file(locale_file)
         return parsed[0], parsed[1], parsed[2], locale
 
     fallback_file = localization_root / "fluent" / fallback_locale / "messages.ftl"
     if fallback_file.exists():
-        parsed = _parse_fluent_source(fallback_file.read_text(encoding="utf-8"))
+        parsed = parse_fluent_file(fallback_file)
         return parsed[0], parsed[1], parsed[2], fallback_locale
 
     return {}, {}, {}, ""
@@ -192,6 +425,7 @@ def _compile_locale(
     source_format: str,
     categories: List[str],
     key_owners: Dict[str, str],
+    model: LocalizationModel | None = None,
 ) -> Dict[str, Any]:
     if source_format in FLUENT_SOURCE_FORMATS:
         (
@@ -203,6 +437,7 @@ def _compile_locale(
             localization_root=localization_root,
             locale=locale,
             fallback_locale=fallback_locale,
+            model=model,
         )
         if fluent_flat:
             key_sources = {
@@ -249,6 +484,7 @@ def _compile_locale(
             locale=locale,
             category=category,
             fallback_locale=fallback_locale,
+            model=model,
         )
 
         for raw_key, raw_value in category_data.items():
@@ -301,10 +537,21 @@ def _compile_locale(
     }
 
 
+def _resolve_job_count(jobs: int, pending_count: int) -> int:
+    if pending_count <= 1:
+        return 1
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    return max(1, min(jobs, pending_count))
+
+
 def _load_key_registry(path: Path) -> List[str]:
     if not path.exists():
         return []
-    data = _load_json(path)
+    return registry_keys_from_payload(_load_json(path))
+
+
+def registry_keys_from_payload(data: Any) -> List[str]:
     if not isinstance(data, dict):
         return []
     keys = data.get("keys")
@@ -331,7 +578,10 @@ def _normalize_owner_category(raw: Any) -> str:
 def _load_key_owners(path: Path) -> Dict[str, str]:
     if not path.exists():
         return {}
-    data = _load_json(path)
+    return load_key_owners_payload(_load_json(path))
+
+
+def load_key_owners_payload(data: Any) -> Dict[str, str]:
     if not isinstance(data, dict):
         return {}
     raw_owners: Any = data
@@ -373,7 +623,9 @@ def _build_key_registry(
     return merged
 
 
-def _write_key_registry(path: Path, keys: List[str], active_keys: List[str]) -> None:
+def _write_key_registry(
+    path: Path, keys: List[str], active_keys: List[str], digest_dir: Path
+) -> bool:
     key_to_id: Dict[str, int] = {}
     for idx, key in enumerate(keys):
         key_to_id[key] = idx
@@ -391,24 +643,42 @@ def _write_key_registry(path: Path, keys: List[str], active_keys: List[str]) ->
         "key_to_id": key_to_id,
         "removed_keys": removed_keys,
     }
-    _write_json_if_changed(path, output)
-
-
-def run(project_root: Path, strict_duplicates: bool, report_json: str = "") -> int:
+    return _write_json_if_changed(path, output, digest_dir)
+
+
+def run(
+    project_root: Path,
+    strict_duplicates: bool,
+    report_json: str = "",
+    use_cache: bool = True,
+    jobs: int = 1,
+    manifest: Dict[str, Any] | None = None,
+    model: LocalizationModel | None = None,
+    locales: List[str] | None = None,
+) -> int:
+    """Compile every supported locale, or only write ``locales`` when given.
+
+    The key registry spans all locales, so locales outside ``locales`` are
+    still loaded (from the compile cache when it is enabled); their outputs
+    are rewritten too when the registry or any cross-locale meta count changed.
+    """
     localization_root = project_root / "localization"
     manifest_path = localization_root / "manifest.json"
-    manifest = _load_manifest(manifest_path)
+    if manifest is None:
+        manifest = model.manifest if model is not None else _load_manifest(manifest_path)
 
     default_locale = str(manifest.get("default_locale", "ko"))
     supported_locales = [str(x) for x in manifest.get("supported_locales", ["ko", "en"])]
     source_format = str(manifest.get("source_format", "fluent_preferred")).strip().lower()
     categories = [str(x) for x in manifest.get("categories_order", [])]
     compiled_dir_name = str(manifest.get("compiled_dir", "compiled"))
+    compile_cache_dir_name = str(manifest.get("compile_cache_dir", ".compile_cache"))
     include_sources = bool(manifest.get("include_sources", False))
     key_registry_rel = str(manifest.get("key_registry_path", "key_registry.json"))
     key_owners_rel = str(manifest.get("key_owners_path", "key_owners.json"))
     preserve_key_ids = bool(manifest.get("preserve_key_ids", True))
     embed_keys = bool(manifest.get("embed_keys", False))
+    emit_binary = bool(manifest.get("emit_binary", False))
     max_duplicate_key_count_raw = manifest.get("max_duplicate_key_count")
     max_duplicate_key_count: int | None = None
     if max_duplicate_key_count_raw is not None:
@@ -490,7 +760,14 @@ def run(project_root: Path, strict_duplicates: bool, report_json: str = "") -> i
     compiled_root = localization_root / compiled_dir_name
     compiled_root.mkdir(parents=True, exist_ok=True)
     key_owners_path = localization_root / key_owners_rel
-    key_owners = _load_key_owners(key_owners_path)
+    if model is not None:
+        key_owners = load_key_owners_payload(model.key_owners_payload)
+    else:
+        key_owners = _load_key_owners(key_owners_path)
+    compile_cache_root = localization_root / compile_cache_dir_name
+    digest_dir = compile_cache_root / "digests"
+    manifest_digest = _hash_file(manifest_path)
+    key_owners_digest = _hash_file(key_owners_path)
 
     compiled_by_locale: Dict[str, Dict[str, Any]] = {}
     total_duplicates = 0
@@ -498,16 +775,60 @@ def run(project_root: Path, strict_duplicates: bool, report_json: str = "") -> i
     max_locale_duplicate_conflicts = 0
     max_locale_owner_rule_misses = 0
     locale_summary: Dict[str, Dict[str, Any]] = {}
+    cache_hit_count = 0
+    fingerprints: Dict[str, Dict[str, Any]] = {}
+    pending_locales: List[str] = []
     for locale in supported_locales:
-        compiled = _compile_locale(
+        fingerprint = _locale_cache_fingerprint(
             localization_root=localization_root,
             locale=locale,
             fallback_locale="en",
             source_format=source_format,
             categories=categories,
-            key_owners=key_owners,
+            manifest_digest=manifest_digest,
+            key_owners_digest=key_owners_digest,
         )
-        compiled_by_locale[locale] = compiled
+        fingerprints[locale] = fingerprint
+        cached: Dict[str, Any] | None = None
+        if use_cache:
+            cached = _load_cached_locale(compile_cache_root, locale, fingerprint)
+        if cached is not None:
+            cache_hit_count += 1
+            compiled_by_locale[locale] = cached
+        elif locale not in pending_locales:
+            pending_locales.append(locale)
+
+    worker_count = _resolve_job_count(jobs, len(pending_locales))
+    compile_kwargs_by_locale = {
+        locale: {
+            "localization_root": localization_root,
+            "locale": locale,
+            "fallback_locale": "en",
+            "source_format": source_format,
+            "categories": categories,
+            "key_owners": key_owners,
+        }
+        for locale in pending_locales
+    }
+    if worker_count > 1:
+        with ProcessPoolExecutor(max_workers=worker_count) as executor:
+            futures = {
+                locale: executor.submit(_compile_locale, **kwargs)
+                for locale, kwargs in compile_kwargs_by_locale.items()
+            }
+            for locale, future in futures.items():
+                compiled_by_locale[locale] = future.result()
+    else:
+        for locale, kwargs in compile_kwargs_by_locale.items():
+            compiled_by_locale[locale] = _compile_locale(**kwargs, model=model)
+    if use_cache:
+        for locale in pending_locales:
+            _store_cached_locale(
+                compile_cache_root, locale, fingerprints[locale], compiled_by_locale[locale]
+            )
+
+    for locale in supported_locales:
+        compiled = compiled_by_locale[locale]
         duplicate_count = len(compiled["duplicate_keys"])
         duplicate_conflict_count = len(compiled["duplicate_conflict_keys"])
         total_duplicates += duplicate_count
@@ -519,6 +840,12 @@ def run(project_root: Path, strict_duplicates: bool, report_json: str = "") -> i
             max_locale_owner_rule_misses, int(compiled.get("owner_rule_miss_count", 0))
         )
 
+    print(
+        "[localization_compile] compile-cache: "
+        f"enabled={1 if use_cache else 0} hits={cache_hit_count} "
+        f"misses={len(pending_locales)} workers={worker_count}"
+    )
+
     canonical_key_set: set[str] = set()
     for compiled in compiled_by_locale.values():
         canonical_key_set.update(compiled["strings"].keys())
@@ -537,17 +864,46 @@ def run(project_root: Path, strict_duplicates: bool, report_json: str = "") -> i
         f"missing_for_duplicates={duplicate_owner_missing_count} unused={owner_unused_count}"
     )
     key_registry_path = localization_root / key_registry_rel
-    existing_registry_keys = _load_key_registry(key_registry_path)
+    if model is not None:
+        existing_registry_keys = model.registry_keys
+    else:
+        existing_registry_keys = _load_key_registry(key_registry_path)
     registry_keys = _build_key_registry(
         canonical_keys=canonical_keys,
         existing_registry_keys=existing_registry_keys,
         preserve_key_ids=preserve_key_ids,
     )
-    _write_key_registry(
+    registry_updated = _write_key_registry(
         path=key_registry_path,
         keys=registry_keys,
         active_keys=canonical_keys,
+        digest_dir=digest_dir,
     )
+    if model is not None:
+        model.set_registry_keys(registry_keys)
+    print(
+        f"[localization_compile] key-registry: keys={len(registry_keys)} "
+        f"active={len(canonical_keys)} updated={1 if registry_updated else 0} -> {key_registry_path}"
+    )
+    # Meta fields computed across every locale; a partial run may only skip a
+    # locale whose existing output already holds the same values.
+    cross_locale_meta = {
+        "key_count": len(registry_keys),
+        "active_key_count": len(canonical_keys),
+        "owner_policy_entry_count": len(key_owners),
+        "owner_policy_missing_duplicate_count": duplicate_owner_missing_count,
+        "owner_policy_unused_count": owner_unused_count,
+    }
+    write_locales = set(supported_locales)
+    if locales is not None and not registry_updated:
+        write_locales &= set(locales)
+        for locale in supported_locales:
+            if locale in write_locales:
+                continue
+            meta = _load_output_meta(compiled_root / f"{locale}.json")
+            if meta is None or any(meta.get(k) != v for k, v in cross_locale_meta.items()):
+                write_locales = set(supported_locales)
+                break
     fallback_strings: Dict[str, str] = {}
     if "en" in compiled_by_locale:
         fallback_strings = dict(compiled_by_locale["en"]["strings"])
@@ -575,6 +931,8 @@ def run(project_root: Path, strict_duplicates: bool, report_json: str = "") -> i
                 locale_strings[key] = key
                 locale_sources[key] = "fallback/key"
         max_locale_missing_filled = max(max_locale_missing_filled, missing_filled_count)
+        if locale not in write_locales:
+            continue
 
         output = {
             "meta": {
@@ -608,7 +966,14 @@ def run(project_root: Path, strict_duplicates: bool, report_json: str = "") -> i
         if include_sources:
             output["sources"] = locale_sources
         out_path = compiled_root / f"{locale}.json"
-        updated = _write_json_if_changed(out_path, output)
+        updated = _write_json_if_changed(out_path, output, digest_dir)
+        if model is not None:
+            model.set_compiled_payload(locale, output)
+        binary_path: Path | None = None
+        if emit_binary:
+            binary_path = compiled_root / f"{locale}.bin"
+            binary_payload = encode_compiled_locale(locale_strings, registry_keys)
+            updated = _write_bytes_if_changed(binary_path, binary_payload, digest_dir) or updated
         locale_summary[locale] = {
             "string_count": len(locale_strings),
             "duplicate_key_count": duplicate_count,
@@ -619,6 +984,7 @@ def run(project_root: Path, strict_duplicates: bool, report_json: str = "") -> i
             "owner_rule_miss_count": owner_rule_miss_count,
             "owner_rule_override_count": owner_rule_override_count,
             "output_path": str(out_path),
+            "binary_output_path": str(binary_path) if binary_path is not None else "",
         }
 
         print(
@@ -736,6 +1102,135 @@ def run(project_root: Path, strict_duplicates: bool, report_json: str = "") -> i
     return 0
 
 
+def _snapshot_watch_mtimes(
+    localization_root: Path,
+    manifest: Dict[str, Any],
+) -> Dict[str, float]:
+    key_owners_rel = str(manifest.get("key_owners_path", "key_owners.json"))
+    candidates: List[Path] = [
+        localization_root / "manifest.json",
+        localization_root / key_owners_rel,
+    ]
+    fluent_root = localization_root / "fluent"
+    if fluent_root.exists():
+        candidates.extend(path for path in fluent_root.rglob("*") if path.is_file())
+    for locale in manifest.get("supported_locales", []):
+        locale_dir = localization_root / str(locale)
+        if locale_dir.is_dir():
+            candidates.extend(locale_dir.glob("*.json"))
+
+    mtimes: Dict[str, float] = {}
+    for path in candidates:
+        try:
+            mtimes[path.relative_to(localization_root).as_posix()] = path.stat().st_mtime
+        except OSError:
+            continue
+    return mtimes
+
+
+def _affected_locales(changed_paths: List[str], supported_locales: List[str]) -> List[str]:
+    affected: set[str] = set()
+    for rel in changed_paths:
+        parts = rel.split("/")
+        if parts[0] == "fluent" and len(parts) > 2:
+            locale = parts[1]
+        elif len(parts) > 1:
+            locale = parts[0]
+        else:
+            # manifest.json / key_owners.json feed every locale.
+            return list(supported_locales)
+        if locale == "en":
+            # en is the fallback locale for every other locale's missing keys.
+            return list(supported_locales)
+        affected.add(locale)
+    return [locale for locale in supported_locales if locale in affected]
+
+
+def watch(
+    project_root: Path,
+    strict_duplicates: bool,
+    report_json: str = "",
+    use_cache: bool = True,
+    jobs: int = 1,
+    interval: float = 1.0,
+    with_audit: bool = False,
+) -> int:
+    """Poll source mtimes and recompile (and optionally audit) affected locales.
+
+    Stdlib only. Unchanged locales are served from the compile cache, so each
+    cycle only parses the locales whose sources changed.
+    """
+    localization_root = project_root / "localization"
+    manifest_path = localization_root / "manifest.json"
+    manifest = _load_manifest(manifest_path)
+    audit_fn: Any = None
+    if with_audit:
+        from localization_audit import run_audit as audit_fn
+
+    snapshot: Dict[str, float] = {}
+    print(f"[localization_compile] watching {localization_root} every {interval:g}s (Ctrl-C to stop)")
+    try:
+        while True:
+            # A failed cycle (bad JSON mid-save, a broken manifest, ...) leaves
+            # the snapshot as it was so the next poll retries the same change.
+            try:
+                current = _snapshot_watch_mtimes(localization_root, manifest)
+                changed = sorted(
+                    rel for rel in set(current) | set(snapshot) if current.get(rel) != snapshot.get(rel)
+                )
+                if changed:
+                    if snapshot and "manifest.json" in changed:
+                        manifest = _load_manifest(manifest_path)
+                        current = _snapshot_watch_mtimes(localization_root, manifest)
+                    supported_locales = [str(x) for x in manifest.get("supported_locales", ["ko", "en"])]
+                    affected = (
+                        _affected_locales(changed, supported_locales) if snapshot else supported_locales
+                    )
+                    preview = ", ".join(changed[:5]) + (" ..." if len(changed) > 5 else "")
+                    print(
+                        f"[localization_compile] watch: changed={len(changed)} "
+                        f"affected={','.join(affected) or '-'} ({preview})"
+                    )
+                    started = time.perf_counter()
+                    exit_code = 0
+                    if affected:
+                        exit_code = run(
+                            project_root=project_root,
+                            strict_duplicates=strict_duplicates,
+                            report_json=report_json,
+                            use_cache=use_cache,
+                            jobs=jobs,
+                            manifest=manifest,
+                            locales=affected,
+                        )
+                    if audit_fn is not None and affected:
+                        report = audit_fn(project_root, locales=affected, include_data_scan=False)
+                        for locale in affected:
+                            parity = [
+                                item for item in report["parity_issues"] if item.get("locale") == locale
+                            ]
+                            summary = report["duplicate_locale_summary"].get(locale, {})
+                            print(
+                                f"[localization_audit] {locale}: "
+                                f"missing={sum(len(item['missing_in_locale']) for item in parity)} "
+                                f"extra={sum(len(item['extra_in_locale']) for item in parity)} "
+                                f"duplicates={summary.get('duplicate_key_count', 0)} "
+                                f"duplicate_conflicts={summary.get('duplicate_conflict_count', 0)}"
+                            )
+                    elapsed_ms = (time.perf_counter() - started) * 1000.0
+                    print(f"[localization_compile] watch: exit={exit_code} elapsed_ms={elapsed_ms:.0f}")
+                snapshot = current
+            except Exception as exc:
+                print(
+                    f"[localization_compile] watch: cycle failed, retrying: {type(exc).__name__}: {exc}",
+                    file=sys.stderr,
+                )
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print("[localization_compile] watch stopped")
+    return 0
+
+
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("--project-root", default=".", help="WorldSim project root")
@@ -749,13 +1244,52 @@ def main() -> int:
         default="",
         help="optional output path for compile summary json",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="ignore and do not update the per-locale compile cache",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="worker processes for per-locale compilation (0 = one per CPU core)",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="stay resident and recompile when localization sources change",
+    )
+    parser.add_argument(
+        "--watch-audit",
+        action="store_true",
+        help="with --watch, also audit the affected locales after each compile",
+    )
+    parser.add_argument(
+        "--watch-interval",
+        type=float,
+        default=1.0,
+        help="seconds between --watch mtime polls",
+    )
     args = parser.parse_args()
 
     project_root = Path(args.project_root).resolve()
+    if args.watch:
+        return watch(
+            project_root=project_root,
+            strict_duplicates=args.strict_duplicates,
+            report_json=args.report_json,
+            use_cache=not args.no_cache,
+            jobs=args.jobs,
+            interval=max(args.watch_interval, 0.05),
+            with_audit=args.watch_audit,
+        )
     return run(
         project_root=project_root,
         strict_duplicates=args.strict_duplicates,
         report_json=args.report_json,
+        use_cache=not args.no_cache,
+        jobs=args.jobs,
     )
 
 
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""Shared in-process view of the localization tree.
+
+localization_compile.py, localization_audit.py, find_unused_files.py and
+tools/harness/locale_check.sh all need the same manifest, FTL, category JSON,
+compiled JSON, key_owners and key_registry data. LocalizationModel loads each
+file lazily and at most once per process; localization_verify.py builds one
+model and hands it to both compile and audit so the verification pipeline
+parses every file exactly once.
+
+Usage:
+  python3 tools/localization_model.py --project-root . --dump-keys /tmp/locale_check
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple
+
+from localization_compile import (
+    load_key_owners_payload,
+    load_manifest_payload,
+    parse_fluent_file,
+    registry_keys_from_payload,
+)
+
+FluentParse = Tuple[Dict[str, str], Dict[str, List[str]], Dict[str, List[str]]]
+
+
+class LocalizationModel:
+    def __init__(self, project_root: Path) -> None:
+        self.project_root = Path(project_root)
+        self.localization_root = self.project_root / "localization"
+        self._json_by_path: Dict[Path, Any] = {}
+        self._fluent_by_locale: Dict[str, FluentParse | None] = {}
+        self._compiled_payloads: Dict[str, Dict[str, Any]] = {}
+        self._registry_keys: List[str] | None = None
+        self.load_count = 0
+
+    # -- raw file access -------------------------------------------------
+
+    def load_json(self, path: Path) -> Any:
+        resolved = Path(path).resolve()
+        if resolved not in self._json_by_path:
+            with resolved.open("r", encoding="utf-8") as fp:
+                self._json_by_path[resolved] = json.load(fp)
+            self.load_count += 1
+        return self._json_by_path[resolved]
+
+    def invalidate(self, path: Path | None = None) -> None:
+        """Drop memoized data (everything, or one JSON path) after an edit."""
+        if path is None:
+            self._json_by_path.clear()
+            self._fluent_by_locale.clear()
+            self._compiled_payloads.clear()
+            self._registry_keys = None
+            return
+        self._json_by_path.pop(Path(path).resolve(), None)
+
+    # -- manifest / policy -----------------------------------------------
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.localization_root / "manifest.json"
+
+    @property
+    def manifest_raw(self) -> Dict[str, Any]:
+        if not self.manifest_path.exists():
+            return {}
+        payload = self.load_json(self.manifest_path)
+        return payload if isinstance(payload, dict) else {}
+
+    @property
+    def manifest(self) -> Dict[str, Any]:
+        """Manifest merged over localization_compile.DEFAULT_MANIFEST."""
+        return load_manifest_payload(self.manifest_raw if self.manifest_path.exists() else None)
+
+    @property
+    def supported_locales(self) -> List[str]:
+        return [str(x) for x in self.manifest.get("supported_locales", ["ko", "en"])]
+
+    @property
+    def compiled_root(self) -> Path:
+        return self.localization_root / str(self.manifest.get("compiled_dir", "compiled"))
+
+    @property
+    def key_owners_path(self) -> Path:
+        rel = str(self.manifest_raw.get("key_owners_path") or "key_owners.json")
+        return (self.localization_root / rel).resolve()
+
+    @property
+    def key_owners_payload(self) -> Any:
+        if not self.key_owners_path.exists():
+            return {}
+        return self.load_json(self.key_owners_path)
+
+    @property
+    def key_owners(self) -> Dict[str, str]:
+        return load_key_owners_payload(self.key_owners_payload)
+
+    @property
+    def key_registry_path(self) -> Path:
+        return self.localization_root / str(self.manifest.get("key_registry_path", "key_registry.json"))
+
+    @property
+    def registry_keys(self) -> List[str]:
+        if self._registry_keys is None:
+            payload = self.load_json(self.key_registry_path) if self.key_registry_path.exists() else {}
+            self._registry_keys = registry_keys_from_payload(payload)
+        return list(self._registry_keys)
+
+    @property
+    def key_to_id(self) -> Dict[str, int]:
+        return {key: idx for idx, key in enumerate(self.registry_keys)}
+
+    def set_registry_keys(self, keys: List[str]) -> None:
+        self._registry_keys = list(keys)
+
+    # -- sources ---------------------------------------------------------
+
+    def fluent_source(self, locale: str) -> FluentParse | None:
+        if locale not in self._fluent_by_locale:
+            path = self.localization_root / "fluent" / locale / "messages.ftl"
+            parsed: FluentParse | None = None
+            if path.exists():
+                parsed = parse_fluent_file(path)
+                self.load_count += 1
+            self._fluent_by_locale[locale] = parsed
+        return self._fluent_by_locale[locale]
+
+    def fluent_keys(self, locale: str) -> Set[str]:
+        parsed = self.fluent_source(locale)
+        return set(parsed[0].keys()) if parsed is not None else set()
+
+    def category_entries(self, locale: str) -> Dict[str, Dict[str, Any]]:
+        """`localization/<locale>/*.json` top-level dicts keyed by file name."""
+        result: Dict[str, Dict[str, Any]] = {}
+        locale_dir = self.localization_root / locale
+        for file in sorted(locale_dir.glob("*.json")):
+            data = self.load_json(file)
+            if isinstance(data, dict):
+                result[file.name] = data
+        return result
+
+    def category_keys(self, locale: str) -> Dict[str, Set[str]]:
+        return {
+            file_name: set(str(k) for k in data.keys())
+            for file_name, data in self.category_entries(locale).items()
+        }
+
+    def json_keys(self, locale: str) -> Set[str]:
+        keys: Set[str] = set()
+        for keyset in self.category_keys(locale).values():
+            keys.update(keyset)
+        return keys
+
+    # -- compiled output -------------------------------------------------
+
+    def set_compiled_payload(self, locale: str, payload: Dict[str, Any]) -> None:
+        """Seed the compiled payload the compiler just wrote (skips re-reading it)."""
+        self._compiled_payloads[locale] = payload
+
+    def compiled_payload(self, locale: str) -> Dict[str, Any]:
+        if locale not in self._compiled_payloads:
+            path = self.compiled_root / f"{locale}.json"
+            payload: Any = self.load_json(path) if path.exists() else {}
+            self._compiled_payloads[locale] = payload if isinstance(payload, dict) else {}
+        return self._compiled_payloads[locale]
+
+    def compiled_strings(self, locale: str) -> Dict[str, str]:
+        raw_strings = self.compiled_payload(locale).get("strings")
+        if not isinstance(raw_strings, dict):
+            return {}
+        return {str(key): str(value) for key, value in raw_strings.items()}
+
+
+def _write_lines(path: Path, lines: List[str]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("".join(f"{line}\n" for line in lines), encoding="utf-8")
+
+
+def dump_keys(model: LocalizationModel, out_dir: Path, locales: List[str]) -> None:
+    """Write the key lists tools/harness/locale_check.sh compares with comm(1)."""
+    for locale in locales:
+        _write_lines(out_dir / f"fluent_{locale}_keys.txt", sorted(model.fluent_keys(locale)))
+        _write_lines(out_dir / f"json_{locale}_keys.txt", sorted(model.json_keys(locale)))
+    _write_lines(out_dir / "registry_keys.txt", sorted(model.registry_keys))
+    compiled_locale = "ko" if "ko" in locales else (locales[0] if locales else "")
+    compiled_keys = sorted(model.compiled_strings(compiled_locale).keys()) if compiled_locale else []
+    _write_lines(out_dir / "compiled_keys.txt", compiled_keys)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--project-root", default=".", help="WorldSim project root")
+    parser.add_argument(
+        "--dump-keys",
+        default="",
+        help="write fluent/json/registry/compiled key lists into this directory",
+    )
+    parser.add_argument(
+        "--locales",
+        default="ko,en",
+        help="comma-separated locales for --dump-keys",
+    )
+    args = parser.parse_args()
+
+    model = LocalizationModel(Path(args.project_root).resolve())
+    locales = [item.strip() for item in args.locales.split(",") if item.strip()]
+    if args.dump_keys:
+        dump_keys(model, Path(args.dump_keys), locales)
+    print(
+        f"[localization_model] locales={','.join(locales)} "
+        f"registry_keys={len(model.registry_keys)} files_loaded={model.load_count}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
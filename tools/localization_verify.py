@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Combined localization compile + audit over one shared LocalizationModel.
+
+Equivalent to running localization_compile.py and then localization_audit.py,
+except that every manifest/FTL/JSON/compiled file is parsed at most once: the
+compiler seeds the model with the compiled payloads and registry it just built,
+and the audit reads them from the model instead of re-parsing them from disk.
+
+Accepts every localization_audit.py flag plus --compile-* options.
+
+Usage:
+  python3 tools/localization_verify.py --project-root . --strict --compare-key-owner-policy-auto
+  python3 tools/localization_verify.py --project-root . --strict --compile-report-json reports/compile.json
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+from localization_audit import build_parser, run_cli
+from localization_compile import run as run_compile
+from localization_model import LocalizationModel
+
+
+def main() -> int:
+    parser = build_parser()
+    parser.add_argument(
+        "--compile-report-json",
+        default="",
+        help="optional output path for compile summary json",
+    )
+    parser.add_argument(
+        "--compile-strict-duplicates",
+        action="store_true",
+        help="return non-zero when duplicate localization keys exist",
+    )
+    parser.add_argument(
+        "--compile-no-cache",
+        action="store_true",
+        help="ignore and do not update the per-locale compile cache",
+    )
+    parser.add_argument(
+        "--compile-jobs",
+        type=int,
+        default=1,
+        help="worker processes for per-locale compilation (0 = one per CPU core)",
+    )
+    args = parser.parse_args()
+
+    project_root = Path(args.project_root).resolve()
+    model = LocalizationModel(project_root)
+
+    started = time.perf_counter()
+    exit_code = run_compile(
+        project_root=project_root,
+        strict_duplicates=args.compile_strict_duplicates,
+        report_json=args.compile_report_json,
+        use_cache=not args.compile_no_cache,
+        jobs=args.compile_jobs,
+        model=model,
+    )
+    compile_ms = (time.perf_counter() - started) * 1000.0
+    if exit_code != 0:
+        print(f"[localization_verify] compile failed exit={exit_code}", file=sys.stderr)
+        return exit_code
+
+    started = time.perf_counter()
+    exit_code = run_cli(args, model=model)
+    audit_ms = (time.perf_counter() - started) * 1000.0
+    print(
+        f"[localization_verify] compile_ms={compile_ms:.0f} audit_ms={audit_ms:.0f} "
+        f"files_parsed={model.load_count} exit={exit_code}"
+    )
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -96,6 +96,12 @@ else
   STEP_EXTRACT_DURATION=$(( $(date +%s) - step_started_epoch ))
 fi
 
+localization_single_pass="${MIGRATION_LOCALIZATION_SINGLE_PASS:-true}"
+if [[ "${localization_single_pass}" != "true" && "${localization_single_pass}" != "false" ]]; then
+  echo "[migration_verify] MIGRATION_LOCALIZATION_SINGLE_PASS must be true or false" >&2
+  exit 1
+fi
+
 echo "[migration_verify] 3/4 localization compile"
 step_started_epoch="$(date +%s)"
 compile_report_json="${MIGRATION_COMPILE_REPORT_JSON:-}"
@@ -114,7 +120,13 @@ compile_cmd=(
 if [[ -n "${compile_report_json}" ]]; then
   compile_cmd+=(--report-json "${compile_report_json}")
 fi
-"${compile_cmd[@]}"
+if [[ "${localization_single_pass}" == "true" ]]; then
+  # Compile runs in-process with the audit below (tools/localization_verify.py)
+  # so each localization source is parsed once.
+  echo "[migration_verify] localization compile deferred to single-pass compile+audit"
+else
+  "${compile_cmd[@]}"
+fi
 STEP_COMPILE_DURATION=$(( $(date +%s) - step_started_epoch ))
 
 echo "[migration_verify] 4/4 localization strict audit"
@@ -228,8 +240,35 @@ if [[ -n "${audit_compare_key_owner_policy}" ]]; then
   fi
   audit_cmd+=(--compare-key-owner-policy "${audit_compare_key_owner_policy}")
 fi
-"${audit_cmd[@]}"
-STEP_AUDIT_DURATION=$(( $(date +%s) - step_started_epoch ))
+if [[ "${localization_single_pass}" == "true" ]]; then
+  # audit_cmd[0..1] is "python3 localization_audit.py"; the remaining audit flags
+  # are accepted unchanged by localization_verify.py.
+  verify_cmd=(
+    python3 "${ROOT_DIR}/tools/localization_verify.py"
+    "${audit_cmd[@]:2}"
+  )
+  if [[ -n "${compile_report_json}" ]]; then
+    verify_cmd+=(--compile-report-json "${compile_report_json}")
+  fi
+  verify_log="$(mktemp)"
+  "${verify_cmd[@]}" | tee "${verify_log}"
+  # Split the single pass back into the compile/audit timing fields using the
+  # compile_ms/audit_ms that localization_verify.py reports.
+  verify_timing="$(grep -Eo 'compile_ms=[0-9]+ audit_ms=[0-9]+' "${verify_log}" | tail -n 1 || true)"
+  rm -f "${verify_log}"
+  if [[ -n "${verify_timing}" ]]; then
+    verify_compile_ms="${verify_timing#compile_ms=}"
+    verify_compile_ms="${verify_compile_ms%% *}"
+    verify_audit_ms="${verify_timing##*audit_ms=}"
+    STEP_COMPILE_DURATION=$(( (verify_compile_ms + 500) / 1000 ))
+    STEP_AUDIT_DURATION=$(( (verify_audit_ms + 500) / 1000 ))
+  else
+    STEP_AUDIT_DURATION=$(( $(date +%s) - step_started_epoch ))
+  fi
+else
+  "${audit_cmd[@]}"
+  STEP_AUDIT_DURATION=$(( $(date +%s) - step_started_epoch ))
+fi
 
 if [[ "${WITH_SHADOW_LONGRUN}" == "true" ]]; then
   echo "[migration_verify] shadow longrun verification"
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""Dense XP-to-level and talent-ceiling tables for LOG_DIMINISHING skills.
+
+Every skill spec declares
+  "growth": {"type": "LOG_DIMINISHING",
+             "params": {"base_xp": 100, "exponent": 1.8,
+                        "level_breakpoints": [25, 50, 75],
+                        "breakpoint_multipliers": [1.0, 1.5, 2.0, 3.0]},
+             "talent_key": "BODY_AGI_TRAINABILITY",
+             "talent_ceiling_map": {"0": 40, "200": 60, ...}}
+SkillTables turns all of them into dense arrays once:
+  cumulative_xp    (skills, max_level + 2); column L is the total XP needed to
+                   reach level L (column 0 is 0, levels past the skill's range
+                   and the last column are +inf)
+  ceiling_keys     (skills, buckets) talent bucket lower bounds, +inf padded
+  ceiling_levels   (skills, buckets) level cap of each bucket
+so converting XP to a level for a batch of agents is one searchsorted per
+skill and the talent cap is a few broadcast comparisons, instead of the
+level-by-level loop over log_xp_required().
+
+Usage:
+  python3 tools/skill_tables.py --project-root . --agents 100000
+  python3 tools/skill_tables.py --project-root . --out skill_tables.npz
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+from stat_curves import log_xp_required
+from stat_schema import StatSchema
+
+
+class SkillTables:
+    def __init__(self, schema: StatSchema) -> None:
+        self.schema = schema
+        self.rows = np.array(
+            [idx for idx, stat_id in enumerate(schema.ids) if schema.growth_type(stat_id) == "LOG_DIMINISHING"],
+            dtype=np.intp,
+        )
+        self.ids: List[str] = [schema.ids[row] for row in self.rows]
+        count = len(self.rows)
+        self.max_levels = schema.range_hi[self.rows].astype(np.intp)
+        max_level = int(self.max_levels.max()) if count else 0
+        levels = np.arange(1, max_level + 1)
+        self.cumulative_xp = np.full((count, max_level + 2), np.inf)
+        self.cumulative_xp[:, 0] = 0.0
+        self.talent_rows = np.zeros(count, dtype=np.intp)
+        ceiling_maps: List[Dict[float, float]] = []
+        for local, row in enumerate(self.rows):
+            spec = schema.specs[row]
+            growth = spec.get("growth", {})
+            params = dict(growth.get("params") or {})
+            top = int(self.max_levels[local])
+            per_level = log_xp_required(
+                levels[:top],
+                float(params.get("base_xp", 100.0)),
+                float(params.get("exponent", 1.0)),
+                params.get("level_breakpoints", []),
+                params.get("breakpoint_multipliers", [1.0]),
+            )
+            self.cumulative_xp[local, 1 : top + 1] = np.cumsum(per_level)
+            talent_key = str(growth.get("talent_key", ""))
+            if talent_key not in schema.index:
+                raise ValueError(f"{spec['id']}: unknown talent_key {talent_key}")
+            self.talent_rows[local] = schema.index[talent_key]
+            ceiling_map = {float(k): float(v) for k, v in (growth.get("talent_ceiling_map") or {}).items()}
+            ceiling_maps.append(ceiling_map or {float("-inf"): float(top)})
+        # Pad every row to the same bucket count: keys with +inf (never
+        # reached), levels with the row's last cap.
+        buckets = max([len(item) for item in ceiling_maps] + [1])
+        self.ceiling_keys = np.full((count, buckets), np.inf)
+        self.ceiling_levels = np.zeros((count, buckets), dtype=np.intp)
+        for local, ceiling_map in enumerate(ceiling_maps):
+            keys = sorted(ceiling_map)
+            self.ceiling_keys[local, : len(keys)] = keys
+            self.ceiling_levels[local, : len(keys)] = [ceiling_map[k] for k in keys]
+            self.ceiling_levels[local, len(keys) :] = ceiling_map[keys[-1]]
+        # The first bucket also covers talent below its key.
+        self.ceiling_keys[:, 0] = -np.inf
+
+    @classmethod
+    def load(cls, project_root: Path) -> "SkillTables":
+        return cls(StatSchema.load(project_root))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def levels_for_xp(self, xp: np.ndarray) -> np.ndarray:
+        """(skills, agents) cumulative XP -> highest level whose total XP is met."""
+        xp = np.asarray(xp, dtype=float)
+        if xp.ndim != 2 or xp.shape[0] != len(self):
+            raise ValueError(f"expected ({len(self)}, agents) XP matrix, got {xp.shape}")
+        out = np.empty(xp.shape, dtype=np.intp)
+        for local in range(len(self)):
+            out[local] = np.searchsorted(self.cumulative_xp[local], xp[local], side="right") - 1
+        return out
+
+    def ceilings(self, talent: np.ndarray) -> np.ndarray:
+        """(skills, agents) talent stat values -> level cap of each agent's bucket."""
+        talent = np.asarray(talent, dtype=float)
+        bucket = np.zeros(talent.shape, dtype=np.intp)
+        for j in range(1, self.ceiling_keys.shape[1]):
+            bucket += talent >= self.ceiling_keys[:, j : j + 1]
+        return np.take_along_axis(self.ceiling_levels, bucket, axis=1)
+
+    def levels(self, xp: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """Talent-capped levels for a stats-major (stats, agents) population."""
+        return np.minimum(self.levels_for_xp(xp), self.ceilings(values[self.talent_rows]))
+
+    def xp_to_reach(self, skill_id: str, level: int) -> float:
+        return float(self.cumulative_xp[self.ids.index(skill_id), level])
+
+    def arrays(self) -> Dict[str, Any]:
+        return {
+            "ids": np.array(self.ids),
+            "talent_ids": np.array([self.schema.ids[row] for row in self.talent_rows]),
+            "max_levels": self.max_levels,
+            "cumulative_xp": self.cumulative_xp,
+            "ceiling_keys": self.ceiling_keys,
+            "ceiling_levels": self.ceiling_levels,
+        }
+
+
+def _iterative_levels(tables: SkillTables, xp: np.ndarray, cap: np.ndarray) -> np.ndarray:
+    """Reference level-by-level loop, kept for the benchmark."""
+    level = np.zeros(xp.shape, dtype=np.intp)
+    skill_of = np.repeat(np.arange(len(tables)), xp.shape[1]).reshape(xp.shape)
+    active = np.ones(xp.shape, dtype=bool)
+    while active.any():
+        needed = tables.cumulative_xp[skill_of, level + 1]
+        active &= (xp >= needed) & (level < cap)
+        level += active
+    return level
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--project-root", default=".", help="WorldSim project root")
+    parser.add_argument("--agents", type=int, default=100000, help="benchmark batch size")
+    parser.add_argument("--seed", type=int, default=0, help="benchmark population seed")
+    parser.add_argument("--out", default="", help="optional .npz output of the dense tables")
+    args = parser.parse_args()
+
+    project_root = Path(args.project_root).resolve()
+    started = time.perf_counter()
+    tables = SkillTables.load(project_root)
+    build_ms = (time.perf_counter() - started) * 1000.0
+    print(
+        f"[skill_tables] skills={len(tables)} levels={tables.cumulative_xp.shape[1] - 2} "
+        f"buckets={tables.ceiling_keys.shape[1]} build_ms={build_ms:.1f}"
+    )
+
+    rng = np.random.default_rng(args.seed)
+    top = np.nanmax(np.where(np.isfinite(tables.cumulative_xp), tables.cumulative_xp, np.nan), axis=1)
+    xp = rng.uniform(0.0, 1.0, size=(len(tables), args.agents)) * top.reshape(-1, 1)
+    values = np.ascontiguousarray(tables.schema.random_population(args.agents, seed=args.seed).T)
+    started = time.perf_counter()
+    levels = tables.levels(xp, values)
+    table_ms = (time.perf_counter() - started) * 1000.0
+    started = time.perf_counter()
+    reference = _iterative_levels(tables, xp, tables.ceilings(values[tables.talent_rows]))
+    loop_ms = (time.perf_counter() - started) * 1000.0
+    print(
+        f"[skill_tables] agents={args.agents} searchsorted_ms={table_ms:.1f} "
+        f"iterative_ms={loop_ms:.1f} mismatches={int((levels != reference).sum())}"
+    )
+    if args.out:
+        out_path = (project_root / args.out).resolve()
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(out_path, **tables.arrays())
+        print(f"[skill_tables] wrote {out_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+"""Validated, precompiled stat schema bundle (`stats/.compiled/schema.bin`).
+
+StatSchema.load() opens and parses all ~200 `stats/**/*.json` files on every
+tool start. StatSchema.load(use_bundle=True) goes through this module instead:
+it validates every spec once (ranges, curve and growth params, referenced stat
+ids, talent_key, required_tech, prerequisites) and packs the result into one
+file that loads with a single read:
+
+  header    magic b"WSSB", u32 version, 32-byte sha256 content hash of the
+            sources, u32 section count
+  sections  section_count x (16s name, 4s numpy dtype, u64 offset, u64 size)
+  payload   8-byte aligned section data
+
+Sections: "ids" (interned stat ids, "\\n"-joined), "specs" and "sources" (JSON),
+and numeric arrays indexed by interned id: range_lo/range_hi/default,
+thresholds (thr_row, thr_value, thr_above, thr_hysteresis), COMPOSITE edges
+(composite_row, composite_input, composite_weight) and skill talents
+(skill_row, talent_row).
+
+Staleness follows localization_compile.py's digest sidecars: "sources" keeps
+(path, size, mtime_ns) of every spec, so an unchanged tree is confirmed with
+stat() calls only; when those differ the content hash decides, and a real
+change triggers a recompile.
+
+Usage:
+  python3 tools/stat_bundle.py --project-root .            # validate + compile
+  python3 tools/stat_bundle.py --project-root . --check    # validate only
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple
+
+import numpy as np
+
+from stat_schema import GROWTH_TYPES, StatSchema, specs_from_sources
+
+MAGIC = b"WSSB"
+BUNDLE_VERSION = 1
+HEADER = struct.Struct("<4sI32sI")
+SECTION = struct.Struct("<16s4sQQ")
+DEFAULT_BUNDLE_PATH = Path("stats") / ".compiled" / "schema.bin"
+
+CURVE_PARAMS: Dict[str, Tuple[str, ...]] = {
+    "LINEAR": (),
+    "POWER": ("exponent",),
+    "THRESHOLD_POWER": ("threshold", "exponent", "max_output"),
+    "STEP_LINEAR": ("threshold", "max_output"),
+    "SIGMOID_EXTREME": ("flat_zone", "pole_multiplier"),
+}
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _source_paths(stats_root: Path) -> List[Path]:
+    return sorted(path for path in stats_root.rglob("*.json") if ".compiled" not in path.parts)
+
+
+def _source_stats(stats_root: Path, paths: List[Path]) -> List[List[Any]]:
+    result: List[List[Any]] = []
+    for path in paths:
+        st = path.stat()
+        result.append([path.relative_to(stats_root).as_posix(), st.st_size, st.st_mtime_ns])
+    return result
+
+
+def _content_hash(blobs: Dict[str, bytes]) -> bytes:
+    digest = hashlib.sha256()
+    for rel in sorted(blobs):
+        digest.update(rel.encode("utf-8") + b"\0")
+        digest.update(blobs[rel])
+        digest.update(b"\0")
+    return digest.digest()
+
+
+def _read_sources(stats_root: Path, paths: List[Path]) -> Dict[str, bytes]:
+    return {path.relative_to(stats_root).as_posix(): path.read_bytes() for path in paths}
+
+
+def load_known_tech_ids(project_root: Path) -> Set[str]:
+    """TECH_* ids and era ids (LABEL_ERA_*) from localization/en/tech.json."""
+    path = project_root / "localization" / "en" / "tech.json"
+    if not path.exists():
+        return set()
+    with path.open("r", encoding="utf-8") as fp:
+        data = json.load(fp)
+    known: Set[str] = set()
+    for key in data if isinstance(data, dict) else {}:
+        key = str(key)
+        if key.startswith("TECH_") and not key.endswith("_DESC"):
+            known.add(key)
+        elif key.startswith("LABEL_ERA_"):
+            known.add(key[len("LABEL_ERA_") :])
+    return known
+
+
+def _tech_resolves(tech: str, known: Set[str]) -> bool:
+    upper = tech.upper()
+    return tech in known or upper in known or f"TECH_{upper}" in known
+
+
+def validate_specs(specs: List[Dict[str, Any]], known_tech: Set[str] | None = None) -> List[str]:
+    """Return one message per problem; an empty list means the schema is valid."""
+    errors: List[str] = []
+    ids = [str(spec.get("id", "")) for spec in specs]
+    id_set = set(ids)
+    seen: Set[str] = set()
+    for stat_id in ids:
+        if stat_id in seen:
+            errors.append(f"{stat_id}: duplicate stat id")
+        seen.add(stat_id)
+
+    for spec in specs:
+        stat_id = str(spec.get("id", ""))
+        where = f"{stat_id} ({spec.get('_path', '?')})"
+        if not stat_id:
+            errors.append(f"{where}: missing id")
+        bounds = spec.get("range")
+        if not (isinstance(bounds, list) and len(bounds) == 2 and all(_is_number(v) for v in bounds)):
+            errors.append(f"{where}: range must be [lo, hi]")
+            continue
+        lo, hi = float(bounds[0]), float(bounds[1])
+        if lo >= hi:
+            errors.append(f"{where}: range lo {lo:g} >= hi {hi:g}")
+        default = spec.get("default", lo)
+        if not _is_number(default) or not lo <= float(default) <= hi:
+            errors.append(f"{where}: default {default!r} outside range")
+
+        for idx, affect in enumerate(spec.get("affects", []) or []):
+            label = f"{where}: affects[{idx}]"
+            if str(affect.get("evaluator", "CURVE")) != "CURVE":
+                errors.append(f"{label}: unsupported evaluator {affect.get('evaluator')!r}")
+                continue
+            curve = str(affect.get("curve", ""))
+            if curve not in CURVE_PARAMS:
+                errors.append(f"{label}: unknown curve {curve!r}")
+                continue
+            if not affect.get("target"):
+                errors.append(f"{label}: missing target")
+            if str(affect.get("direction", "positive")) not in ("positive", "negative"):
+                errors.append(f"{label}: unknown direction {affect.get('direction')!r}")
+            params = affect.get("params") or {}
+            for name in CURVE_PARAMS[curve]:
+                if name not in params:
+                    errors.append(f"{label}: {curve} missing param {name}")
+            zone = params.get("flat_zone")
+            if zone is not None and not (
+                isinstance(zone, list) and len(zone) == 2 and lo <= zone[0] <= zone[1] <= hi
+            ):
+                errors.append(f"{label}: flat_zone {zone!r} must be [a, b] inside the range")
+            threshold = params.get("threshold")
+            if threshold is not None and (not _is_number(threshold) or not lo <= threshold <= hi):
+                errors.append(f"{label}: threshold {threshold!r} outside range")
+
+        for idx, item in enumerate(spec.get("thresholds", []) or []):
+            label = f"{where}: thresholds[{idx}]"
+            if str(item.get("direction", "")) not in ("above", "below"):
+                errors.append(f"{label}: unknown direction {item.get('direction')!r}")
+            value = item.get("value")
+            if not _is_number(value) or not lo <= value <= hi:
+                errors.append(f"{label}: value {value!r} outside range")
+            if not _is_number(item.get("hysteresis", 0)) or item.get("hysteresis", 0) < 0:
+                errors.append(f"{label}: hysteresis must be a non-negative number")
+
+        growth = spec.get("growth") or {}
+        growth_type = str(growth.get("type", ""))
+        params = growth.get("params") or {}
+        if growth_type not in GROWTH_TYPES:
+            errors.append(f"{where}: unknown growth type {growth_type!r}")
+        elif growth_type == "COMPOSITE":
+            inputs = params.get("inputs") or []
+            if not inputs:
+                errors.append(f"{where}: COMPOSITE without inputs")
+            for item in inputs:
+                if str(item.get("stat_id", "")) not in id_set:
+                    errors.append(f"{where}: COMPOSITE input {item.get('stat_id')!r} is not a stat id")
+        elif growth_type == "SCURVE":
+            breakpoints = params.get("phase_breakpoints") or []
+            if len(params.get("phase_speeds") or []) != len(breakpoints) + 1:
+                errors.append(f"{where}: SCURVE needs len(phase_speeds) == len(phase_breakpoints) + 1")
+            if breakpoints != sorted(breakpoints):
+                errors.append(f"{where}: SCURVE phase_breakpoints must be ascending")
+        elif growth_type == "LOG_DIMINISHING":
+            breakpoints = params.get("level_breakpoints") or []
+            if len(params.get("breakpoint_multipliers") or []) != len(breakpoints) + 1:
+                errors.append(
+                    f"{where}: LOG_DIMINISHING needs len(breakpoint_multipliers) == len(level_breakpoints) + 1"
+                )
+            for name in ("base_xp", "exponent"):
+                if not _is_number(params.get(name)):
+                    errors.append(f"{where}: LOG_DIMINISHING missing param {name}")
+            talent_key = str(growth.get("talent_key", ""))
+            if talent_key not in id_set:
+                errors.append(f"{where}: talent_key {talent_key!r} is not a stat id")
+            ceiling_map = growth.get("talent_ceiling_map") or {}
+            if not ceiling_map:
+                errors.append(f"{where}: talent_ceiling_map is empty")
+            for key, level in ceiling_map.items():
+                try:
+                    float(key)
+                except ValueError:
+                    errors.append(f"{where}: talent_ceiling_map key {key!r} is not numeric")
+                if not _is_number(level) or not lo <= level <= hi:
+                    errors.append(f"{where}: talent_ceiling_map level {level!r} outside range")
+
+        tech = spec.get("required_tech")
+        if tech is not None and known_tech is not None and not _tech_resolves(str(tech), known_tech):
+            errors.append(f"{where}: required_tech {tech!r} does not match a TECH_* or era id")
+        for item in spec.get("prerequisites", []) or []:
+            skill_id = str(item.get("skill_id", ""))
+            if skill_id not in id_set:
+                errors.append(f"{where}: prerequisite {skill_id!r} is not a stat id")
+    return errors
+
+
+def _numeric_sections(specs: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    index = {str(spec["id"]): idx for idx, spec in enumerate(specs)}
+    thr_row: List[int] = []
+    thr_value: List[float] = []
+    thr_above: List[int] = []
+    thr_hysteresis: List[float] = []
+    composite_row: List[int] = []
+    composite_input: List[int] = []
+    composite_weight: List[float] = []
+    skill_row: List[int] = []
+    talent_row: List[int] = []
+    for row, spec in enumerate(specs):
+        for item in spec.get("thresholds", []) or []:
+            thr_row.append(row)
+            thr_value.append(float(item["value"]))
+            thr_above.append(1 if item.get("direction") == "above" else 0)
+            thr_hysteresis.append(float(item.get("hysteresis", 0.0)))
+        growth = spec.get("growth") or {}
+        if growth.get("type") == "COMPOSITE":
+            for item in growth.get("params", {}).get("inputs", []):
+                composite_row.append(row)
+                composite_input.append(index[str(item["stat_id"])])
+                composite_weight.append(float(item.get("weight", 0.0)))
+        if growth.get("type") == "LOG_DIMINISHING":
+            skill_row.append(row)
+            talent_row.append(index[str(growth["talent_key"])])
+    return {
+        "range_lo": np.array([float(spec["range"][0]) for spec in specs]),
+        "range_hi": np.array([float(spec["range"][1]) for spec in specs]),
+        "default": np.array([float(spec.get("default", 0)) for spec in specs]),
+        "thr_row": np.array(thr_row, dtype="<i4"),
+        "thr_value": np.array(thr_value),
+        "thr_above": np.array(thr_above, dtype="u1"),
+        "thr_hysteresis": np.array(thr_hysteresis),
+        "composite_row": np.array(composite_row, dtype="<i4"),
+        "composite_input": np.array(composite_input, dtype="<i4"),
+        "composite_weight": np.array(composite_weight),
+        "skill_row": np.array(skill_row, dtype="<i4"),
+        "talent_row": np.array(talent_row, dtype="<i4"),
+    }
+
+
+def encode_bundle(
+    specs: List[Dict[str, Any]],
+    sources: List[List[Any]],
+    content_hash: bytes,
+) -> bytes:
+    specs = sorted(specs, key=lambda spec: str(spec["id"]))
+    sections: List[Tuple[str, str, bytes]] = [
+        ("ids", "|S1", "\n".join(str(spec["id"]) for spec in specs).encode("utf-8")),
+        ("specs", "|S1", json.dumps(specs, ensure_ascii=False, separators=(",", ":")).encode("utf-8")),
+        ("sources", "|S1", json.dumps(sources, separators=(",", ":")).encode("utf-8")),
+    ]
+    for name, array in _numeric_sections(specs).items():
+        array = array.astype(array.dtype.newbyteorder("<"))
+        sections.append((name, array.dtype.str, array.tobytes()))
+
+    offset = HEADER.size + SECTION.size * len(sections)
+    table = bytearray()
+    payload = bytearray()
+    for name, dtype, data in sections:
+        pad = (-(offset + len(payload))) % 8
+        payload += b"\0" * pad
+        table += SECTION.pack(
+            name.encode("ascii"), dtype.encode("ascii"), offset + len(payload), len(data)
+        )
+        payload += data
+    header = HEADER.pack(MAGIC, BUNDLE_VERSION, content_hash, len(sections))
+    return header + bytes(table) + bytes(payload)
+
+
+class StatBundle:
+    """Decoded bundle; arrays are zero-copy views into the single read buffer."""
+
+    def __init__(self, data: bytes) -> None:
+        if len(data) < HEADER.size:
+            raise ValueError("not a stat schema bundle")
+        magic, version, self.content_hash, count = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != BUNDLE_VERSION:
+            raise ValueError(f"unsupported stat schema bundle (magic={magic!r} version={version})")
+        self.arrays: Dict[str, np.ndarray] = {}
+        raw: Dict[str, bytes] = {}
+        for idx in range(count):
+            name, dtype, offset, size = SECTION.unpack_from(data, HEADER.size + idx * SECTION.size)
+            key = name.rstrip(b"\0").decode("ascii")
+            if offset + size > len(data):
+                raise ValueError(f"truncated stat schema bundle section {key}")
+            dtype_str = dtype.rstrip(b"\0").decode("ascii")
+            if dtype_str == "|S1":
+                raw[key] = data[offset : offset + size]
+            else:
+                item_dtype = np.dtype(dtype_str)
+                self.arrays[key] = np.frombuffer(
+                    data, dtype=item_dtype, count=size // item_dtype.itemsize, offset=offset
+                )
+        self.ids: List[str] = raw["ids"].decode("utf-8").split("\n") if raw.get("ids") else []
+        self.specs: List[Dict[str, Any]] = json.loads(raw["specs"].decode("utf-8"))
+        self.sources: List[List[Any]] = json.loads(raw["sources"].decode("utf-8"))
+
+    @classmethod
+    def read(cls, path: Path) -> "StatBundle":
+        return cls(Path(path).read_bytes())
+
+
+def _write_bundle(path: Path, payload: bytes) -> None:
+    """Temp file + fsync + rename, as localization_compile.py writes its outputs;
+    the pid in the temp name keeps concurrent compiles from sharing it."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_path.open("wb") as fp:
+            fp.write(payload)
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def compile_bundle(
+    project_root: Path,
+    bundle_path: Path | None = None,
+) -> Tuple[StatBundle | None, List[str]]:
+    """Validate stats/ and (when valid) write the bundle; returns (bundle, errors)."""
+    stats_root = project_root / "stats"
+    paths = _source_paths(stats_root)
+    sources = _source_stats(stats_root, paths)
+    blobs = _read_sources(stats_root, paths)
+    specs = specs_from_sources(blobs)
+    errors = validate_specs(specs, load_known_tech_ids(project_root))
+    if errors:
+        return None, errors
+    payload = encode_bundle(specs, sources, _content_hash(blobs))
+    _write_bundle(bundle_path or project_root / DEFAULT_BUNDLE_PATH, payload)
+    return StatBundle(payload), []
+
+
+def load_bundle(project_root: Path, bundle_path: Path | None = None) -> StatBundle:
+    """Bundle for the current stats/ tree, recompiling it when missing or stale."""
+    project_root = Path(project_root)
+    stats_root = project_root / "stats"
+    path = bundle_path or project_root / DEFAULT_BUNDLE_PATH
+    bundle: StatBundle | None = None
+    if path.exists():
+        try:
+            bundle = StatBundle.read(path)
+        except (ValueError, KeyError, json.JSONDecodeError):
+            bundle = None
+    if bundle is not None:
+        paths = _source_paths(stats_root)
+        sources = _source_stats(stats_root, paths)
+        if sources == bundle.sources:
+            return bundle
+        if _content_hash(_read_sources(stats_root, paths)) == bundle.content_hash:
+            # Touched but unchanged: refresh size/mtime so the next load is stat-only.
+            payload = encode_bundle(bundle.specs, sources, bundle.content_hash)
+            _write_bundle(path, payload)
+            return StatBundle(payload)
+    bundle, errors = compile_bundle(project_root, path)
+    if bundle is None:
+        raise ValueError("invalid stat specs:\n  " + "\n  ".join(errors))
+    return bundle
+
+
+def load_schema(project_root: Path, bundle_path: Path | None = None) -> StatSchema:
+    return StatSchema.from_bundle(load_bundle(project_root, bundle_path))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--project-root", default=".", help="WorldSim project root")
+    parser.add_argument("--bundle", default="", help=f"bundle path (default: {DEFAULT_BUNDLE_PATH})")
+    parser.add_argument("--check", action="store_true", help="validate only, do not write the bundle")
+    args = parser.parse_args()
+
+    project_root = Path(args.project_root).resolve()
+    bundle_path = Path(args.bundle).resolve() if args.bundle else project_root / DEFAULT_BUNDLE_PATH
+    if args.check:
+        specs = StatSchema.load(project_root, use_bundle=False).specs
+        errors = validate_specs(specs, load_known_tech_ids(project_root))
+        for error in errors:
+            print(f"[stat_bundle] {error}", file=sys.stderr)
+        print(f"[stat_bundle] stats={len(specs)} errors={len(errors)}")
+        return 1 if errors else 0
+
+    started = time.perf_counter()
+    bundle, errors = compile_bundle(project_root, bundle_path)
+    compile_ms = (time.perf_counter() - started) * 1000.0
+    for error in errors:
+        print(f"[stat_bundle] {error}", file=sys.stderr)
+    if bundle is None:
+        print(f"[stat_bundle] errors={len(errors)} bundle not written")
+        return 1
+    started = time.perf_counter()
+    load_bundle(project_root, bundle_path)
+    load_ms = (time.perf_counter() - started) * 1000.0
+    print(
+        f"[stat_bundle] stats={len(bundle.ids)} thresholds={len(bundle.arrays['thr_row'])} "
+        f"bytes={bundle_path.stat().st_size} compile_ms={compile_ms:.1f} load_ms={load_ms:.1f} "
+        f"hash={bundle.content_hash.hex()[:12]} -> {bundle_path}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""Batched evaluator for `affects` CURVE entries in the stats/ schema.
+
+Each stat spec lists affects such as
+  {"target": "stress_continuous_input", "evaluator": "CURVE",
+   "curve": "THRESHOLD_POWER", "params": {...}, "weight": 1.0,
+   "direction": "negative"}
+StatCurveEvaluator loads every spec once, groups the affects by curve type and
+evaluates a whole population matrix (agents x stats, raw stat values) with one
+vectorized call per curve type. Contributions are weight * curve(value),
+negated for direction "negative", and summed per target.
+
+Curve shapes (v = raw stat value, [lo, hi] = stat range); the expectations in
+tests/test_stat_curve.gd hold for these definitions:
+  LINEAR           (v - lo) / (hi - lo)
+  POWER            ((v - lo) / (hi - lo)) ** exponent
+  THRESHOLD_POWER  max_output * ((threshold - v) / threshold) ** exponent below
+                   threshold, 0 at or above it
+  STEP_LINEAR      0 up to threshold, then linear up to max_output at hi
+  SIGMOID_EXTREME  1.0 inside flat_zone, smoothstep towards pole_multiplier
+                   above it and towards 1 / pole_multiplier below it
+
+scurve_speed() and log_xp_required() are the growth-side helpers of the same
+GDScript StatCurve API (used by stat_growth_sim.py).
+
+With use_lut=True the POWER, THRESHOLD_POWER and SIGMOID_EXTREME groups are
+tabulated over the integer domain [lo, hi] of each stat when the evaluator is
+built, and evaluation rounds each value to the nearest integer and gathers
+from the table. Stat values are integers in game, so the tables are exact
+there; lut_error_report() measures the worst deviation from the analytic curve
+for integer and for fractional inputs.
+
+Usage:
+  python3 tools/stat_curves.py --project-root . --agents 100000
+  python3 tools/stat_curves.py --project-root . --agents 100000 --lut
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from stat_schema import StatSchema
+
+CURVE_TYPES: tuple[str, ...] = (
+    "LINEAR",
+    "POWER",
+    "THRESHOLD_POWER",
+    "STEP_LINEAR",
+    "SIGMOID_EXTREME",
+)
+
+# Curves whose per-value cost (pow, division chains) is worth a table gather.
+LUT_CURVES: tuple[str, ...] = ("POWER", "THRESHOLD_POWER", "SIGMOID_EXTREME")
+
+
+def linear(v: Any, lo: Any, hi: Any) -> np.ndarray:
+    span = np.maximum(np.asarray(hi, dtype=float) - lo, 1e-9)
+    return np.clip((np.asarray(v, dtype=float) - lo) / span, 0.0, 1.0)
+
+
+def power_influence(v: Any, lo: Any, hi: Any, exponent: Any) -> np.ndarray:
+    return linear(v, lo, hi) ** exponent
+
+
+def threshold_power(v: Any, threshold: Any, exponent: Any, max_output: Any) -> np.ndarray:
+    threshold = np.maximum(np.asarray(threshold, dtype=float), 1e-9)
+    deficit = np.clip((threshold - np.asarray(v, dtype=float)) / threshold, 0.0, 1.0)
+    return max_output * deficit**exponent
+
+
+def step_linear(v: Any, hi: Any, threshold: Any, max_output: Any) -> np.ndarray:
+    span = np.maximum(np.asarray(hi, dtype=float) - threshold, 1e-9)
+    return max_output * np.clip((np.asarray(v, dtype=float) - threshold) / span, 0.0, 1.0)
+
+
+def _smoothstep(t: np.ndarray) -> np.ndarray:
+    return t * t * (3.0 - 2.0 * t)
+
+
+def sigmoid_extreme(
+    v: Any,
+    lo: Any,
+    hi: Any,
+    flat_lo: Any,
+    flat_hi: Any,
+    pole_multiplier: Any,
+) -> np.ndarray:
+    v = np.asarray(v, dtype=float)
+    upper = _smoothstep(np.clip((v - flat_hi) / np.maximum(hi - flat_hi, 1e-9), 0.0, 1.0))
+    lower = _smoothstep(np.clip((flat_lo - v) / np.maximum(flat_lo - lo, 1e-9), 0.0, 1.0))
+    boost = 1.0 + (pole_multiplier - 1.0) * upper
+    damp = 1.0 / (1.0 + (pole_multiplier - 1.0) * lower)
+    return np.where(v > flat_hi, boost, np.where(v < flat_lo, damp, 1.0))
+
+
+def scurve_speed(v: Any, phase_breakpoints: Any, phase_speeds: Any) -> np.ndarray:
+    """SCURVE growth speed multiplier for the phase `v` falls in."""
+    return np.asarray(phase_speeds, dtype=float)[
+        np.searchsorted(np.asarray(phase_breakpoints, dtype=float), v, side="right")
+    ]
+
+
+def log_xp_required(
+    level: Any,
+    base_xp: float,
+    exponent: float,
+    level_breakpoints: Any,
+    breakpoint_multipliers: Any,
+) -> np.ndarray:
+    """XP needed to go from `level - 1` to `level` under LOG_DIMINISHING growth."""
+    level = np.asarray(level, dtype=float)
+    bucket = np.searchsorted(np.asarray(level_breakpoints, dtype=float), level, side="left")
+    return base_xp * level**exponent * np.asarray(breakpoint_multipliers, dtype=float)[bucket]
+
+
+def _column(values: List[float]) -> np.ndarray:
+    return np.array(values, dtype=float).reshape(-1, 1)
+
+
+class _CurveGroup:
+    """All affects of one curve type, ordered by target for segment sums.
+
+    Parameter arrays are (k, 1) columns so they broadcast over a stats-major
+    (k, agents) slice of the population.
+    """
+
+    def __init__(self, curve: str, affects: List[Dict[str, Any]], target_index: Dict[str, int]) -> None:
+        affects = sorted(affects, key=lambda item: target_index[item["target"]])
+        self.curve = curve
+        self.affects = affects
+        self.columns = np.array([item["column"] for item in affects], dtype=np.intp)
+        self.lo = _column([item["lo"] for item in affects])
+        self.hi = _column([item["hi"] for item in affects])
+        self.coeff = _column([item["coeff"] for item in affects])
+        targets = np.array([target_index[item["target"]] for item in affects], dtype=np.intp)
+        # Split into layers whose targets are unique, so each layer is a
+        # plain fancy-index add: layer j holds the j-th affect of every target.
+        starts = np.flatnonzero(np.r_[True, targets[1:] != targets[:-1]])
+        rank = np.arange(len(targets)) - np.repeat(starts, np.diff(np.r_[starts, len(targets)]))
+        self.layers: List[Tuple[np.ndarray, np.ndarray]] = [
+            (np.flatnonzero(rank == j), targets[rank == j]) for j in range(int(rank.max()) + 1)
+        ]
+
+        def param(name: str, default: float) -> np.ndarray:
+            return _column([float(item["params"].get(name, default)) for item in affects])
+
+        self.params: Dict[str, np.ndarray] = {}
+        if curve == "POWER":
+            self.params["exponent"] = param("exponent", 1.0)
+        elif curve == "THRESHOLD_POWER":
+            self.params["threshold"] = param("threshold", 0.0)
+            self.params["exponent"] = param("exponent", 1.0)
+            self.params["max_output"] = param("max_output", 1.0)
+        elif curve == "STEP_LINEAR":
+            self.params["threshold"] = param("threshold", 0.0)
+            self.params["max_output"] = param("max_output", 1.0)
+        elif curve == "SIGMOID_EXTREME":
+            flat = [item["params"].get("flat_zone", [item["lo"], item["hi"]]) for item in affects]
+            self.params["flat_lo"] = _column([float(pair[0]) for pair in flat])
+            self.params["flat_hi"] = _column([float(pair[1]) for pair in flat])
+            self.params["pole_multiplier"] = param("pole_multiplier", 1.0)
+        self.lut: np.ndarray | None = None
+
+    def build_lut(self) -> None:
+        """Tabulate every affect over its integer domain into one padded (k, width) table.
+
+        Row i holds curve(lo_i + j) for j = 0..hi_i - lo_i; the padding repeats
+        the value at hi_i and is never read because indices are clipped.
+        """
+        if not (np.all(self.lo == np.rint(self.lo)) and np.all(self.hi == np.rint(self.hi))):
+            raise ValueError(f"{self.curve}: lookup tables need integer stat ranges")
+        self.lut_span = (self.hi - self.lo).astype(np.intp)
+        width = int(self.lut_span.max()) + 1
+        grid = np.minimum(self.lo + np.arange(width, dtype=float), self.hi)
+        self.lut = np.ascontiguousarray(self.analytic_values(grid))
+        self.lut_base = (np.arange(len(self.affects), dtype=np.intp) * width).reshape(-1, 1)
+
+    def lut_values(self, raw: np.ndarray) -> np.ndarray:
+        index = np.rint(raw - self.lo)
+        np.clip(index, 0, self.lut_span, out=index)
+        flat = index.astype(np.intp)
+        flat += self.lut_base
+        return np.take(self.lut, flat)
+
+    def curve_values(self, raw: np.ndarray) -> np.ndarray:
+        if self.lut is not None:
+            return self.lut_values(raw)
+        return self.analytic_values(raw)
+
+    def analytic_values(self, raw: np.ndarray) -> np.ndarray:
+        p = self.params
+        if self.curve == "LINEAR":
+            return linear(raw, self.lo, self.hi)
+        if self.curve == "POWER":
+            return power_influence(raw, self.lo, self.hi, p["exponent"])
+        if self.curve == "THRESHOLD_POWER":
+            return threshold_power(raw, p["threshold"], p["exponent"], p["max_output"])
+        if self.curve == "STEP_LINEAR":
+            return step_linear(raw, self.hi, p["threshold"], p["max_output"])
+        return sigmoid_extreme(
+            raw, self.lo, self.hi, p["flat_lo"], p["flat_hi"], p["pole_multiplier"]
+        )
+
+
+class StatCurveEvaluator:
+    def __init__(self, schema: StatSchema, use_lut: bool = False) -> None:
+        self.schema = schema
+        self.use_lut = use_lut
+        affects: List[Dict[str, Any]] = []
+        for column, spec in enumerate(schema.specs):
+            for raw in spec.get("affects", []):
+                evaluator = str(raw.get("evaluator", "CURVE"))
+                curve = str(raw.get("curve", ""))
+                if evaluator != "CURVE" or curve not in CURVE_TYPES:
+                    raise ValueError(
+                        f"{spec['id']}: unsupported affect evaluator={evaluator} curve={curve}"
+                    )
+                sign = -1.0 if str(raw.get("direction", "positive")) == "negative" else 1.0
+                affects.append(
+                    {
+                        "stat_id": spec["id"],
+                        "column": column,
+                        "target": str(raw["target"]),
+                        "context": str(raw.get("context", "")),
+                        "curve": curve,
+                        "params": dict(raw.get("params") or {}),
+                        "coeff": float(raw.get("weight", 1.0)) * sign,
+                        "lo": float(schema.range_lo[column]),
+                        "hi": float(schema.range_hi[column]),
+                    }
+                )
+        self.affects = affects
+        self.targets: List[str] = sorted({item["target"] for item in affects})
+        self.target_index: Dict[str, int] = {t: idx for idx, t in enumerate(self.targets)}
+        self.groups: Dict[str, _CurveGroup] = {}
+        for curve in CURVE_TYPES:
+            members = [item for item in affects if item["curve"] == curve]
+            if members:
+                self.groups[curve] = _CurveGroup(curve, members, self.target_index)
+                if use_lut and curve in LUT_CURVES:
+                    self.groups[curve].build_lut()
+
+    @classmethod
+    def load(cls, project_root: Path, use_lut: bool = False) -> "StatCurveEvaluator":
+        return cls(StatSchema.load(project_root), use_lut=use_lut)
+
+    def lut_error_report(self, samples_per_step: int = 16) -> List[Dict[str, Any]]:
+        """Worst |lut - analytic| per tabulated affect, sorted by error.
+
+        `integer_error` is measured on the integer domain the tables cover;
+        `max_error` also samples `samples_per_step` fractional points per unit
+        step (the rounding error for non-integer inputs) and `at` is where it
+        occurs. Errors are in curve units, before weight and direction.
+        """
+        report: List[Dict[str, Any]] = []
+        offsets = np.arange(samples_per_step, dtype=float) / samples_per_step
+        for group in self.groups.values():
+            if group.lut is None:
+                continue
+            width = group.lut.shape[1]
+            integer_grid = np.minimum(group.lo + np.arange(width, dtype=float), group.hi)
+            integer_error = np.abs(group.lut_values(integer_grid) - group.analytic_values(integer_grid))
+            fine = (np.arange(width, dtype=float)[:, None] + offsets).ravel()
+            fine_grid = np.minimum(group.lo + fine, group.hi)
+            fine_error = np.abs(group.lut_values(fine_grid) - group.analytic_values(fine_grid))
+            worst = fine_error.argmax(axis=1)
+            for i, affect in enumerate(group.affects):
+                report.append(
+                    {
+                        "stat_id": affect["stat_id"],
+                        "target": affect["target"],
+                        "curve": group.curve,
+                        "entries": int(group.lut_span[i, 0]) + 1,
+                        "integer_error": float(integer_error[i].max()),
+                        "max_error": float(fine_error[i, worst[i]]),
+                        "at": float(fine_grid[i, worst[i]]),
+                    }
+                )
+        report.sort(key=lambda item: -item["max_error"])
+        return report
+
+    def evaluate(self, values: np.ndarray) -> np.ndarray:
+        """values: (agents, stats) raw stat matrix -> (agents, targets) sums."""
+        values = np.asarray(values, dtype=float)
+        if values.ndim != 2:
+            raise ValueError(f"expected (agents, stats) matrix, got {values.shape}")
+        return self.evaluate_stats_major(np.ascontiguousarray(values.T)).T
+
+    def evaluate_stats_major(self, values: np.ndarray) -> np.ndarray:
+        """values: (stats, agents) struct-of-arrays -> (targets, agents) sums.
+
+        Gathering whole rows of a stats-major array is much cheaper than
+        gathering strided columns, so simulators that keep state stats-major
+        should call this directly.
+        """
+        values = np.asarray(values, dtype=float)
+        if values.ndim != 2 or values.shape[0] != len(self.schema):
+            raise ValueError(
+                f"expected ({len(self.schema)}, agents) stat matrix, got {values.shape}"
+            )
+        out = np.zeros((len(self.targets), values.shape[1]))
+        for group in self.groups.values():
+            contrib = group.curve_values(values[group.columns])
+            contrib *= group.coeff
+            for rows, targets in group.layers:
+                out[targets] += contrib[rows]
+        return out
+
+    def evaluate_by_target(self, values: np.ndarray) -> Dict[str, np.ndarray]:
+        out = self.evaluate(values)
+        return {target: out[:, idx] for target, idx in self.target_index.items()}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--project-root", default=".", help="WorldSim project root")
+    parser.add_argument("--agents", type=int, default=100000, help="synthetic population size")
+    parser.add_argument("--seed", type=int, default=0, help="population seed")
+    parser.add_argument(
+        "--spread",
+        type=float,
+        default=0.2,
+        help="population sd around each default, as a fraction of the stat range",
+    )
+    parser.add_argument(
+        "--lut",
+        action="store_true",
+        help="evaluate POWER/THRESHOLD_POWER/SIGMOID_EXTREME through integer-domain lookup tables",
+    )
+    parser.add_argument("--report-json", default="", help="optional per-target summary json")
+    args = parser.parse_args()
+
+    project_root = Path(args.project_root).resolve()
+    evaluator = StatCurveEvaluator.load(project_root, use_lut=args.lut)
+    population = evaluator.schema.random_population(args.agents, seed=args.seed, spread=args.spread)
+
+    started = time.perf_counter()
+    out = evaluator.evaluate(population)
+    elapsed_ms = (time.perf_counter() - started) * 1000.0
+    print(
+        f"[stat_curves] stats={len(evaluator.schema)} affects={len(evaluator.affects)} "
+        f"targets={len(evaluator.targets)} agents={args.agents} evaluate_ms={elapsed_ms:.1f}"
+        f"{' lut' if args.lut else ''}"
+    )
+    lut_report: List[Dict[str, Any]] = []
+    if args.lut:
+        lut_report = evaluator.lut_error_report()
+        tables = [group for group in evaluator.groups.values() if group.lut is not None]
+        rounded = np.rint(population)
+        analytic = StatCurveEvaluator(evaluator.schema).evaluate(rounded)
+        print(
+            f"[stat_curves] lut tables={sum(len(g.affects) for g in tables)} "
+            f"bytes={sum(g.lut.nbytes for g in tables)} "
+            f"integer_max_error={max(item['integer_error'] for item in lut_report):.3g} "
+            f"fractional_max_error={lut_report[0]['max_error']:.3g} "
+            f"population_max_error={float(np.abs(out - analytic).max()):.3g}"
+        )
+        for item in lut_report[:5]:
+            print(
+                f"  {item['stat_id']} -> {item['target']} ({item['curve']}): "
+                f"max_error={item['max_error']:.4g} at={item['at']:g}"
+            )
+    summary: Dict[str, Dict[str, float]] = {}
+    for target, idx in evaluator.target_index.items():
+        column = out[:, idx]
+        summary[target] = {
+            "mean": float(column.mean()),
+            "p05": float(np.percentile(column, 5)),
+            "p95": float(np.percentile(column, 95)),
+        }
+    for target in sorted(summary, key=lambda t: -abs(summary[t]["mean"]))[:15]:
+        item = summary[target]
+        print(
+            f"  {target}: mean={item['mean']:.3f} p05={item['p05']:.3f} p95={item['p95']:.3f}"
+        )
+    if args.report_json:
+        out_path = (project_root / args.report_json).resolve()
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        with out_path.open("w", encoding="utf-8") as fp:
+            json.dump(
+                {"agents": args.agents, "seed": args.seed, "targets": summary, "lut_errors": lut_report},
+                fp,
+                indent=2,
+            )
+            fp.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
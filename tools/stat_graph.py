@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""Compiled dependency graph for COMPOSITE (derived) stats.
+
+Specs under stats/derived/ declare
+  "growth": {"type": "COMPOSITE",
+             "params": {"inputs": [{"stat_id": "HEXACO_X", "weight": 0.35}, ...],
+                        "formula": "WEIGHTED_AVERAGE"}}
+StatGraph compiles every composite into topological levels (level 0 = all
+non-composite stats) and folds each level's weights into one sparse matrix, so
+the derived stats of N agents are recomputed with one sparse mat-mul per level.
+Cycles and unknown input ids are rejected at compile time.
+
+WEIGHTED_AVERAGE works on range-normalized inputs: x = (v - lo) / (hi - lo).
+A negative weight contributes |w| * (1 - x), and the sum is divided by
+sum(|w|), so the result stays inside the derived stat's own range even when
+the weights do not add up to 1 (DERIVED_RISK_TOLERANCE sums to -0.1).
+
+State is stats-major, (stats, agents), like StatCurveEvaluator.evaluate_stats_major.
+
+Usage:
+  python3 tools/stat_graph.py --project-root . --agents 100000 --changed EMOTION_JOY
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Set
+
+import numpy as np
+from scipy import sparse
+
+from stat_schema import StatSchema
+
+SUPPORTED_FORMULAS = ("WEIGHTED_AVERAGE",)
+
+
+class _Level:
+    """One topological level: rows, their (rows x stats) weights and offsets."""
+
+    def __init__(
+        self,
+        rows: np.ndarray,
+        matrix: sparse.csr_matrix,
+        offset: np.ndarray,
+        lo: np.ndarray,
+        hi: np.ndarray,
+    ) -> None:
+        self.rows = rows
+        self.matrix = matrix
+        self.offset = offset.reshape(-1, 1)
+        self.lo = lo.reshape(-1, 1)
+        self.hi = hi.reshape(-1, 1)
+
+
+class StatGraph:
+    def __init__(self, schema: StatSchema) -> None:
+        self.schema = schema
+        n = len(schema)
+        self.inputs: Dict[int, List[int]] = {}
+        self.dependents: Dict[int, List[int]] = {}
+        weights: Dict[int, List[float]] = {}
+        for row, spec in enumerate(schema.specs):
+            growth = spec.get("growth", {})
+            if growth.get("type") != "COMPOSITE":
+                continue
+            params = growth.get("params", {})
+            formula = str(params.get("formula", "WEIGHTED_AVERAGE"))
+            if formula not in SUPPORTED_FORMULAS:
+                raise ValueError(f"{spec['id']}: unsupported COMPOSITE formula {formula}")
+            columns: List[int] = []
+            for item in params.get("inputs", []):
+                stat_id = str(item.get("stat_id", ""))
+                if stat_id not in schema.index:
+                    raise ValueError(f"{spec['id']}: unknown input stat_id {stat_id}")
+                columns.append(schema.index[stat_id])
+                weights.setdefault(row, []).append(float(item.get("weight", 0.0)))
+            if not columns or sum(abs(w) for w in weights[row]) <= 0.0:
+                raise ValueError(f"{spec['id']}: COMPOSITE needs at least one non-zero input weight")
+            self.inputs[row] = columns
+            for column in columns:
+                self.dependents.setdefault(column, []).append(row)
+
+        self.level_of = np.zeros(n, dtype=np.intp)
+        self.levels: List[_Level] = []
+        for depth, rows in enumerate(self._topological_levels(), start=1):
+            self.level_of[rows] = depth
+            self.levels.append(self._compile_level(np.array(rows, dtype=np.intp), weights))
+        self.eval_order: List[str] = [schema.ids[idx] for idx in np.argsort(self.level_of, kind="stable")]
+
+    @classmethod
+    def load(cls, project_root: Path) -> "StatGraph":
+        return cls(StatSchema.load(project_root))
+
+    def _topological_levels(self) -> List[List[int]]:
+        """Kahn's algorithm over composite nodes, grouped by longest input path."""
+        pending = {row: sum(1 for col in cols if col in self.inputs) for row, cols in self.inputs.items()}
+        ready = sorted(row for row, count in pending.items() if count == 0)
+        levels: List[List[int]] = []
+        while ready:
+            levels.append(ready)
+            next_ready: List[int] = []
+            for row in ready:
+                del pending[row]
+                for dependent in self.dependents.get(row, []):
+                    pending[dependent] -= 1
+                    if pending[dependent] == 0:
+                        next_ready.append(dependent)
+            ready = sorted(next_ready)
+        if pending:
+            cycle = ", ".join(sorted(self.schema.ids[row] for row in pending))
+            raise ValueError(f"COMPOSITE dependency cycle among: {cycle}")
+        return levels
+
+    def _compile_level(self, rows: np.ndarray, weights: Dict[int, List[float]]) -> _Level:
+        schema = self.schema
+        span = np.maximum(schema.range_hi - schema.range_lo, 1e-9)
+        data: List[float] = []
+        indices: List[int] = []
+        indptr = [0]
+        offset = np.zeros(len(rows))
+        for local, row in enumerate(rows):
+            row_weights = weights[row]
+            total = sum(abs(w) for w in row_weights)
+            out_span = span[row]
+            # lo + out_span * sum(|w| * x') / total, with x' = x or 1 - x.
+            constant = 0.0
+            for column, weight in zip(self.inputs[row], row_weights):
+                coeff = weight / (total * span[column])
+                constant -= coeff * schema.range_lo[column]
+                if weight < 0.0:
+                    constant += -weight / total
+                indices.append(column)
+                data.append(coeff * out_span)
+            offset[local] = schema.range_lo[row] + constant * out_span
+            indptr.append(len(indices))
+        matrix = sparse.csr_matrix(
+            (np.array(data), np.array(indices, dtype=np.intp), np.array(indptr, dtype=np.intp)),
+            shape=(len(rows), len(schema)),
+        )
+        return _Level(rows, matrix, offset, schema.range_lo[rows], schema.range_hi[rows])
+
+    def _check(self, values: np.ndarray) -> None:
+        if values.ndim != 2 or values.shape[0] != len(self.schema):
+            raise ValueError(
+                f"expected ({len(self.schema)}, agents) stat matrix, got {values.shape}"
+            )
+
+    def recompute(self, values: np.ndarray) -> np.ndarray:
+        """Recompute every derived row of a (stats, agents) array in place."""
+        self._check(values)
+        for level in self.levels:
+            values[level.rows] = np.clip(level.matrix @ values + level.offset, level.lo, level.hi)
+        return values
+
+    def downstream(self, changed: Iterable[str]) -> Set[int]:
+        """Rows of every composite reachable from the changed stat ids."""
+        stack = [self.schema.index[stat_id] for stat_id in changed]
+        seen: Set[int] = set()
+        while stack:
+            for dependent in self.dependents.get(stack.pop(), []):
+                if dependent not in seen:
+                    seen.add(dependent)
+                    stack.append(dependent)
+        return seen
+
+    def recompute_changed(
+        self,
+        values: np.ndarray,
+        changed: Iterable[str],
+        agents: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Recompute only composites downstream of `changed`, optionally for a subset of agents."""
+        self._check(values)
+        affected = self.downstream(changed)
+        if not affected:
+            return values
+        view = values if agents is None else values[:, agents]
+        for level in self.levels:
+            mask = np.isin(level.rows, list(affected))
+            if not mask.any():
+                continue
+            rows = level.rows[mask]
+            view[rows] = np.clip(
+                level.matrix[mask] @ view + level.offset[mask], level.lo[mask], level.hi[mask]
+            )
+        if agents is not None:
+            values[:, agents] = view
+        return values
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--project-root", default=".", help="WorldSim project root")
+    parser.add_argument("--agents", type=int, default=100000, help="synthetic population size")
+    parser.add_argument("--seed", type=int, default=0, help="population seed")
+    parser.add_argument(
+        "--changed",
+        default="EMOTION_JOY",
+        help="comma-separated stat ids for the incremental recompute benchmark",
+    )
+    args = parser.parse_args()
+
+    graph = StatGraph.load(Path(args.project_root).resolve())
+    schema = graph.schema
+    print(
+        f"[stat_graph] stats={len(schema)} composites={len(graph.inputs)} "
+        f"levels={len(graph.levels)} edges={sum(len(v) for v in graph.inputs.values())}"
+    )
+    for depth, level in enumerate(graph.levels, start=1):
+        print(f"  level {depth}: " + ", ".join(schema.ids[row] for row in level.rows))
+
+    values = np.ascontiguousarray(schema.random_population(args.agents, seed=args.seed).T)
+    started = time.perf_counter()
+    graph.recompute(values)
+    full_ms = (time.perf_counter() - started) * 1000.0
+
+    changed = [item.strip() for item in args.changed.split(",") if item.strip()]
+    affected = sorted(schema.ids[row] for row in graph.downstream(changed))
+    started = time.perf_counter()
+    graph.recompute_changed(values, changed)
+    incremental_ms = (time.perf_counter() - started) * 1000.0
+    print(
+        f"[stat_graph] agents={args.agents} full_ms={full_ms:.1f} "
+        f"incremental_ms={incremental_ms:.1f} changed={','.join(changed)} "
+        f"downstream={','.join(affected) or '-'}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
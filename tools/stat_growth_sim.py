@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""Population-scale projection of stat growth models.
+
+Advances every stat of a synthetic population through `growth.type` in
+vectorized time steps, so decay and skill curves can be checked over a whole
+lifetime before the Rust side implements them. All state is struct-of-arrays:
+`values` is (stats, agents) in StatSchema column order, and per-type extras
+(skill XP, emotion decay components) are (k, agents) arrays for that type's
+k stats. Each step is a handful of array ops per growth type.
+
+Growth models (dt in years; z = (HEXACO_<axis> - 500) / 500 in [-1, 1]):
+  SCURVE           random walk with sd scurve_sd * sqrt(dt), scaled by
+                   scurve_speed() of the current phase
+  LOG_DIMINISHING  XP accrues at a per-agent rate; the level is the highest
+                   one whose cumulative log_xp_required() is met, capped by
+                   the talent_ceiling_map bucket of the talent_key stat
+                   (SkillTables lookups)
+  DECAY_NATURAL    -decay_per_year * age_stage_multipliers[stage] * dt
+  DECAY_FAST       excess over a personality baseline (base + scale * z,
+                   clamped to [min, max]) decays as a fast and a slow
+                   exponential component; half_life_adjustment scales both
+                   half-lives by (1 + coeff * z)
+  REGENERATING     +regen_per_year * dt
+  ACCUMULATOR      exponential decay (decay_tau_hours) or linear decay
+                   (decay_per_year) towards the range minimum
+  COMPOSITE        recomputed from its inputs by StatGraph after each step
+  FIXED, EXTERNAL  unchanged
+Event-driven terms (emotion stimuli, personality_sensitivity, opposite,
+stress inputs) need an event stream and are not simulated.
+
+Usage:
+  python3 tools/stat_growth_sim.py --project-root . --agents 50000 --years 100
+  python3 tools/stat_growth_sim.py --project-root . --show NEED_HUNGER,SKILL_HUNTING
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+from skill_tables import SkillTables
+from stat_graph import StatGraph
+from stat_schema import GROWTH_TYPES, StatSchema
+
+AGE_STAGES: tuple[str, ...] = ("infant", "toddler", "child", "teen", "adult", "elder")
+# First age (years) of toddler, child, teen, adult and elder; see
+# docs/design/GAME_BALANCE.md "나이 단계".
+AGE_STAGE_STARTS = np.array([3.0, 6.0, 12.0, 15.0, 56.0])
+# age_stage_multipliers may omit a stage; use the closest stage that is set.
+AGE_STAGE_FALLBACK: Dict[str, tuple[str, ...]] = {
+    "infant": ("infant", "toddler", "child"),
+    "toddler": ("toddler", "child", "infant"),
+    "child": ("child", "toddler"),
+    "teen": ("teen", "child", "adult"),
+    "adult": ("adult",),
+    "elder": ("elder", "adult"),
+}
+HOURS_PER_YEAR = 24.0 * 365.0
+LN2 = float(np.log(2.0))
+
+
+def age_stage_index(age_years: np.ndarray) -> np.ndarray:
+    return np.searchsorted(AGE_STAGE_STARTS, age_years, side="right")
+
+
+def _column(values: List[float]) -> np.ndarray:
+    return np.array(values, dtype=float).reshape(-1, 1)
+
+
+def _params(spec: Dict[str, Any]) -> Dict[str, Any]:
+    return dict(spec.get("growth", {}).get("params") or {})
+
+
+class GrowthSimulator:
+    def __init__(
+        self,
+        schema: StatSchema,
+        agent_count: int,
+        seed: int = 0,
+        start_age: float = 0.0,
+        scurve_sd: float = 15.0,
+        skill_xp_per_year: float = 20000.0,
+    ) -> None:
+        self.schema = schema
+        self.agent_count = agent_count
+        self.rng = np.random.default_rng(seed)
+        self.scurve_sd = scurve_sd
+        self.rows: Dict[str, np.ndarray] = {}
+        for growth_type in GROWTH_TYPES:
+            self.rows[growth_type] = np.array(
+                [idx for idx, stat_id in enumerate(schema.ids) if schema.growth_type(stat_id) == growth_type],
+                dtype=np.intp,
+            )
+        unknown = sorted(
+            f"{stat_id}:{schema.growth_type(stat_id)}"
+            for stat_id in schema.ids
+            if schema.growth_type(stat_id) not in GROWTH_TYPES
+        )
+        if unknown:
+            raise ValueError(f"unsupported growth types: {', '.join(unknown)}")
+
+        self.lo = schema.range_lo.reshape(-1, 1)
+        self.hi = schema.range_hi.reshape(-1, 1)
+        self.values = np.ascontiguousarray(schema.random_population(agent_count, seed=seed).T)
+        self.age_years = np.full(agent_count, float(start_age))
+        self.graph = StatGraph(schema)
+
+        self._init_scurve()
+        self._init_skills(skill_xp_per_year)
+        self._init_decay_natural()
+        self._init_decay_fast()
+        self._init_linear_rates()
+        self.graph.recompute(self.values)
+
+    @classmethod
+    def load(cls, project_root: Path, agent_count: int, **kwargs: Any) -> "GrowthSimulator":
+        return cls(StatSchema.load(project_root), agent_count, **kwargs)
+
+    # -- per-type parameter arrays ----------------------------------------
+
+    def _specs(self, growth_type: str) -> List[Dict[str, Any]]:
+        return [self.schema.specs[row] for row in self.rows[growth_type]]
+
+    def _init_scurve(self) -> None:
+        specs = self._specs("SCURVE")
+        breakpoints = [list(_params(spec).get("phase_breakpoints", [])) for spec in specs]
+        speeds = [list(_params(spec).get("phase_speeds", [1.0])) for spec in specs]
+        width = max([len(item) for item in breakpoints] + [0])
+        # Pad with +inf so every row has the same phase count; speed is then
+        # speeds[0] plus one step per breakpoint already passed.
+        padded_breakpoints = [item + [np.inf] * (width - len(item)) for item in breakpoints]
+        padded_speeds = [item + [item[-1]] * (width + 1 - len(item)) for item in speeds]
+        self.scurve_breakpoints = [_column([item[j] for item in padded_breakpoints]) for j in range(width)]
+        self.scurve_base_speed = _column([item[0] for item in padded_speeds])
+        self.scurve_speed_steps = [
+            _column([item[j + 1] - item[j] for item in padded_speeds]) for j in range(width)
+        ]
+
+    def _init_skills(self, skill_xp_per_year: float) -> None:
+        rows = self.rows["LOG_DIMINISHING"]
+        count = len(rows)
+        self.skills = SkillTables(self.schema)
+        self.skill_xp = np.zeros((count, self.agent_count))
+        self.skill_xp_rate = skill_xp_per_year * self.rng.lognormal(0.0, 0.5, size=(count, self.agent_count))
+        self.values[rows] = 0.0
+
+    def _init_decay_natural(self) -> None:
+        specs = self._specs("DECAY_NATURAL")
+        self.natural_rate = _column([float(_params(spec).get("decay_per_year", 0.0)) for spec in specs])
+        table = np.ones((len(specs), len(AGE_STAGES)))
+        for local, spec in enumerate(specs):
+            multipliers = _params(spec).get("age_stage_multipliers") or {}
+            for stage_idx, stage in enumerate(AGE_STAGES):
+                for candidate in AGE_STAGE_FALLBACK[stage]:
+                    if candidate in multipliers:
+                        table[local, stage_idx] = float(multipliers[candidate])
+                        break
+        self.natural_stage_multipliers = table
+
+    def _axis_z(self, axis: str) -> np.ndarray:
+        row = self.schema.index.get(f"HEXACO_{axis}")
+        if row is None:
+            return np.zeros(self.agent_count)
+        return (self.values[row] - 500.0) / 500.0
+
+    def _init_decay_fast(self) -> None:
+        specs = self._specs("DECAY_FAST")
+        rows = self.rows["DECAY_FAST"]
+        count = len(specs)
+        self.emotion_baseline = np.zeros((count, self.agent_count))
+        self.emotion_fast_half_life = np.zeros((count, self.agent_count))
+        self.emotion_slow_half_life = np.zeros((count, self.agent_count))
+        for local, spec in enumerate(specs):
+            params = _params(spec)
+            baseline = params.get("baseline")
+            if isinstance(baseline, dict):
+                z = self._axis_z(str(baseline.get("axis", "")))
+                self.emotion_baseline[local] = np.clip(
+                    float(baseline.get("base", 0.0)) + float(baseline.get("scale", 0.0)) * z,
+                    float(baseline.get("min", self.schema.range_lo[rows[local]])),
+                    float(baseline.get("max", self.schema.range_hi[rows[local]])),
+                )
+            adjust = np.ones(self.agent_count)
+            adjustment = params.get("half_life_adjustment")
+            if isinstance(adjustment, dict):
+                z = self._axis_z(str(adjustment.get("axis", "")))
+                adjust = np.maximum(1.0 + float(adjustment.get("coeff", 0.0)) * z, 0.1)
+            self.emotion_fast_half_life[local] = float(params.get("fast_half_life_hours", 1.0)) * adjust
+            self.emotion_slow_half_life[local] = float(params.get("slow_half_life_hours", 1.0)) * adjust
+        excess = self.values[rows] - self.emotion_baseline
+        self.emotion_fast = 0.5 * excess
+        self.emotion_slow = excess - self.emotion_fast
+
+    def _init_linear_rates(self) -> None:
+        self.regen_rate = _column(
+            [float(_params(spec).get("regen_per_year", 0.0)) for spec in self._specs("REGENERATING")]
+        )
+        specs = self._specs("ACCUMULATOR")
+        self.accumulator_tau_hours = _column(
+            [float(_params(spec).get("decay_tau_hours", 0.0)) for spec in specs]
+        )
+        self.accumulator_rate = _column(
+            [float(_params(spec).get("decay_per_year", 0.0)) for spec in specs]
+        )
+
+    # -- stepping ----------------------------------------------------------
+
+    def _clip_rows(self, rows: np.ndarray, values: np.ndarray) -> np.ndarray:
+        return np.clip(values, self.lo[rows], self.hi[rows])
+
+    def _step_scurve(self, dt: float) -> None:
+        rows = self.rows["SCURVE"]
+        if not len(rows):
+            return
+        current = self.values[rows]
+        speed = np.broadcast_to(self.scurve_base_speed, current.shape).copy()
+        for breakpoint, speed_step in zip(self.scurve_breakpoints, self.scurve_speed_steps):
+            speed += (current >= breakpoint) * speed_step
+        noise = self.rng.standard_normal(current.shape, dtype=np.float32)
+        speed *= self.scurve_sd * np.sqrt(dt)
+        self.values[rows] = self._clip_rows(rows, current + speed * noise)
+
+    def _resolve_skill_levels(self) -> None:
+        rows = self.rows["LOG_DIMINISHING"]
+        if not len(rows):
+            return
+        # Levels never drop, even if the talent stat falls below its bucket.
+        self.values[rows] = np.maximum(self.values[rows], self.skills.levels(self.skill_xp, self.values))
+
+    def _step_decay_natural(self, dt: float) -> None:
+        rows = self.rows["DECAY_NATURAL"]
+        if not len(rows):
+            return
+        multiplier = self.natural_stage_multipliers[:, age_stage_index(self.age_years)]
+        self.values[rows] = self._clip_rows(rows, self.values[rows] - self.natural_rate * multiplier * dt)
+
+    def _step_decay_fast(self, dt: float) -> None:
+        rows = self.rows["DECAY_FAST"]
+        if not len(rows):
+            return
+        hours = dt * HOURS_PER_YEAR
+        self.emotion_fast *= np.exp(-LN2 * hours / self.emotion_fast_half_life)
+        self.emotion_slow *= np.exp(-LN2 * hours / self.emotion_slow_half_life)
+        self.values[rows] = self._clip_rows(
+            rows, self.emotion_baseline + self.emotion_fast + self.emotion_slow
+        )
+
+    def _step_linear(self, dt: float) -> None:
+        rows = self.rows["REGENERATING"]
+        if len(rows):
+            self.values[rows] = self._clip_rows(rows, self.values[rows] + self.regen_rate * dt)
+        rows = self.rows["ACCUMULATOR"]
+        if len(rows):
+            lo = self.lo[rows]
+            current = self.values[rows]
+            tau = self.accumulator_tau_hours
+            exponential = lo + (current - lo) * np.exp(-dt * HOURS_PER_YEAR / np.where(tau > 0.0, tau, 1.0))
+            linear = current - self.accumulator_rate * dt
+            self.values[rows] = self._clip_rows(rows, np.where(tau > 0.0, exponential, linear))
+
+    def step(self, dt_years: float, slow_dt_years: float | None = None) -> None:
+        """Advance one step.
+
+        SCURVE drift and skill levels are path-independent over a year (the
+        drift is a Brownian walk, a level is a function of cumulative XP), so
+        run() advances them once per simulated year via `slow_dt_years` and
+        passes 0 on the steps in between. None means "same as dt_years".
+        """
+        slow_dt = dt_years if slow_dt_years is None else slow_dt_years
+        if self.skill_xp.size:
+            self.skill_xp += self.skill_xp_rate * dt_years
+        if slow_dt > 0.0:
+            self._step_scurve(slow_dt)
+            self._resolve_skill_levels()
+        self._step_decay_natural(dt_years)
+        self._step_decay_fast(dt_years)
+        self._step_linear(dt_years)
+        self.graph.recompute(self.values)
+        self.age_years += dt_years
+
+    def run(self, years: float, steps_per_year: int) -> Dict[str, Any]:
+        """Advance `years`, recording per-stat mean and sd at the end of each year."""
+        dt = 1.0 / steps_per_year
+        total_steps = int(round(years * steps_per_year))
+        history_mean = [self.values.mean(axis=1)]
+        history_std = [self.values.std(axis=1)]
+        slow_dt = 0.0
+        for step in range(1, total_steps + 1):
+            slow_dt += dt
+            year_end = step % steps_per_year == 0 or step == total_steps
+            self.step(dt, slow_dt if year_end else 0.0)
+            if year_end:
+                slow_dt = 0.0
+                history_mean.append(self.values.mean(axis=1))
+                history_std.append(self.values.std(axis=1))
+        return {
+            "years": years,
+            "steps": total_steps,
+            "mean": np.array(history_mean),
+            "std": np.array(history_std),
+        }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--project-root", default=".", help="WorldSim project root")
+    parser.add_argument("--agents", type=int, default=50000, help="population size")
+    parser.add_argument("--years", type=float, default=100.0, help="simulated years")
+    parser.add_argument("--steps-per-year", type=int, default=12, help="time steps per simulated year")
+    parser.add_argument("--seed", type=int, default=0, help="population seed")
+    parser.add_argument("--start-age", type=float, default=0.0, help="age of every agent at year 0")
+    parser.add_argument(
+        "--scurve-sd",
+        type=float,
+        default=15.0,
+        help="SCURVE random-walk sd per sqrt(year) at phase speed 1.0",
+    )
+    parser.add_argument(
+        "--skill-xp-per-year",
+        type=float,
+        default=20000.0,
+        help="median skill XP gained per year (per-agent lognormal spread)",
+    )
+    parser.add_argument(
+        "--show",
+        default="NEED_HUNGER,EMOTION_JOY,EMOTION_STRESS,HEXACO_O,SKILL_HUNTING,DERIVED_CHARISMA",
+        help="comma-separated stat ids to print per decade",
+    )
+    parser.add_argument("--report-json", default="", help="optional per-year mean/sd output")
+    args = parser.parse_args()
+
+    project_root = Path(args.project_root).resolve()
+    started = time.perf_counter()
+    sim = GrowthSimulator.load(
+        project_root,
+        args.agents,
+        seed=args.seed,
+        start_age=args.start_age,
+        scurve_sd=args.scurve_sd,
+        skill_xp_per_year=args.skill_xp_per_year,
+    )
+    setup_ms = (time.perf_counter() - started) * 1000.0
+    started = time.perf_counter()
+    history = sim.run(args.years, args.steps_per_year)
+    run_s = time.perf_counter() - started
+    schema = sim.schema
+    print(
+        f"[stat_growth_sim] stats={len(schema)} agents={args.agents} years={args.years:g} "
+        f"steps={history['steps']} setup_ms={setup_ms:.0f} run_s={run_s:.1f} "
+        f"ms_per_step={run_s * 1000.0 / max(history['steps'], 1):.1f}"
+    )
+    show = [item.strip() for item in args.show.split(",") if item.strip() in schema.index]
+    for stat_id in show:
+        row = schema.index[stat_id]
+        decades = history["mean"][::10, row]
+        print(f"  {stat_id} ({schema.growth_type(stat_id)}): " + " ".join(f"{v:.1f}" for v in decades))
+    if args.report_json:
+        out_path = (project_root / args.report_json).resolve()
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "agents": args.agents,
+            "years": args.years,
+            "steps_per_year": args.steps_per_year,
+            "seed": args.seed,
+            "stats": {
+                stat_id: {
+                    "growth": schema.growth_type(stat_id),
+                    "mean": [round(float(v), 3) for v in history["mean"][:, row]],
+                    "std": [round(float(v), 3) for v in history["std"][:, row]],
+                }
+                for row, stat_id in enumerate(schema.ids)
+            },
+        }
+        with out_path.open("w", encoding="utf-8") as fp:
+            json.dump(payload, fp, indent=2)
+            fp.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Load the stat specs under stats/ into index-aligned arrays.
+
+Every offline stat tool (curve evaluator, growth simulator, threshold engine,
+...) works on a population matrix of shape (agents, stats). StatSchema fixes
+the column order (sorted stat ids) and exposes ranges/defaults as arrays so
+tools can index by column instead of looking specs up per agent.
+
+Usage:
+  python3 tools/stat_schema.py --project-root .
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+GROWTH_TYPES: tuple[str, ...] = (
+    "SCURVE",
+    "LOG_DIMINISHING",
+    "DECAY_NATURAL",
+    "DECAY_FAST",
+    "REGENERATING",
+    "ACCUMULATOR",
+    "COMPOSITE",
+    "FIXED",
+    "EXTERNAL",
+)
+
+
+def _load_json(path: Path) -> Any:
+    with path.open("r", encoding="utf-8") as fp:
+        return json.load(fp)
+
+
+def _spec_from_data(rel_path: str, data: Any) -> Dict[str, Any] | None:
+    if not isinstance(data, dict) or "id" not in data:
+        return None
+    spec = dict(data)
+    spec["_path"] = rel_path
+    return spec
+
+
+def load_stat_specs(stats_root: Path) -> List[Dict[str, Any]]:
+    specs: List[Dict[str, Any]] = []
+    for path in sorted(stats_root.rglob("*.json")):
+        spec = _spec_from_data(path.relative_to(stats_root).as_posix(), _load_json(path))
+        if spec is not None:
+            specs.append(spec)
+    return specs
+
+
+def specs_from_sources(sources: Dict[str, bytes]) -> List[Dict[str, Any]]:
+    """Same as load_stat_specs() over already-read {relative path: bytes}."""
+    specs: List[Dict[str, Any]] = []
+    for rel_path in sorted(sources):
+        spec = _spec_from_data(rel_path, json.loads(sources[rel_path].decode("utf-8")))
+        if spec is not None:
+            specs.append(spec)
+    return specs
+
+
+class StatSchema:
+    def __init__(self, specs: List[Dict[str, Any]]) -> None:
+        self.specs: List[Dict[str, Any]] = sorted(specs, key=lambda spec: str(spec["id"]))
+        self.ids: List[str] = [str(spec["id"]) for spec in self.specs]
+        self.index: Dict[str, int] = {stat_id: idx for idx, stat_id in enumerate(self.ids)}
+        if len(self.index) != len(self.ids):
+            duplicates = sorted(k for k, v in Counter(self.ids).items() if v > 1)
+            raise ValueError(f"duplicate stat ids: {', '.join(duplicates)}")
+        self.range_lo = np.array([float(spec["range"][0]) for spec in self.specs])
+        self.range_hi = np.array([float(spec["range"][1]) for spec in self.specs])
+        self.defaults = np.array([float(spec.get("default", 0)) for spec in self.specs])
+
+    @classmethod
+    def from_bundle(cls, bundle: Any) -> "StatSchema":
+        """Build from a decoded stat_bundle.StatBundle without re-deriving arrays.
+
+        The bundle is already validated and sorted by id; its range/default
+        sections are used as-is (read-only views into the bundle buffer).
+        """
+        schema = cls.__new__(cls)
+        schema.specs = bundle.specs
+        schema.ids = bundle.ids
+        schema.index = {stat_id: idx for idx, stat_id in enumerate(schema.ids)}
+        schema.range_lo = bundle.arrays["range_lo"]
+        schema.range_hi = bundle.arrays["range_hi"]
+        schema.defaults = bundle.arrays["default"]
+        return schema
+
+    @classmethod
+    def load(cls, project_root: Path, use_bundle: bool = False) -> "StatSchema":
+        """Parse stats/**/*.json; no files are written.
+
+        use_bundle=True goes through stat_bundle.py instead, which validates
+        the specs (ValueError when invalid) and writes stats/.compiled/schema.bin
+        when it is missing or stale.
+        """
+        if use_bundle:
+            from stat_bundle import load_schema
+
+            return load_schema(project_root)
+        return cls(load_stat_specs(project_root / "stats"))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def spec(self, stat_id: str) -> Dict[str, Any]:
+        return self.specs[self.index[stat_id]]
+
+    def growth_type(self, stat_id: str) -> str:
+        return str(self.spec(stat_id).get("growth", {}).get("type", ""))
+
+    def default_population(self, agent_count: int) -> np.ndarray:
+        return np.tile(self.defaults, (agent_count, 1))
+
+    def random_population(self, agent_count: int, seed: int = 0, spread: float = 0.2) -> np.ndarray:
+        """Normal around each default (sd = spread * range span), clipped to range."""
+        rng = np.random.default_rng(seed)
+        span = self.range_hi - self.range_lo
+        values = rng.normal(self.defaults, spread * span, size=(agent_count, len(self.ids)))
+        return np.clip(np.rint(values), self.range_lo, self.range_hi)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--project-root", default=".", help="WorldSim project root")
+    args = parser.parse_args()
+
+    schema = StatSchema.load(Path(args.project_root).resolve())
+    categories = Counter(str(spec.get("category", "")) for spec in schema.specs)
+    growth = Counter(schema.growth_type(stat_id) for stat_id in schema.ids)
+    print(f"[stat_schema] stats={len(schema)}")
+    print("[stat_schema] categories: " + " ".join(f"{k}={v}" for k, v in sorted(categories.items())))
+    print("[stat_schema] growth: " + " ".join(f"{k}={v}" for k, v in sorted(growth.items())))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Tests for the sparse composite violation_stress derivation.
+Run with: python3 tools/test_derive_composite_violation_stress.py
+No pytest dependency — uses plain assertions and exit code.
+"""
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(__file__))
+from derive_composite_violation_stress import (  # noqa: E402
+    AXIS_FACETS,
+    SUBFACET_FACETS,
+    ViolationMatrices,
+    derive_violation_stress,
+    main,
+    parse_diff_edits,
+)
+
+ACTIONS = ["lie", "steal", "betray", "flee", "boast", "hoard"]
+SEEDS = range(300)
+
+
+def _facet_map(rng):
+    facets = sorted({f for group in list(AXIS_FACETS.values()) + list(SUBFACET_FACETS.values()) for f in group})
+    return {
+        facet: {action: round(rng.uniform(-4.0, 14.0), 3) for action in rng.sample(ACTIONS, rng.randint(1, 4))}
+        for facet in facets
+        if rng.random() < 0.8
+    }
+
+
+def _composites(rng, count=60):
+    keys = list(AXIS_FACETS) + list(SUBFACET_FACETS)
+    prefixes = ["c_he_", "c_xo_", "c_misc_", "c_triple_"]
+    composites = []
+    for idx in range(count):
+        conditions = [{"facet": f, "direction": d} for f, d in rng.sample(keys, rng.randint(1, 4))]
+        if rng.random() < 0.2:
+            conditions.append({"trait": "f_sincere"})
+        if rng.random() < 0.1:
+            conditions.append(dict(conditions[0]))
+        composites.append({"id": f"{rng.choice(prefixes)}{idx}", "condition": {"all": conditions}})
+    return composites
+
+
+def test_matrix_derivation_matches_loop():
+    """Same values and action key order as the per-composite loop, including
+    .x5 rounding ties."""
+    for seed in SEEDS:
+        rng = random.Random(seed)
+        facet_map = _facet_map(rng)
+        composites = _composites(rng)
+        derived = ViolationMatrices(composites, facet_map).derive_all()
+        for composite, values in zip(composites, derived):
+            expected = derive_violation_stress(composite, facet_map)
+            assert list(values.items()) == list(expected.items()), (seed, composite["id"])
+        assert any(values for values in derived), seed
+        assert all(1.0 <= v <= 30.0 for values in derived for v in values.values()), seed
+
+
+def test_diff_reports_only_changed_composites():
+    for seed in SEEDS:
+        rng = random.Random(seed)
+        facet_map = _facet_map(rng)
+        composites = _composites(rng)
+        edited = parse_diff_edits(["f_sincere:lie=25", "f_sincere:new_action=9", "f_calm:flee=0"], facet_map)
+        assert "flee" not in edited["f_calm"] and edited["f_sincere"]["new_action"] == 9.0
+        report = ViolationMatrices(composites, facet_map).diff(edited)
+        new_map = {**facet_map, **edited}
+        for composite in composites:
+            old = derive_violation_stress(composite, facet_map)
+            new = derive_violation_stress(composite, new_map)
+            if old == new:
+                assert composite["id"] not in report, (seed, composite["id"])
+                continue
+            changes = report[composite["id"]]
+            for action in set(old) | set(new):
+                if old.get(action) != new.get(action):
+                    assert changes[action] == [old.get(action), new.get(action)], (seed, composite["id"])
+        unchanged = {"f_calm": facet_map.get("f_calm", {})}
+        assert ViolationMatrices(composites, facet_map).diff(unchanged) == {}, seed
+
+
+def test_cli_rejects_bad_diff_edits():
+    """Unknown facets and malformed edits exit with a usage error, not a traceback."""
+    traits = [
+        {"id": "f_sincere", "effects": {"stress_modifiers": {"violation_stress": {"lie": 8.0}}}},
+        {"id": "c_misc_1", "condition": {"all": [{"trait": "f_sincere"}]}},
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / "traits.json"
+        source.write_text(json.dumps(traits), encoding="utf-8")
+        for edit in ("f_bogus:lie=3", "f_sincere:lie=lots", "f_sincere"):
+            argv = sys.argv
+            sys.argv = ["derive_composite_violation_stress.py", "--source", str(source), "--diff", edit]
+            err = io.StringIO()
+            try:
+                with contextlib.redirect_stderr(err):
+                    main()
+                raise AssertionError(f"{edit}: expected a usage error")
+            except SystemExit as exc:
+                assert exc.code == 2, edit
+            finally:
+                sys.argv = argv
+            assert "error:" in err.getvalue() and "Traceback" not in err.getvalue(), err.getvalue()
+
+
+if __name__ == "__main__":
+    tests = [v for k, v in list(globals().items()) if k.startswith("test_") and callable(v)]
+    failed = 0
+    for t in tests:
+        try:
+            t()
+            print(f"PASS: {t.__name__}")
+        except AssertionError as e:
+            print(f"FAIL: {t.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"ERROR: {t.__name__}: {type(e).__name__}: {e}")
+            failed += 1
+    print(f"\n{len(tests) - failed}/{len(tests)} passed")
+    sys.exit(0 if failed == 0 else 1)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Round-trip tests for the binary compiled-locale format.
+Run with: python3 tools/test_localization_binary.py
+No pytest dependency — uses plain assertions and exit code.
+"""
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(__file__))
+from localization_binary import (  # noqa: E402
+    MISSING_OFFSET,
+    CompiledLocaleReader,
+    encode_compiled_locale,
+    load_key_to_id,
+)
+from localization_compile import run  # noqa: E402
+
+LOCALIZATION_ROOT = Path(__file__).resolve().parent.parent / "localization"
+
+
+def _load_compiled_strings(locale):
+    with (LOCALIZATION_ROOT / "compiled" / f"{locale}.json").open("r", encoding="utf-8") as fp:
+        return json.load(fp)["strings"]
+
+
+def _compile_copy(tmp):
+    """Compile a copy of the repo's Fluent sources with emit_binary on; returns
+    (compiled dir, compiler stdout)."""
+    root = Path(tmp) / "localization"
+    root.mkdir()
+    for name in ("key_owners.json", "key_registry.json"):
+        shutil.copy(LOCALIZATION_ROOT / name, root / name)
+    shutil.copytree(LOCALIZATION_ROOT / "fluent", root / "fluent")
+    with (LOCALIZATION_ROOT / "manifest.json").open("r", encoding="utf-8") as fp:
+        manifest = json.load(fp)
+    manifest["emit_binary"] = True
+    (root / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(io.StringIO()):
+        run(project_root=Path(tmp), strict_duplicates=False, use_cache=False)
+    return root / "compiled", out.getvalue()
+
+
+def test_round_trip_matches_compiled_json():
+    """Every key in the compiler's <locale>.json resolves to the same string via its .bin."""
+    with tempfile.TemporaryDirectory() as tmp:
+        compiled_root, _out = _compile_copy(tmp)
+        key_to_id = load_key_to_id(compiled_root.parent / "key_registry.json")
+        for locale in ("ko", "en"):
+            with (compiled_root / f"{locale}.json").open("r", encoding="utf-8") as fp:
+                strings = json.load(fp)["strings"]
+            with CompiledLocaleReader(compiled_root / f"{locale}.bin", key_to_id) as reader:
+                assert len(reader) == len(key_to_id)
+                assert reader.to_dict() == strings, f"{locale}: round-trip mismatch"
+                for key, value in strings.items():
+                    assert reader.get(key) == value, f"{locale}: {key}"
+
+
+def test_committed_binary_matches_compiled_json():
+    """compiled/<locale>.bin in the tree stays in sync with compiled/<locale>.json."""
+    key_to_id = load_key_to_id(LOCALIZATION_ROOT / "key_registry.json")
+    for locale in ("ko", "en"):
+        path = LOCALIZATION_ROOT / "compiled" / f"{locale}.bin"
+        if not path.exists():
+            continue
+        with CompiledLocaleReader(path, key_to_id) as reader:
+            assert reader.to_dict() == _load_compiled_strings(locale), f"{locale}.bin is stale"
+
+
+def test_missing_and_unicode_entries():
+    """Keys without a string are marked missing; multi-byte and empty strings survive."""
+    keys = ["A", "B", "C", "D"]
+    strings = {"A": "아동기\n역경", "C": "", "D": "{name} 🔥"}
+    payload = encode_compiled_locale(strings, keys)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "x.bin"
+        path.write_bytes(payload)
+        with CompiledLocaleReader(path, {k: i for i, k in enumerate(keys)}) as reader:
+            assert reader.get("A") == "아동기\n역경"
+            assert reader.string_at(1) is None
+            assert reader.get("B", "fallback") == "fallback"
+            assert reader.get("C") == ""
+            assert reader.get("D") == "{name} 🔥"
+            assert reader.get("UNKNOWN") is None
+            assert reader.string_at(99) is None
+    assert MISSING_OFFSET == 0xFFFFFFFF
+
+
+def test_rejects_non_binary_file():
+    """A JSON file (or any wrong magic) is rejected with ValueError."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bad.bin"
+        path.write_bytes(b"{\"meta\": {}, \"strings\": {}}\n")
+        try:
+            CompiledLocaleReader(path)
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+
+def test_compiler_skips_identical_binary():
+    """Recompiling unchanged sources leaves the .bin files untouched."""
+    with tempfile.TemporaryDirectory() as tmp:
+        compiled_root, _out = _compile_copy(tmp)
+        paths = [compiled_root / f"{locale}.bin" for locale in ("ko", "en")]
+        for path in paths:
+            os.utime(path, ns=(0, 0))
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(io.StringIO()):
+            run(project_root=Path(tmp), strict_duplicates=False, use_cache=False)
+        assert "updated=1" not in out.getvalue(), out.getvalue()
+        assert all(path.stat().st_mtime_ns == 0 for path in paths)
+
+
+if __name__ == "__main__":
+    tests = [v for k, v in list(globals().items()) if k.startswith("test_") and callable(v)]
+    failed = 0
+    for t in tests:
+        try:
+            t()
+            print(f"PASS: {t.__name__}")
+        except AssertionError as e:
+            print(f"FAIL: {t.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"ERROR: {t.__name__}: {type(e).__name__}: {e}")
+            failed += 1
+    print(f"\n{len(tests) - failed}/{len(tests)} passed")
+    sys.exit(0 if failed == 0 else 1)
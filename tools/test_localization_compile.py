@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""Tests for the localization compiler: Fluent parsing, the per-locale compile
+cache, skip-if-unchanged output writes and --watch change detection.
+Run with: python3 tools/test_localization_compile.py
+No pytest dependency — uses plain assertions and exit code.
+"""
+import contextlib
+import io
+import json
+import os
+import re
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(__file__))
+from bench_localization_fluent import parse_fluent_legacy  # noqa: E402
+import localization_compile  # noqa: E402
+from localization_compile import (  # noqa: E402
+    _affected_locales,
+    _atomic_write_bytes,
+    _digest_sidecar_path,
+    _load_cached_locale,
+    _locale_cache_fingerprint,
+    _parse_fluent_source,
+    _snapshot_watch_mtimes,
+    _store_cached_locale,
+    _write_bytes_if_changed,
+    parse_fluent_file,
+    run,
+    watch,
+)
+
+MANIFEST = {
+    "default_locale": "ko",
+    "supported_locales": ["ko", "en"],
+    "source_format": "fluent_preferred",
+    "categories_order": ["ui"],
+    "emit_binary": False,
+}
+
+
+FLUENT_SAMPLE = (
+    "# leading comment\n"
+    "HELLO = Hello\n"
+    "MULTI = first line\n"
+    "    second line\n"
+    "\tthird line\n"
+    "\n"
+    "  # indented comment\n"
+    "ESCAPED = one\\ntwo\n"
+    "ATTR = Button\n"
+    "    .tooltip = Click me\n"
+    "HELLO = Hello\n"
+    "CONFLICT = a\n"
+    "CONFLICT = b\n"
+    "CONFLICT = a\n"
+    "= orphan\n"
+    "not an entry\n"
+    "    dangling continuation\n"
+    "NOSPACE=tight\n"
+    "MULTI = first line\n"
+    "    changed\n"
+)
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def _make_project(tmp):
+    """Build a minimal two-locale localization tree under tmp."""
+    project_root = Path(tmp)
+    root = project_root / "localization"
+    _write(root / "manifest.json", json.dumps(MANIFEST))
+    _write(root / "key_owners.json", json.dumps({"owners": {}}))
+    _write(root / "fluent" / "ko" / "messages.ftl", "HELLO = 안녕\nBYE = 잘가\n")
+    _write(root / "fluent" / "en" / "messages.ftl", "HELLO = Hello\nBYE = Bye\n")
+    _write(root / "ko" / "ui.json", json.dumps({"HELLO": "안녕"}))
+    _write(root / "en" / "ui.json", json.dumps({"HELLO": "Hello"}))
+    return project_root
+
+
+def _run_quiet(project_root, use_cache=True):
+    """Run the compiler and return (exit_code, cache_hits, cache_misses)."""
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        exit_code = run(project_root=project_root, strict_duplicates=False, use_cache=use_cache)
+    match = re.search(r"compile-cache: enabled=\d hits=(\d+) misses=(\d+)", out.getvalue())
+    assert match, out.getvalue()
+    return exit_code, int(match.group(1)), int(match.group(2))
+
+
+def _fingerprint(root, locale):
+    return _locale_cache_fingerprint(
+        localization_root=root,
+        locale=locale,
+        fallback_locale="en",
+        source_format=MANIFEST["source_format"],
+        categories=MANIFEST["categories_order"],
+        manifest_digest="m",
+        key_owners_digest="o",
+    )
+
+
+def test_streaming_parser_matches_legacy_parser():
+    """Multiline values, comments, attributes, duplicates and CRLF input parse
+    the same as with the legacy parser, from a string and from a file."""
+    for sample in (FLUENT_SAMPLE, FLUENT_SAMPLE.replace("\n", "\r\n")):
+        expected = parse_fluent_legacy(sample)
+        assert _parse_fluent_source(sample) == expected
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "messages.ftl"
+            path.write_bytes(sample.encode("utf-8"))
+            assert parse_fluent_file(path) == expected
+    flat, duplicates, conflicts = parse_fluent_legacy(FLUENT_SAMPLE)
+    assert flat["MULTI"] == "first line\nchanged"
+    assert flat["ATTR"] == "Button\n.tooltip = Click me"
+    assert set(duplicates) == {"HELLO", "CONFLICT", "MULTI"}
+    assert set(conflicts) == {"CONFLICT", "MULTI"}
+
+
+def test_parser_splits_on_newlines_only():
+    """Unlike str.splitlines(), form feeds and Unicode line separators stay in the value."""
+    sample = "A = x\u2028y\x0cz\nB = 1\n"
+    expected = ({"A": "x\u2028y\x0cz", "B": "1"}, {}, {})
+    assert _parse_fluent_source(sample) == expected
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "messages.ftl"
+        path.write_text(sample, encoding="utf-8")
+        assert parse_fluent_file(path) == expected
+
+
+def test_unchanged_tree_is_served_from_cache():
+    """A second compile of an untouched tree hits the cache for every locale."""
+    with tempfile.TemporaryDirectory() as tmp:
+        project_root = _make_project(tmp)
+        assert _run_quiet(project_root) == (0, 0, 2)
+        assert _run_quiet(project_root) == (0, 2, 0)
+
+
+def test_source_edits_invalidate_affected_entries():
+    """Editing a locale FTL or category JSON only misses that locale; the
+    fallback locale, manifest and key_owners invalidate everything."""
+    edits = [
+        ("fluent/ko/messages.ftl", "HELLO = 안녕하세요\n", 1),
+        ("ko/ui.json", json.dumps({"HELLO": "안녕!"}), 1),
+        ("fluent/en/messages.ftl", "HELLO = Hi\n", 2),
+        ("en/ui.json", json.dumps({"HELLO": "Hi"}), 2),
+        ("manifest.json", json.dumps(dict(MANIFEST, include_sources=True)), 2),
+        ("key_owners.json", json.dumps({"owners": {"HELLO": "ui"}}), 2),
+    ]
+    for rel, text, expected_misses in edits:
+        with tempfile.TemporaryDirectory() as tmp:
+            project_root = _make_project(tmp)
+            _run_quiet(project_root)
+            _write(project_root / "localization" / rel, text)
+            _, hits, misses = _run_quiet(project_root)
+            assert misses == expected_misses, (rel, hits, misses)
+            assert hits == 2 - expected_misses, (rel, hits, misses)
+
+
+def test_no_cache_skips_cache():
+    """use_cache=False neither reads nor writes the cache directory."""
+    with tempfile.TemporaryDirectory() as tmp:
+        project_root = _make_project(tmp)
+        assert _run_quiet(project_root, use_cache=False) == (0, 0, 2)
+        cache_root = project_root / "localization" / ".compile_cache"
+        assert not (cache_root / "ko.json").exists()
+        _run_quiet(project_root)
+        assert _run_quiet(project_root, use_cache=False) == (0, 0, 2)
+
+
+def test_fingerprint_tracks_locale_and_fallback_sources():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = _make_project(tmp) / "localization"
+        before = _fingerprint(root, "ko")
+        assert set(before["sources"]) == {
+            "fluent/ko/messages.ftl",
+            "fluent/en/messages.ftl",
+            "ko/ui.json",
+            "en/ui.json",
+        }
+        _write(root / "fluent" / "en" / "messages.ftl", "HELLO = Hi\n")
+        assert _fingerprint(root, "ko") != before
+
+
+def test_cache_round_trip_and_mismatch():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = _make_project(tmp) / "localization"
+        cache_root = root / ".compile_cache"
+        fingerprint = _fingerprint(root, "ko")
+        compiled = {"strings": {"HELLO": "안녕"}}
+        assert _load_cached_locale(cache_root, "ko", fingerprint) is None
+        _store_cached_locale(cache_root, "ko", fingerprint, compiled)
+        assert _load_cached_locale(cache_root, "ko", fingerprint) == compiled
+        stale = dict(fingerprint, manifest="other")
+        assert _load_cached_locale(cache_root, "ko", stale) is None
+
+
+def test_corrupt_cache_falls_back_to_compile():
+    with tempfile.TemporaryDirectory() as tmp:
+        project_root = _make_project(tmp)
+        _run_quiet(project_root)
+        cache_root = project_root / "localization" / ".compile_cache"
+        (cache_root / "ko.json").write_text("{not json", encoding="utf-8")
+        (cache_root / "en.json").write_text(json.dumps(["wrong", "shape"]), encoding="utf-8")
+        assert _load_cached_locale(cache_root, "ko", _fingerprint(cache_root.parent, "ko")) is None
+        assert _run_quiet(project_root) == (0, 0, 2)
+        assert _run_quiet(project_root) == (0, 2, 0)
+
+
+def test_matching_digest_skips_write():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "compiled" / "ko.json"
+        digest_dir = Path(tmp) / ".compile_cache" / "digests"
+        assert _write_bytes_if_changed(path, b"payload", digest_dir)
+        assert _digest_sidecar_path(path, digest_dir).exists()
+        assert not (path.parent / "ko.json.digest").exists()
+        mtime_ns = path.stat().st_mtime_ns
+        assert not _write_bytes_if_changed(path, b"payload", digest_dir)
+        assert path.stat().st_mtime_ns == mtime_ns
+
+
+def test_stale_or_missing_digest_forces_rewrite():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "compiled" / "ko.json"
+        digest_dir = Path(tmp) / ".compile_cache" / "digests"
+        sidecar = _digest_sidecar_path(path, digest_dir)
+        _write_bytes_if_changed(path, b"payload", digest_dir)
+        # Same size, edited behind the compiler's back: the sidecar's mtime no
+        # longer matches, so the bytes are compared and the file rewritten.
+        path.write_bytes(b"PAYLOAD")
+        os.utime(path, ns=(path.stat().st_mtime_ns + 10**9,) * 2)
+        assert _write_bytes_if_changed(path, b"payload", digest_dir)
+        assert path.read_bytes() == b"payload"
+        # No sidecar at all: same rule.
+        sidecar.unlink()
+        path.write_bytes(b"PAYLOAD")
+        assert _write_bytes_if_changed(path, b"payload", digest_dir)
+        assert path.read_bytes() == b"payload"
+        # No sidecar but identical bytes: nothing to write, sidecar restored.
+        sidecar.unlink()
+        assert not _write_bytes_if_changed(path, b"payload", digest_dir)
+        assert sidecar.exists()
+        # Missing output with a leftover sidecar is always written.
+        path.unlink()
+        assert _write_bytes_if_changed(path, b"payload", digest_dir)
+        assert path.read_bytes() == b"payload"
+
+
+def test_failed_write_keeps_previous_file():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "ko.json"
+        _atomic_write_bytes(path, b"old")
+
+        def _fail_replace(_src, _dst):
+            raise OSError("disk full")
+
+        original_replace = os.replace
+        os.replace = _fail_replace
+        try:
+            _atomic_write_bytes(path, b"new")
+            raise AssertionError("expected OSError")
+        except OSError:
+            pass
+        finally:
+            os.replace = original_replace
+        assert path.read_bytes() == b"old"
+        assert sorted(p.name for p in Path(tmp).iterdir()) == ["ko.json"]
+
+
+def test_affected_locales_fan_out():
+    """Shared inputs and the en fallback recompile every locale; a locale's own
+    sources only recompile that locale."""
+    supported = ["ko", "en", "ja"]
+    assert _affected_locales(["manifest.json"], supported) == supported
+    assert _affected_locales(["key_owners.json"], supported) == supported
+    assert _affected_locales(["fluent/en/messages.ftl"], supported) == supported
+    assert _affected_locales(["en/ui.json"], supported) == supported
+    assert _affected_locales(["fluent/ko/messages.ftl"], supported) == ["ko"]
+    assert _affected_locales(["ko/ui.json", "fluent/ja/messages.ftl"], supported) == ["ko", "ja"]
+    assert _affected_locales([], supported) == []
+
+
+def test_snapshot_watch_mtimes_covers_sources():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = _make_project(tmp) / "localization"
+        _write(root / "fr" / "ui.json", "{}")  # not a supported locale
+        snapshot = _snapshot_watch_mtimes(root, MANIFEST)
+        assert set(snapshot) == {
+            "manifest.json",
+            "key_owners.json",
+            "fluent/ko/messages.ftl",
+            "fluent/en/messages.ftl",
+            "ko/ui.json",
+            "en/ui.json",
+        }
+        path = root / "ko" / "ui.json"
+        os.utime(path, (snapshot["ko/ui.json"] + 5, snapshot["ko/ui.json"] + 5))
+        changed = _snapshot_watch_mtimes(root, MANIFEST)
+        assert [rel for rel in changed if changed[rel] != snapshot[rel]] == ["ko/ui.json"]
+
+
+def test_run_writes_only_requested_locales():
+    with tempfile.TemporaryDirectory() as tmp:
+        project_root = _make_project(tmp)
+        compiled_root = project_root / "localization" / "compiled"
+        _run_quiet(project_root)
+        en_path = compiled_root / "en.json"
+        os.utime(en_path, ns=(0, 0))
+        _write(project_root / "localization" / "fluent" / "ko" / "messages.ftl", "HELLO = 안녕!\nBYE = 잘가\n")
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert run(project_root=project_root, strict_duplicates=False, locales=["ko"]) == 0
+        assert en_path.stat().st_mtime_ns == 0
+        strings = json.loads((compiled_root / "ko.json").read_text(encoding="utf-8"))["strings"]
+        assert strings["HELLO"] == "안녕!"
+        # A new key changes the registry, so every locale is rewritten.
+        _write(project_root / "localization" / "fluent" / "ko" / "messages.ftl", "HELLO = 안녕!\nNEW = 새\n")
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert run(project_root=project_root, strict_duplicates=False, locales=["ko"]) == 0
+        assert en_path.stat().st_mtime_ns != 0
+
+
+def test_partial_run_keeps_cross_locale_meta_in_sync():
+    """A ko-only run that changes a cross-locale count rewrites every locale,
+    so a following full run has nothing left to write."""
+    with tempfile.TemporaryDirectory() as tmp:
+        project_root = _make_project(tmp)
+        compiled_root = project_root / "localization" / "compiled"
+        _run_quiet(project_root)
+        _write(
+            project_root / "localization" / "fluent" / "ko" / "messages.ftl",
+            "HELLO = 안녕\nBYE = 잘가\nHELLO = 안녕\n",
+        )
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert run(project_root=project_root, strict_duplicates=False, locales=["ko"]) == 0
+        for locale in ("ko", "en"):
+            meta = json.loads((compiled_root / f"{locale}.json").read_text(encoding="utf-8"))["meta"]
+            assert meta["owner_policy_missing_duplicate_count"] == 1, (locale, meta)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            assert run(project_root=project_root, strict_duplicates=False) == 0
+        assert out.getvalue().count("updated=0 ->") == 3, out.getvalue()
+        assert "updated=1" not in out.getvalue(), out.getvalue()
+
+
+def test_watch_retries_after_failed_cycle():
+    """A cycle that raises is reported and retried on the next poll."""
+    with tempfile.TemporaryDirectory() as tmp:
+        project_root = _make_project(tmp)
+        manifest_path = project_root / "localization" / "manifest.json"
+        base_mtime = manifest_path.stat().st_mtime
+        steps = [
+            lambda: manifest_path.write_text("{broken", encoding="utf-8"),
+            lambda: None,  # unchanged tree: the failed change is retried
+            lambda: manifest_path.write_text(json.dumps(MANIFEST), encoding="utf-8"),
+        ]
+
+        class _Clock:
+            calls = 0
+
+            @staticmethod
+            def perf_counter():
+                return 0.0
+
+            @staticmethod
+            def sleep(_interval):
+                if _Clock.calls == len(steps):
+                    raise KeyboardInterrupt
+                steps[_Clock.calls]()
+                _Clock.calls += 1
+                os.utime(manifest_path, (base_mtime + _Clock.calls, base_mtime + _Clock.calls))
+
+        out, err = io.StringIO(), io.StringIO()
+        original_time = localization_compile.time
+        localization_compile.time = _Clock
+        try:
+            with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+                assert watch(project_root=project_root, strict_duplicates=False) == 0
+        finally:
+            localization_compile.time = original_time
+        assert err.getvalue().count("cycle failed") == 2, err.getvalue()
+        assert out.getvalue().count("watch: exit=0") == 2, out.getvalue()
+        assert out.getvalue().count("affected=ko,en ") == 2, out.getvalue()
+
+
+if __name__ == "__main__":
+    tests = [v for k, v in list(globals().items()) if k.startswith("test_") and callable(v)]
+    failed = 0
+    for t in tests:
+        try:
+            t()
+            print(f"PASS: {t.__name__}")
+        except AssertionError as e:
+            print(f"FAIL: {t.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"ERROR: {t.__name__}: {type(e).__name__}: {e}")
+            failed += 1
+    print(f"\n{len(tests) - failed}/{len(tests)} passed")
+    sys.exit(0 if failed == 0 else 1)
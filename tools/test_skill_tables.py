@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Tests for the skill XP-to-level tables.
+Run with: python3 tools/test_skill_tables.py
+No pytest dependency — uses plain assertions and exit code.
+"""
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(__file__))
+from skill_tables import SkillTables, _iterative_levels  # noqa: E402
+from stat_curves import log_xp_required  # noqa: E402
+from stat_schema import StatSchema  # noqa: E402
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _skill(stat_id, hi=10, ceiling_map=None):
+    return {
+        "id": stat_id,
+        "range": [0, hi],
+        "default": 0,
+        "growth": {
+            "type": "LOG_DIMINISHING",
+            "params": {
+                "base_xp": 10,
+                "exponent": 1.0,
+                "level_breakpoints": [5],
+                "breakpoint_multipliers": [1.0, 2.0],
+            },
+            "talent_key": "BODY_TALENT",
+            "talent_ceiling_map": ceiling_map if ceiling_map is not None else {"0": 4, "500": hi},
+        },
+    }
+
+
+def _schema():
+    talent = {"id": "BODY_TALENT", "range": [0, 1000], "default": 500, "growth": {"type": "FIXED"}}
+    return StatSchema(
+        [talent, _skill("SKILL_A"), _skill("SKILL_B", hi=20, ceiling_map={"0": 5, "300": 12, "600": 20})]
+    )
+
+
+def test_repo_skills_have_dense_tables():
+    tables = SkillTables.load(PROJECT_ROOT)
+    assert len(tables) == 43
+    finite = np.isfinite(tables.cumulative_xp)
+    for local, top in enumerate(tables.max_levels):
+        assert finite[local, : top + 1].all() and not finite[local, top + 1 :].any()
+        assert np.all(np.diff(tables.cumulative_xp[local, : top + 1]) > 0)
+    hunting = tables.ids.index("SKILL_HUNTING")
+    expected = float(np.sum(log_xp_required(np.arange(1, 51), 100, 1.8, [25, 50, 75], [1.0, 1.5, 2.0, 3.0])))
+    assert abs(tables.xp_to_reach("SKILL_HUNTING", 50) - expected) < 1e-6
+    assert list(tables.ceiling_levels[hunting]) == [40, 60, 80, 90, 100]
+
+
+def test_levels_for_xp_boundaries():
+    tables = SkillTables(_schema())
+    cumulative = tables.cumulative_xp[0]
+    xp = np.array([[0.0, cumulative[3] - 1e-9, cumulative[3], cumulative[10] * 5.0]] * 2)
+    levels = tables.levels_for_xp(xp)
+    assert list(levels[0]) == [0, 2, 3, 10]
+    # XP past the last level stops at the skill's range maximum.
+    assert levels[1, 3] == 20
+
+
+def test_ceilings_use_talent_buckets():
+    tables = SkillTables(_schema())
+    talent = np.array([[0.0, 499.0, 500.0, 1000.0], [-5.0, 299.0, 300.0, 650.0]])
+    assert tables.ceilings(talent).tolist() == [[4, 4, 10, 10], [5, 5, 12, 20]]
+
+
+def test_matches_iterative_level_up():
+    tables = SkillTables.load(PROJECT_ROOT)
+    rng = np.random.default_rng(5)
+    xp = rng.uniform(0.0, 2.0e6, size=(len(tables), 200))
+    values = np.ascontiguousarray(tables.schema.random_population(200, seed=5).T)
+    cap = tables.ceilings(values[tables.talent_rows])
+    assert np.array_equal(tables.levels(xp, values), _iterative_levels(tables, xp, cap))
+
+
+if __name__ == "__main__":
+    tests = [v for k, v in list(globals().items()) if k.startswith("test_") and callable(v)]
+    failed = 0
+    for t in tests:
+        try:
+            t()
+            print(f"PASS: {t.__name__}")
+        except AssertionError as e:
+            print(f"FAIL: {t.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"ERROR: {t.__name__}: {type(e).__name__}: {e}")
+            failed += 1
+    print(f"\n{len(tests) - failed}/{len(tests)} passed")
+    sys.exit(0 if failed == 0 else 1)
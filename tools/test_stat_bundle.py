@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Tests for the precompiled stat schema bundle.
+Run with: python3 tools/test_stat_bundle.py
+No pytest dependency — uses plain assertions and exit code.
+"""
+import json
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(__file__))
+from stat_bundle import (  # noqa: E402
+    StatBundle,
+    compile_bundle,
+    load_bundle,
+    load_known_tech_ids,
+    validate_specs,
+)
+from stat_schema import StatSchema  # noqa: E402
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _copy_tree(tmp):
+    root = Path(tmp)
+    shutil.copytree(PROJECT_ROOT / "stats", root / "stats", ignore=shutil.ignore_patterns(".compiled"))
+    (root / "localization" / "en").mkdir(parents=True)
+    shutil.copy(PROJECT_ROOT / "localization" / "en" / "tech.json", root / "localization" / "en")
+    return root
+
+
+def test_repo_specs_are_valid():
+    specs = StatSchema.load(PROJECT_ROOT, use_bundle=False).specs
+    assert validate_specs(specs, load_known_tech_ids(PROJECT_ROOT)) == []
+
+
+def test_bundle_round_trip_matches_json_load():
+    """Specs, ids and numeric arrays from the bundle equal a direct JSON load."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = _copy_tree(tmp)
+        bundle, errors = compile_bundle(root)
+        assert errors == [] and bundle is not None
+        direct = StatSchema.load(root, use_bundle=False)
+        reread = StatBundle.read(root / "stats" / ".compiled" / "schema.bin")
+        assert reread.ids == direct.ids
+        assert reread.specs == direct.specs
+        assert np.array_equal(reread.arrays["range_hi"], direct.range_hi)
+        assert np.array_equal(reread.arrays["default"], direct.defaults)
+        hunger = direct.index["NEED_HUNGER"]
+        assert (reread.arrays["thr_row"] == hunger).sum() == len(direct.spec("NEED_HUNGER")["thresholds"])
+
+
+def test_stale_bundle_is_recompiled():
+    """Touching a file keeps the bundle (same hash); editing it triggers a recompile."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = _copy_tree(tmp)
+        first = load_bundle(root)
+        path = root / "stats" / "needs" / "hunger.json"
+        os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 10_000_000))
+        touched = load_bundle(root)
+        assert touched.content_hash == first.content_hash
+        assert touched.sources != first.sources, "size/mtime refreshed after a touch"
+        data = json.loads(path.read_text(encoding="utf-8"))
+        data["default"] = 123
+        path.write_text(json.dumps(data), encoding="utf-8")
+        second = load_bundle(root)
+        assert second.content_hash != first.content_hash
+        assert StatSchema.load(root, use_bundle=True).spec("NEED_HUNGER")["default"] == 123
+
+
+def test_schema_from_bundle_matches_json_load():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = _copy_tree(tmp)
+        direct = StatSchema.load(root)
+        assert not (root / "stats" / ".compiled").exists(), "plain load() writes nothing"
+        bundled = StatSchema.load(root, use_bundle=True)
+        assert (root / "stats" / ".compiled" / "schema.bin").exists()
+        assert bundled.ids == direct.ids
+        assert bundled.index == direct.index
+        assert bundled.specs == direct.specs
+        for name in ("range_lo", "range_hi", "defaults"):
+            assert np.array_equal(getattr(bundled, name), getattr(direct, name)), name
+        assert np.array_equal(
+            bundled.random_population(5, seed=3), direct.random_population(5, seed=3)
+        )
+
+
+def test_validation_reports_bad_references():
+    specs = [
+        {"id": "A", "range": [0, 100], "default": 200},
+        {
+            "id": "S",
+            "range": [0, 100],
+            "default": 0,
+            "required_tech": "iron_age",
+            "prerequisites": [{"skill_id": "SKILL_MISSING", "min_level": 1}],
+            "affects": [{"target": "t", "evaluator": "CURVE", "curve": "POWER", "params": {}}],
+            "growth": {
+                "type": "LOG_DIMINISHING",
+                "params": {"base_xp": 100, "exponent": 1.8, "level_breakpoints": [25], "breakpoint_multipliers": [1.0]},
+                "talent_key": "BODY_MISSING",
+                "talent_ceiling_map": {"0": 40},
+            },
+        },
+    ]
+    errors = "\n".join(validate_specs(specs, {"STONE_AGE", "TECH_BASIC_TOOLS"}))
+    for fragment in ("default 200", "iron_age", "SKILL_MISSING", "missing param exponent", "BODY_MISSING", "breakpoint_multipliers"):
+        assert fragment in errors, fragment
+
+
+if __name__ == "__main__":
+    tests = [v for k, v in list(globals().items()) if k.startswith("test_") and callable(v)]
+    failed = 0
+    for t in tests:
+        try:
+            t()
+            print(f"PASS: {t.__name__}")
+        except AssertionError as e:
+            print(f"FAIL: {t.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"ERROR: {t.__name__}: {type(e).__name__}: {e}")
+            failed += 1
+    print(f"\n{len(tests) - failed}/{len(tests)} passed")
+    sys.exit(0 if failed == 0 else 1)
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Tests for the batched stat curve evaluator.
+Run with: python3 tools/test_stat_curves.py
+No pytest dependency — uses plain assertions and exit code.
+"""
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(__file__))
+from stat_curves import (  # noqa: E402
+    StatCurveEvaluator,
+    linear,
+    log_xp_required,
+    power_influence,
+    scurve_speed,
+    sigmoid_extreme,
+    step_linear,
+    threshold_power,
+)
+from stat_schema import StatSchema  # noqa: E402
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _spec(stat_id, affects, lo=0, hi=1000, default=500):
+    return {"id": stat_id, "range": [lo, hi], "default": default, "affects": affects}
+
+
+def test_scalar_curves_match_gdscript_expectations():
+    """Spot values mirror tests/test_stat_curve.gd."""
+    assert abs(float(linear(500, 0, 1000)) - 0.5) < 1e-9
+    assert abs(float(power_influence(500, 0, 1000, 2.0)) - 0.25) < 1e-9
+    assert float(threshold_power(400, 350, 2.0, 12.0)) == 0.0
+    assert float(threshold_power(350, 350, 2.0, 12.0)) == 0.0
+    assert abs(float(threshold_power(0, 350, 2.0, 12.0)) - 12.0) < 0.01
+    assert 2.0 < float(threshold_power(175, 350, 2.0, 12.0)) < 4.0
+    assert float(step_linear(600, 1000, 600, 1.0)) == 0.0
+    assert abs(float(step_linear(800, 1000, 600, 1.0)) - 0.5) < 1e-9
+    assert abs(float(sigmoid_extreme(500, 0, 1000, 200, 800, 3.0)) - 1.0) < 0.1
+    assert float(sigmoid_extreme(980, 0, 1000, 200, 800, 3.0)) > 2.5
+    assert float(sigmoid_extreme(20, 0, 1000, 200, 800, 3.0)) < 0.5
+    assert float(scurve_speed(100, [300, 700], [1.5, 1.0, 0.3])) == 1.5
+    assert float(scurve_speed(500, [300, 700], [1.5, 1.0, 0.3])) == 1.0
+    assert float(scurve_speed(800, [300, 700], [1.5, 1.0, 0.3])) == 0.3
+    xp = lambda level: float(log_xp_required(level, 100.0, 1.8, [25, 50, 75], [1.0, 1.5, 2.0, 3.0]))
+    assert xp(50) > xp(1) * 100.0
+    assert xp(26) > xp(25) * 1.4
+
+
+def test_batched_matches_per_affect_reference():
+    """Batched evaluation equals summing every affect one at a time."""
+    evaluator = StatCurveEvaluator.load(PROJECT_ROOT)
+    schema = evaluator.schema
+    population = schema.random_population(64, seed=7)
+    batched = evaluator.evaluate(population)
+    reference = np.zeros_like(batched)
+    for affect in evaluator.affects:
+        v = population[:, affect["column"]]
+        lo, hi, p = affect["lo"], affect["hi"], affect["params"]
+        curve = affect["curve"]
+        if curve == "LINEAR":
+            y = linear(v, lo, hi)
+        elif curve == "POWER":
+            y = power_influence(v, lo, hi, p["exponent"])
+        elif curve == "THRESHOLD_POWER":
+            y = threshold_power(v, p["threshold"], p["exponent"], p["max_output"])
+        elif curve == "STEP_LINEAR":
+            y = step_linear(v, hi, p["threshold"], p["max_output"])
+        else:
+            y = sigmoid_extreme(v, lo, hi, p["flat_zone"][0], p["flat_zone"][1], p["pole_multiplier"])
+        reference[:, evaluator.target_index[affect["target"]]] += affect["coeff"] * y
+    assert np.allclose(batched, reference), float(np.abs(batched - reference).max())
+
+
+def test_shared_target_sums_and_direction():
+    """Affects on one target add up; negative direction flips the sign."""
+    schema = StatSchema(
+        [
+            _spec("a", [{"target": "t", "evaluator": "CURVE", "curve": "LINEAR", "weight": 2.0}]),
+            _spec("b", [{"target": "t", "evaluator": "CURVE", "curve": "LINEAR", "direction": "negative"}]),
+        ]
+    )
+    evaluator = StatCurveEvaluator(schema)
+    out = evaluator.evaluate(np.array([[1000.0, 500.0], [0.0, 0.0]]))
+    assert out.shape == (2, 1)
+    assert np.allclose(out[:, 0], [1.5, 0.0])
+    assert np.allclose(evaluator.evaluate_stats_major(np.array([[1000.0], [500.0]]))[0], [1.5])
+
+
+def test_unknown_curve_rejected():
+    """Unsupported curve types fail at load time, not mid-evaluation."""
+    schema = StatSchema([_spec("a", [{"target": "t", "evaluator": "CURVE", "curve": "CUBIC"}])])
+    try:
+        StatCurveEvaluator(schema)
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+
+
+def test_lut_mode_exact_on_integers_and_reports_rounding_error():
+    """LUT evaluation equals the analytic curves on integer stats; the report bounds fractional error."""
+    analytic = StatCurveEvaluator.load(PROJECT_ROOT)
+    tabulated = StatCurveEvaluator(analytic.schema, use_lut=True)
+    assert {c for c, g in tabulated.groups.items() if g.lut is not None} <= {
+        "POWER",
+        "THRESHOLD_POWER",
+        "SIGMOID_EXTREME",
+    }
+    population = np.rint(analytic.schema.random_population(256, seed=3))
+    assert np.allclose(tabulated.evaluate(population), analytic.evaluate(population), atol=1e-12)
+
+    report = tabulated.lut_error_report(samples_per_step=4)
+    assert len(report) == sum(len(g.affects) for g in tabulated.groups.values() if g.lut is not None)
+    assert all(item["integer_error"] < 1e-12 for item in report)
+    worst = report[0]
+    group = tabulated.groups[worst["curve"]]
+    row = next(
+        i
+        for i, a in enumerate(group.affects)
+        if a["stat_id"] == worst["stat_id"] and a["target"] == worst["target"]
+    )
+    at = np.full((len(group.affects), 1), worst["at"])
+    brute = abs(float(group.lut_values(at)[row, 0] - group.analytic_values(at)[row, 0]))
+    assert abs(brute - worst["max_error"]) < 1e-12
+    assert worst["max_error"] >= report[-1]["max_error"]
+
+
+if __name__ == "__main__":
+    tests = [v for k, v in list(globals().items()) if k.startswith("test_") and callable(v)]
+    failed = 0
+    for t in tests:
+        try:
+            t()
+            print(f"PASS: {t.__name__}")
+        except AssertionError as e:
+            print(f"FAIL: {t.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"ERROR: {t.__name__}: {type(e).__name__}: {e}")
+            failed += 1
+    print(f"\n{len(tests) - failed}/{len(tests)} passed")
+    sys.exit(0 if failed == 0 else 1)
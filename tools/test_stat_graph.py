@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Tests for the compiled COMPOSITE stat dependency graph.
+Run with: python3 tools/test_stat_graph.py
+No pytest dependency — uses plain assertions and exit code.
+"""
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(__file__))
+from stat_graph import StatGraph  # noqa: E402
+from stat_schema import StatSchema  # noqa: E402
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _composite(stat_id, inputs):
+    return {
+        "id": stat_id,
+        "range": [0, 1000],
+        "default": 500,
+        "growth": {
+            "type": "COMPOSITE",
+            "params": {
+                "inputs": [{"stat_id": s, "weight": w} for s, w in inputs],
+                "formula": "WEIGHTED_AVERAGE",
+            },
+        },
+    }
+
+
+def _base(stat_id, lo=0, hi=1000):
+    return {"id": stat_id, "range": [lo, hi], "default": lo, "growth": {"type": "FIXED"}}
+
+
+def _reference(schema, values, stat_id):
+    """Per-agent weighted average straight from the spec."""
+    spec = schema.spec(stat_id)
+    lo, hi = spec["range"]
+    inputs = spec["growth"]["params"]["inputs"]
+    total = sum(abs(item["weight"]) for item in inputs)
+    acc = np.zeros(values.shape[1])
+    for item in inputs:
+        col = schema.index[item["stat_id"]]
+        x = (values[col] - schema.range_lo[col]) / (schema.range_hi[col] - schema.range_lo[col])
+        acc += abs(item["weight"]) * (x if item["weight"] >= 0 else 1.0 - x)
+    return lo + (hi - lo) * acc / total
+
+
+def test_levels_follow_dependencies():
+    """Composites of composites land on a later level; eval order has no duplicates."""
+    graph = StatGraph.load(PROJECT_ROOT)
+    level = {graph.schema.ids[i]: int(graph.level_of[i]) for i in range(len(graph.schema))}
+    assert level["DERIVED_ALLURE"] > level["DERIVED_CHARISMA"] > level["HEXACO_X"] == 0
+    assert len(set(graph.eval_order)) == len(graph.eval_order) == len(graph.schema)
+
+
+def test_recompute_matches_reference():
+    """Sparse per-level recompute equals the per-stat weighted average."""
+    graph = StatGraph.load(PROJECT_ROOT)
+    schema = graph.schema
+    values = np.ascontiguousarray(schema.random_population(50, seed=3).T)
+    graph.recompute(values)
+    for row in graph.inputs:
+        stat_id = schema.ids[row]
+        assert np.allclose(values[row], _reference(schema, values, stat_id)), stat_id
+
+
+def test_negative_weight_and_mixed_ranges():
+    """A negative weight inverts its input; inputs are normalized by their own range."""
+    schema = StatSchema([_base("A"), _base("B", 0, 100), _composite("C", [("A", 0.5), ("B", -0.5)])])
+    graph = StatGraph(schema)
+    values = np.array([[1000.0, 0.0], [0.0, 100.0], [0.0, 0.0]])
+    graph.recompute(values)
+    assert np.allclose(values[schema.index["C"]], [1000.0, 0.0])
+
+
+def test_incremental_recompute_matches_full():
+    """Only downstream composites change, and they match a full recompute."""
+    graph = StatGraph.load(PROJECT_ROOT)
+    schema = graph.schema
+    values = np.ascontiguousarray(schema.random_population(40, seed=5).T)
+    graph.recompute(values)
+    downstream = {schema.ids[row] for row in graph.downstream(["EMOTION_JOY"])}
+    assert downstream == {"DERIVED_CHARISMA", "DERIVED_ALLURE", "DERIVED_POPULARITY"}
+    values[schema.index["EMOTION_JOY"], :10] = 100.0
+    expected = values.copy()
+    graph.recompute(expected)
+    before = values.copy()
+    graph.recompute_changed(values, ["EMOTION_JOY"], agents=np.arange(10))
+    assert np.allclose(values, expected)
+    untouched = [i for i in range(len(schema)) if schema.ids[i] not in downstream]
+    assert np.array_equal(values[untouched], before[untouched])
+
+
+def test_cycle_and_unknown_input_rejected():
+    """Cycles and references to missing stats fail at compile time."""
+    for specs in (
+        [_base("A"), _composite("B", [("C", 1.0)]), _composite("C", [("B", 1.0), ("A", 1.0)])],
+        [_composite("B", [("MISSING", 1.0)])],
+    ):
+        try:
+            StatGraph(StatSchema(specs))
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+
+if __name__ == "__main__":
+    tests = [v for k, v in list(globals().items()) if k.startswith("test_") and callable(v)]
+    failed = 0
+    for t in tests:
+        try:
+            t()
+            print(f"PASS: {t.__name__}")
+        except AssertionError as e:
+            print(f"FAIL: {t.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"ERROR: {t.__name__}: {type(e).__name__}: {e}")
+            failed += 1
+    print(f"\n{len(tests) - failed}/{len(tests)} passed")
+    sys.exit(0 if failed == 0 else 1)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Tests for the vectorized stat growth simulator.
+Run with: python3 tools/test_stat_growth_sim.py
+No pytest dependency — uses plain assertions and exit code.
+"""
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(__file__))
+from stat_curves import log_xp_required  # noqa: E402
+from stat_growth_sim import GrowthSimulator, age_stage_index  # noqa: E402
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_age_stage_boundaries():
+    """Stage starts follow docs/design/GAME_BALANCE.md (3, 6, 12, 15, 56 years)."""
+    ages = np.array([0.0, 2.9, 3.0, 11.9, 12.0, 15.0, 55.9, 56.0, 120.0])
+    assert age_stage_index(ages).tolist() == [0, 0, 1, 2, 3, 4, 4, 5, 5]
+
+
+def test_decay_natural_uses_stage_multiplier():
+    """One adult year removes decay_per_year * adult multiplier."""
+    sim = GrowthSimulator.load(PROJECT_ROOT, 8, seed=1, start_age=30.0)
+    row = sim.schema.index["NEED_AUTONOMY"]
+    sim.values[row] = 600.0
+    sim.step(1.0, slow_dt_years=0.0)
+    spec = sim.schema.spec("NEED_AUTONOMY")["growth"]["params"]
+    expected = 600.0 - spec["decay_per_year"] * spec["age_stage_multipliers"]["adult"]
+    assert np.allclose(sim.values[row], expected)
+
+
+def test_emotions_relax_to_baseline():
+    """DECAY_FAST stats end at their personality baseline after a long idle stretch."""
+    sim = GrowthSimulator.load(PROJECT_ROOT, 16, seed=2)
+    sim.step(1.0, slow_dt_years=0.0)
+    rows = sim.rows["DECAY_FAST"]
+    assert np.allclose(sim.values[rows], np.clip(sim.emotion_baseline, sim.lo[rows], sim.hi[rows]))
+
+
+def test_skill_levels_match_brute_force():
+    """Levels are the highest level whose cumulative XP is met, capped by talent."""
+    sim = GrowthSimulator.load(PROJECT_ROOT, 32, seed=3, skill_xp_per_year=60000.0)
+    sim.run(years=3, steps_per_year=4)
+    rows = sim.rows["LOG_DIMINISHING"]
+    for local, row in enumerate(rows[:5]):
+        spec = sim.schema.specs[row]
+        params = spec["growth"]["params"]
+        ceiling_map = {int(k): v for k, v in spec["growth"]["talent_ceiling_map"].items()}
+        talent = sim.values[sim.skills.talent_rows[local]]
+        for agent in range(sim.agent_count):
+            cap = max(v for k, v in ceiling_map.items() if k <= max(talent[agent], 0))
+            level, spent = 0, 0.0
+            while level < cap:
+                spent += float(
+                    log_xp_required(
+                        level + 1,
+                        params["base_xp"],
+                        params["exponent"],
+                        params["level_breakpoints"],
+                        params["breakpoint_multipliers"],
+                    )
+                )
+                if spent > sim.skill_xp[local, agent]:
+                    break
+                level += 1
+            assert sim.values[row, agent] == level, (spec["id"], agent)
+
+
+def test_run_records_one_snapshot_per_year():
+    sim = GrowthSimulator.load(PROJECT_ROOT, 8, seed=4)
+    history = sim.run(years=5, steps_per_year=2)
+    assert history["steps"] == 10
+    assert history["mean"].shape == (6, len(sim.schema))
+    assert np.all(sim.values >= sim.lo) and np.all(sim.values <= sim.hi)
+    assert np.allclose(sim.age_years, 5.0)
+
+
+if __name__ == "__main__":
+    tests = [v for k, v in list(globals().items()) if k.startswith("test_") and callable(v)]
+    failed = 0
+    for t in tests:
+        try:
+            t()
+            print(f"PASS: {t.__name__}")
+        except AssertionError as e:
+            print(f"FAIL: {t.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"ERROR: {t.__name__}: {type(e).__name__}: {e}")
+            failed += 1
+    print(f"\n{len(tests) - failed}/{len(tests)} passed")
+    sys.exit(0 if failed == 0 else 1)
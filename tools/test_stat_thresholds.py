@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Tests for the batched hysteresis threshold engine.
+Run with: python3 tools/test_stat_thresholds.py
+No pytest dependency — uses plain assertions and exit code.
+"""
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(__file__))
+from stat_schema import StatSchema  # noqa: E402
+from stat_thresholds import ThresholdEngine, _pack_bits, _unpack_bits, synthetic_trace  # noqa: E402
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _hunger_engine(hysteresis_scale=1.0):
+    spec = {
+        "id": "NEED_HUNGER",
+        "range": [0, 1000],
+        "default": 700,
+        "thresholds": [
+            {"value": 350, "direction": "below", "effect": "MILD", "hysteresis": 20},
+            {"value": 800, "direction": "above", "effect": "FULL", "hysteresis": 50},
+        ],
+    }
+    return ThresholdEngine(StatSchema([spec]), hysteresis_scale=hysteresis_scale)
+
+
+def _effect_index(engine, effect):
+    return engine.effects.index(effect)
+
+
+def test_hysteresis_band_holds_state():
+    """Below-threshold enters at value, exits only past value + hysteresis."""
+    engine = _hunger_engine()
+    mild = _effect_index(engine, "MILD")
+    engine.reset(np.array([[400.0]]))
+    assert not engine.active[mild, 0]
+    edges = engine.update(np.array([[350.0]]))
+    assert edges.enter_threshold.tolist() == [mild] and edges.enter_agent.tolist() == [0]
+    assert len(engine.update(np.array([[365.0]]))) == 0, "inside the band: no edge"
+    edges = engine.update(np.array([[371.0]]))
+    assert edges.exit_threshold.tolist() == [mild]
+    assert not engine.active[mild, 0]
+
+
+def test_above_direction_mirrors_below():
+    engine = _hunger_engine()
+    full = _effect_index(engine, "FULL")
+    engine.reset(np.array([[800.0, 700.0]]))
+    assert engine.active[full].tolist() == [True, False]
+    edges = engine.update(np.array([[760.0, 800.0]]))
+    assert edges.enter_agent.tolist() == [1] and len(edges.exit_agent) == 0
+    edges = engine.update(np.array([[749.0, 800.0]]))
+    assert edges.exit_agent.tolist() == [0]
+
+
+def test_bitset_round_trip():
+    """Packed state is (n + 7) // 8 bytes per agent and round-trips exactly."""
+    flags = np.random.default_rng(0).random((334, 17)) > 0.5
+    packed = _pack_bits(flags)
+    assert packed.shape == (42, 17)
+    assert np.array_equal(packed, np.packbits(flags, axis=0, bitorder="little"))
+    assert np.array_equal(_unpack_bits(packed, 334), flags)
+
+
+def test_replay_matches_per_agent_loop_and_hysteresis_reduces_flips():
+    """Vectorized replay equals a scalar state machine; bands cut flapping."""
+    engine = ThresholdEngine.load(PROJECT_ROOT)
+    frames = list(synthetic_trace(engine.schema, 20, 30, seed=1))
+    assert not np.array_equal(frames[0], frames[-1])
+    counts = engine.replay(frames)
+    expected = np.zeros(len(engine), dtype=np.int64)
+    for t in range(len(engine)):
+        above = t < engine.above_count
+        enter_at, release_at = engine.enter_at[t, 0], engine.release_at[t, 0]
+        for agent in range(20):
+            series = [frame[engine.rows[t], agent] for frame in frames]
+            state = series[0] >= enter_at if above else series[0] <= enter_at
+            for v in series[1:]:
+                holds = v >= enter_at if above else v <= enter_at
+                stays = v >= release_at if above else v <= release_at
+                new_state = holds or (state and stays)
+                expected[t] += new_state != state
+                state = new_state
+    assert np.array_equal(counts["enters"] + counts["exits"], expected)
+    baseline = ThresholdEngine.load(PROJECT_ROOT, hysteresis_scale=0.0).replay(frames)
+    assert (counts["enters"] + counts["exits"]).sum() < (baseline["enters"] + baseline["exits"]).sum()
+
+
+if __name__ == "__main__":
+    tests = [v for k, v in list(globals().items()) if k.startswith("test_") and callable(v)]
+    failed = 0
+    for t in tests:
+        try:
+            t()
+            print(f"PASS: {t.__name__}")
+        except AssertionError as e:
+            print(f"FAIL: {t.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"ERROR: {t.__name__}: {type(e).__name__}: {e}")
+            failed += 1
+    print(f"\n{len(tests) - failed}/{len(tests)} passed")
+    sys.exit(0 if failed == 0 else 1)
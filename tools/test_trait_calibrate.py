@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Tests for the Monte Carlo trait rarity calibration.
+Run with: python3 tools/test_trait_calibrate.py
+No pytest dependency — uses plain assertions and exit code.
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(__file__))
+from trait_calibrate import MarginHistogram, calibrate, sample_chunks  # noqa: E402
+from trait_matcher import TraitMatcher  # noqa: E402
+
+
+def _trait(trait_id, conditions, rarity):
+    return {"id": trait_id, "rarity": rarity, "acquisition": {"conditions": conditions, "require_all": True}}
+
+
+def _cond(source, key, direction, threshold):
+    field = "axis" if source in ("hexaco", "body") else "key"
+    return {"source": source, field: key, "direction": direction, "threshold": threshold}
+
+
+def _matcher():
+    return TraitMatcher(
+        [
+            _trait("one", [_cond("hexaco", "H", "high", 0.83)], "rare"),
+            _trait("two", [_cond("hexaco", "H", "high", 0.7), _cond("body", "str", "low", 0.3)], "epic"),
+            _trait("three", [_cond("intelligence", "logical", "high", 0.8)], "uncommon"),
+        ]
+    )
+
+
+def test_sample_chunks_are_bounded_and_in_range():
+    columns = [("body", "str"), ("hexaco", "H"), ("intelligence", "logical")]
+    chunks = list(sample_chunks(columns, 25000, 10000, seed=1))
+    assert [c.shape for c in chunks] == [(3, 10000), (3, 10000), (3, 5000)]
+    population = np.concatenate(chunks, axis=1)
+    assert population[0].min() >= 0.0 and population[0].max() <= 10000.0
+    assert population[1].min() >= 0.0 and population[1].max() <= 1.0
+    assert population[2].min() >= 0.02 and population[2].max() <= 0.98
+    assert abs(population[1].mean() - 0.5) < 0.01
+    assert 0.15 < population[1].std() < 0.25
+
+
+def test_margin_sign_matches_trait_masks():
+    matcher = _matcher()
+    population = next(sample_chunks(matcher.columns, 5000, 5000, seed=2))
+    margins = MarginHistogram(matcher).margins(population)
+    assert np.array_equal(margins >= -1e-12, matcher.match(population)[: len(margins)])
+
+
+def test_fitted_thresholds_hit_targets():
+    matcher = _matcher()
+    targets = {"uncommon": 0.02, "rare": 0.01, "epic": 0.005}
+    report = calibrate(matcher, sample_chunks(matcher.columns, 200000, 40000, seed=3), targets)
+    assert report["agents"] == 200000
+    refit = TraitMatcher(
+        [_trait(item["id"], item["conditions"], item["rarity"]) for item in report["traits"]]
+    )
+    population = np.concatenate(list(sample_chunks(matcher.columns, 200000, 50000, seed=4)), axis=1)
+    frequency = refit.match(population).mean(axis=1)
+    for item in report["traits"]:
+        assert item["reachable"], item["id"]
+        assert abs(frequency[refit.index[item["id"]]] - item["target"]) < 0.25 * item["target"], item["id"]
+        assert all("original_threshold" in cond for cond in item["conditions"])
+
+
+if __name__ == "__main__":
+    tests = [v for k, v in list(globals().items()) if k.startswith("test_") and callable(v)]
+    failed = 0
+    for t in tests:
+        try:
+            t()
+            print(f"PASS: {t.__name__}")
+        except AssertionError as e:
+            print(f"FAIL: {t.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"ERROR: {t.__name__}: {type(e).__name__}: {e}")
+            failed += 1
+    print(f"\n{len(tests) - failed}/{len(tests)} passed")
+    sys.exit(0 if failed == 0 else 1)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Tests for the incremental trait condition index.
+Run with: python3 tools/test_trait_index.py
+No pytest dependency — uses plain assertions and exit code.
+"""
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(__file__))
+from trait_index import TraitIndex, synthetic_deltas  # noqa: E402
+from trait_matcher import TraitMatcher, synthetic_population  # noqa: E402
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _trait(trait_id, conditions, rarity="rare", incompat=None, required=None):
+    acquisition = {"conditions": conditions, "require_all": True}
+    if required:
+        acquisition["required_traits"] = required
+    return {
+        "id": trait_id,
+        "rarity": rarity,
+        "acquisition": acquisition,
+        "incompatible_with": incompat or [],
+    }
+
+
+def _hx(axis, direction, threshold):
+    return {"source": "hexaco", "axis": axis, "direction": direction, "threshold": threshold}
+
+
+def _small_index():
+    return TraitIndex(
+        TraitMatcher(
+            [
+                _trait("calm", [_hx("E", "low", 0.3)], incompat=["bold"]),
+                _trait("bold", [_hx("X", "high", 0.7)], rarity="epic"),
+                _trait("kind", [_hx("A", "high", 0.7)]),
+                _trait("Y_pair", [], rarity="legendary", required=["calm", "kind"]),
+            ]
+        )
+    )
+
+
+def test_index_lists_readers_per_column():
+    index = _small_index()
+    assert index.by_column[("hexaco", "E")] == ["calm", "Y_pair"]
+    assert index.by_column[("hexaco", "X")] == ["bold"]
+    assert index.by_column[("hexaco", "A")] == ["kind", "Y_pair"]
+
+
+def test_incompatibility_prefers_rarer_trait():
+    index = _small_index()
+    # columns: A, E, X
+    index.reset(np.array([[0.8, 0.8], [0.2, 0.2], [0.5, 0.9]]))
+    calm, bold, pair = (index.matcher.index[t] for t in ("calm", "bold", "Y_pair"))
+    assert index.held[calm].tolist() == [True, False]
+    assert index.held[bold].tolist() == [False, True]
+    assert index.eligible[pair].tolist() == [True, True]
+    # Losing "bold" frees "calm" again.
+    index.apply([1], [2], [0.1])
+    assert index.held[calm].tolist() == [True, True]
+    index.apply_one(0, 2, 0.95)
+    assert index.held[calm].tolist() == [False, True]
+    assert index.held[bold].tolist() == [True, False]
+
+
+def test_incremental_matches_full_rematch():
+    index = TraitIndex.load(PROJECT_ROOT)
+    index.reset(synthetic_population(index.matcher.columns, 500, seed=4, sd=0.25))
+    agents, columns, values = synthetic_deltas(index, 3000, seed=5, step=0.2)
+    for start in range(0, 2000, 250):
+        part = slice(start, start + 250)
+        index.apply(agents[part], columns[part], values[part])
+    for agent, column, value in zip(agents[2000:], columns[2000:], values[2000:]):
+        index.apply_one(int(agent), int(column), float(value))
+    eligible = index.matcher.match(index.population)
+    assert np.array_equal(index.eligible, eligible)
+    assert np.array_equal(index.held, index.resolve(eligible))
+
+
+if __name__ == "__main__":
+    tests = [v for k, v in list(globals().items()) if k.startswith("test_") and callable(v)]
+    failed = 0
+    for t in tests:
+        try:
+            t()
+            print(f"PASS: {t.__name__}")
+        except AssertionError as e:
+            print(f"FAIL: {t.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"ERROR: {t.__name__}: {type(e).__name__}: {e}")
+            failed += 1
+    print(f"\n{len(tests) - failed}/{len(tests)} passed")
+    sys.exit(0 if failed == 0 else 1)
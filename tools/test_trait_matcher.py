@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Tests for the trait_defs_v3 batch matcher.
+Run with: python3 tools/test_trait_matcher.py
+No pytest dependency — uses plain assertions and exit code.
+"""
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(__file__))
+from trait_matcher import TraitMatcher, synthetic_population  # noqa: E402
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _trait(trait_id, conditions, rarity="rare", required=None):
+    acquisition = {"conditions": conditions, "require_all": True}
+    if required:
+        acquisition["required_traits"] = required
+    return {"id": trait_id, "rarity": rarity, "category": "archetype", "acquisition": acquisition}
+
+
+def _cond(source, key, direction, threshold):
+    field = "axis" if source in ("hexaco", "body") else "key"
+    return {"source": source, field: key, "direction": direction, "threshold": threshold}
+
+
+def _reference(trait, population, columns):
+    """Per-agent, per-condition evaluation straight from the definition."""
+    result = []
+    for agent in range(population.shape[1]):
+        oks = []
+        for cond in trait["acquisition"]["conditions"]:
+            key = cond.get("axis", cond.get("key"))
+            value = population[columns.index((cond["source"], key)), agent]
+            if cond["source"] == "body":
+                value /= 10000.0
+            oks.append(value >= cond["threshold"] if cond["direction"] == "high" else value <= cond["threshold"])
+        result.append(all(oks))
+    return np.array(result)
+
+
+def test_directions_and_body_normalization():
+    matcher = TraitMatcher(
+        [
+            _trait("high_h", [_cond("hexaco", "H", "high", 0.83)]),
+            _trait("low_str", [_cond("body", "str", "low", 0.17)]),
+            _trait("both", [_cond("hexaco", "H", "high", 0.83), _cond("intelligence", "logical", "low", 0.12)]),
+            _trait("event_only", []),
+        ]
+    )
+    assert matcher.columns == [("body", "str"), ("hexaco", "H"), ("intelligence", "logical")]
+    population = np.array(
+        [
+            [1700.0, 1701.0, 9000.0, 0.0],
+            [0.83, 0.8299, 0.9, 1.0],
+            [0.12, 0.5, 0.02, 0.98],
+        ]
+    )
+    masks = matcher.match(population)
+    assert masks[matcher.index["high_h"]].tolist() == [True, False, True, True]
+    assert masks[matcher.index["low_str"]].tolist() == [True, False, False, True]
+    assert masks[matcher.index["both"]].tolist() == [True, False, True, False]
+    assert matcher.unmatched == ["event_only"]
+
+
+def test_synergy_requires_all_listed_traits():
+    matcher = TraitMatcher(
+        [
+            _trait("Y_pair", [], rarity="epic", required=["a", "b"]),
+            _trait("a", [_cond("hexaco", "E", "high", 0.5)]),
+            _trait("b", [_cond("hexaco", "X", "low", 0.5)]),
+            _trait("Y_needs_event", [], required=["a", "ev"]),
+            _trait("ev", []),
+        ]
+    )
+    population = np.array([[0.6, 0.6, 0.4], [0.4, 0.6, 0.4]])
+    masks = matcher.match(population)
+    assert masks[matcher.index["Y_pair"]].tolist() == [True, False, False]
+    assert sorted(matcher.unmatched) == ["Y_needs_event", "ev"]
+    assert matcher.unresolved_synergy == ["Y_needs_event"]
+    assert matcher.rarity_report(masks.sum(axis=1), 3)["unresolved_synergy"] == ["Y_needs_event"]
+
+
+def test_integer_population_matches_float():
+    """Body stats usually arrive as ints; matching must not depend on the dtype."""
+    matcher = TraitMatcher(
+        [
+            _trait("low_str", [_cond("body", "str", "low", 0.17)]),
+            _trait("high_agi", [_cond("body", "agi", "high", 0.5)]),
+        ]
+    )
+    population = np.array([[4999, 5000, 9000, 0], [1700, 1701, 9000, 0]], dtype=np.int32)
+    masks = matcher.match(population)
+    assert np.array_equal(masks, matcher.match(population.astype(float)))
+    assert masks[matcher.index["high_agi"]].tolist() == [False, True, True, False]
+    assert masks[matcher.index["low_str"]].tolist() == [True, False, False, True]
+
+
+def test_repo_traits_match_per_condition_reference():
+    matcher = TraitMatcher.load(PROJECT_ROOT)
+    population = synthetic_population(matcher.columns, 3000, seed=11, sd=0.25)
+    masks = matcher.match(population)
+    for trait_id in matcher.ids:
+        trait = matcher.traits[trait_id]
+        if trait["acquisition"].get("required_traits"):
+            required = [masks[matcher.index[r]] for r in trait["acquisition"]["required_traits"]]
+            expected = np.logical_and.reduce(required)
+        else:
+            expected = _reference(trait, population, matcher.columns)
+        assert np.array_equal(masks[matcher.index[trait_id]], expected), trait_id
+
+
+def test_rarity_report_tiers():
+    matcher = TraitMatcher.load(PROJECT_ROOT)
+    population = synthetic_population(matcher.columns, 20000, seed=2)
+    counts, agents = matcher.count([population[:, :7000], population[:, 7000:]])
+    assert np.array_equal(counts, matcher.match(population).sum(axis=1))
+    report = matcher.rarity_report(counts, agents)
+    assert report["agents"] == 20000
+    tiers = report["tiers"]
+    assert tiers["legendary"]["median"] < tiers["epic"]["median"] < tiers["rare"]["median"]
+    assert len(report["traits"]) == len(matcher)
+    assert all(item in matcher.traits for item in report["unmatched"])
+
+
+if __name__ == "__main__":
+    tests = [v for k, v in list(globals().items()) if k.startswith("test_") and callable(v)]
+    failed = 0
+    for t in tests:
+        try:
+            t()
+            print(f"PASS: {t.__name__}")
+        except AssertionError as e:
+            print(f"FAIL: {t.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"ERROR: {t.__name__}: {type(e).__name__}: {e}")
+            failed += 1
+    print(f"\n{len(tests) - failed}/{len(tests)} passed")
+    sys.exit(0 if failed == 0 else 1)
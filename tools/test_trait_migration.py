@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Tests for trait_migration validation index and rules.
+
+Run with: python3 tools/test_trait_migration.py
+No pytest dependency — uses plain assertions and exit code.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from trait_migration import (  # noqa: E402
+    DEFAULT_RULES,
+    MigrationIndex,
+    load_rules,
+    run_rules,
+)
+
+
+def _fixture():
+    traits = [
+        {"id": "f_sincere", "category": "facet", "t_on": 0.90, "t_off": 0.84, "salience_center": 0.87},
+        {"id": "f_deceptive", "category": "facet", "t_on": 0.16, "t_off": 0.22},
+        {"id": "d_psychopath_primary", "category": "dark", "violation_override": True, "rarity_bonus": 1.2},
+    ]
+    violation = {
+        "lie": [{"trait_id": "f_deceptive", "base_stress": 2.0}, {"trait_id": "f_sincere", "base_stress": 14.0}],
+        "harm_innocent": [{"trait_id": "d_psychopath_primary", "base_stress": 0.0}],
+    }
+    behavior = {"share_food": [{"trait_id": "f_sincere", "extreme_val": 0.8}]}
+    return traits, violation, behavior
+
+
+def test_index_lookups_match_scan_semantics():
+    traits, violation, behavior = _fixture()
+    traits.append({"id": "f_sincere", "t_on": 0.5})
+    index = MigrationIndex(traits, violation, behavior)
+    assert index.trait("f_sincere")["t_on"] == 0.90, "first occurrence should win"
+    assert index.trait("missing") is None
+    assert index.has_violation_entry("lie", "f_sincere", 14.0005)
+    assert not index.has_violation_entry("lie", "f_sincere", 14.01)
+    assert not index.has_violation_entry("steal", "f_sincere", 14.0)
+    assert index.has_mapping("behavior", "share_food", "f_sincere", 0.8)
+
+
+def test_default_rules_pass_and_report_failures():
+    traits, violation, behavior = _fixture()
+    assert run_rules(MigrationIndex(traits, violation, behavior), DEFAULT_RULES) == []
+
+    traits[0]["t_on"] = 0.8
+    del traits[2]
+    violation["lie"].pop()
+    errors = run_rules(MigrationIndex(traits, violation, behavior), DEFAULT_RULES)
+    assert any(e.startswith("f_sincere t_on mismatch") for e in errors), errors
+    assert errors.count("Missing d_psychopath_primary") == 1, errors
+    assert "violation_mappings missing lie -> f_sincere(14)" in errors, errors
+
+
+def test_rules_file_loading():
+    traits, violation, behavior = _fixture()
+    rules = [
+        {"check": "trait_exists", "trait": "f_deceptive"},
+        {"check": "trait_field", "trait": "f_deceptive", "field": "category", "equals": "facet"},
+        {"check": "mapping", "map": "behavior", "action": "share_food", "trait": "f_sincere", "equals": 0.9,
+         "tolerance": 0.2},
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "rules.json"
+        path.write_text(json.dumps(rules), encoding="utf-8")
+        loaded = load_rules(path)
+        assert run_rules(MigrationIndex(traits, violation, behavior), loaded) == []
+
+        path.write_text(json.dumps([{"check": "trait_field", "trait": "x"}]), encoding="utf-8")
+        try:
+            load_rules(path)
+        except ValueError as e:
+            assert "missing" in str(e), e
+        else:
+            raise AssertionError("rule without field/equals should be rejected")
+
+
+if __name__ == "__main__":
+    tests = [v for k, v in list(globals().items()) if k.startswith("test_") and callable(v)]
+    failed = 0
+    for t in tests:
+        try:
+            t()
+            print(f"PASS: {t.__name__}")
+        except AssertionError as e:
+            print(f"FAIL: {t.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"ERROR: {t.__name__}: {type(e).__name__}: {e}")
+            failed += 1
+    print(f"\n{len(tests) - failed}/{len(tests)} passed")
+    sys.exit(0 if failed == 0 else 1)
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""Monte Carlo rarity calibration for trait_defs_v3 thresholds.
+
+gen_trait_v3.py assigns rarity from condition count and extremeness, and
+fix_trait_centers.py hand-tunes cond_center values; neither checks how rare a
+trait actually is. This command samples millions of synthetic agents from the
+documented distributions, in fixed-size chunks so memory does not grow with
+the sample:
+  hexaco, value  N(0.5, sd), sd drawn per agent from [sd_lo, sd_hi]
+                 (0.15-0.25 by default), clamped to [0, 1]
+  intelligence   same draw, clamped to [0.02, 0.98]
+  body           same draw on the 0-10000 scale
+and counts every matched trait with TraitMatcher.
+
+To fit thresholds, each conditional trait gets a margin per agent: the
+smallest signed distance (normalized units) by which its conditions are met,
+positive past the threshold. The trait holds iff margin >= 0, and moving all
+of its thresholds delta further out keeps exactly the agents with margin >=
+delta. Margins go into a fixed per-trait histogram, so the delta that hits the
+tier's target frequency is read off the histogram tail after the last chunk.
+
+Usage:
+  python3 tools/trait_calibrate.py --project-root . --agents 2000000
+  python3 tools/trait_calibrate.py --project-root . --target legendary=0.0001 --report-json calib.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from trait_matcher import SOURCE_SCALE, TraitMatcher
+
+# Fraction of agents that should hold a trait of each tier.
+TARGET_FREQUENCY: Dict[str, float] = {
+    "common": 0.05,
+    "uncommon": 0.014,
+    "rare": 0.005,
+    "epic": 0.001,
+    "legendary": 0.0002,
+}
+VALUE_RANGE: Dict[str, Tuple[float, float]] = {"intelligence": (0.02, 0.98)}
+MARGIN_BINS = 20000
+
+
+def sample_chunks(
+    columns: List[Tuple[str, str]],
+    agent_count: int,
+    chunk: int,
+    seed: int = 0,
+    sd_range: Tuple[float, float] = (0.15, 0.25),
+) -> Iterable[np.ndarray]:
+    """(columns, chunk) raw-unit population chunks totalling agent_count agents."""
+    rng = np.random.default_rng(seed)
+    lo = np.array([VALUE_RANGE.get(source, (0.0, 1.0))[0] for source, _key in columns]).reshape(-1, 1)
+    hi = np.array([VALUE_RANGE.get(source, (0.0, 1.0))[1] for source, _key in columns]).reshape(-1, 1)
+    scale = np.array([SOURCE_SCALE[source] for source, _key in columns]).reshape(-1, 1)
+    remaining = agent_count
+    while remaining > 0:
+        size = min(chunk, remaining)
+        remaining -= size
+        sd = rng.uniform(sd_range[0], sd_range[1], size=size)
+        population = rng.standard_normal((len(columns), size))
+        population *= sd
+        population += 0.5
+        np.clip(population, lo, hi, out=population)
+        population *= scale
+        yield population
+
+
+class MarginHistogram:
+    """Streaming per-trait histograms of the condition margin over [-1, 1]."""
+
+    def __init__(self, matcher: TraitMatcher, bins: int = MARGIN_BINS) -> None:
+        self.matcher = matcher
+        self.bins = bins
+        scale = np.array([SOURCE_SCALE[source] for source, _key in matcher.columns])
+        self.cond_scale = scale[matcher.cond_columns].reshape(-1, 1)
+        # Normalized sign * threshold, matching matcher.cond_level / scale.
+        self.cond_level = matcher.cond_level / self.cond_scale
+        self.traits = len(matcher.cond_starts)
+        self.counts = np.zeros((self.traits, bins), dtype=np.int64)
+        self.agents = 0
+
+    def margins(self, population: np.ndarray) -> np.ndarray:
+        """(conditional traits, agents) margin in normalized units."""
+        matcher = self.matcher
+        values = population[matcher.cond_columns]
+        values /= self.cond_scale
+        values *= matcher.cond_sign
+        values -= self.cond_level
+        out = np.minimum.reduceat(values, matcher.cond_starts, axis=0)
+        if matcher.any_of.any():
+            either = np.maximum.reduceat(values, matcher.cond_starts, axis=0)
+            out[matcher.any_of] = either[matcher.any_of]
+        return out
+
+    def add(self, population: np.ndarray) -> None:
+        margin = self.margins(population)
+        index = ((margin + 1.0) * (self.bins / 2.0)).astype(np.intp)
+        np.clip(index, 0, self.bins - 1, out=index)
+        index += (np.arange(self.traits, dtype=np.intp) * self.bins).reshape(-1, 1)
+        self.counts += np.bincount(index.ravel(), minlength=self.traits * self.bins).reshape(
+            self.traits, self.bins
+        )
+        self.agents += population.shape[1]
+
+    def fit(self, targets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-trait shift delta whose frequency P(margin >= delta) is closest to target.
+
+        Clamped stats put a point mass at the range ends, so an exact hit is
+        not always possible; the achieved frequency is returned alongside.
+        """
+        tail = np.cumsum(self.counts[:, ::-1], axis=1)[:, ::-1] / max(self.agents, 1)
+        tail = np.concatenate([tail, np.zeros((self.traits, 1))], axis=1)
+        # tail is non-increasing: the last bin still above target, or the next one.
+        above = np.maximum((tail > targets.reshape(-1, 1)).sum(axis=1) - 1, 0)
+        rows = np.arange(self.traits)
+        below = np.minimum(above + 1, self.bins)
+        first = np.where(
+            np.abs(tail[rows, above] - targets) <= np.abs(tail[rows, below] - targets), above, below
+        )
+        delta = -1.0 + 2.0 * first / self.bins
+        return delta, tail[rows, first]
+
+
+def fitted_conditions(matcher: TraitMatcher, trait: int, delta: float) -> List[Dict[str, Any]]:
+    """The trait's conditions with every threshold moved delta further out, clamped to [0, 1]."""
+    trait_id = matcher.ids[trait]
+    out = []
+    for cond in matcher.traits[trait_id]["acquisition"]["conditions"]:
+        sign = 1.0 if cond["direction"] == "high" else -1.0
+        fitted = dict(cond)
+        fitted["original_threshold"] = cond["threshold"]
+        fitted["threshold"] = round(float(np.clip(cond["threshold"] + sign * delta, 0.0, 1.0)), 4)
+        out.append(fitted)
+    return out
+
+
+def calibrate(
+    matcher: TraitMatcher,
+    chunks: Iterable[np.ndarray],
+    targets: Dict[str, float],
+    bins: int = MARGIN_BINS,
+) -> Dict[str, Any]:
+    histogram = MarginHistogram(matcher, bins=bins)
+    counts = np.zeros(len(matcher), dtype=np.int64)
+    for chunk in chunks:
+        counts += matcher.match(chunk).sum(axis=1)
+        histogram.add(chunk)
+    agents = histogram.agents
+    rarity = [str(matcher.traits[trait_id].get("rarity", "")) for trait_id in matcher.ids]
+    target = np.array([targets.get(rarity[t], np.nan) for t in range(histogram.traits)])
+    delta, achieved = histogram.fit(np.nan_to_num(target, nan=1.0))
+    traits: List[Dict[str, Any]] = []
+    for row, trait_id in enumerate(matcher.ids):
+        item: Dict[str, Any] = {
+            "id": trait_id,
+            "rarity": rarity[row],
+            "frequency": float(counts[row] / max(agents, 1)),
+            "target": targets.get(rarity[row]),
+        }
+        if row < histogram.traits and not np.isnan(target[row]):
+            item["delta"] = round(float(delta[row]), 4)
+            item["fitted_frequency"] = float(achieved[row])
+            # Off by more than half the target even at the best shift.
+            item["reachable"] = bool(abs(achieved[row] - target[row]) <= 0.5 * target[row])
+            item["conditions"] = fitted_conditions(matcher, row, float(delta[row]))
+        traits.append(item)
+    return {"agents": agents, "targets": targets, "traits": traits}
+
+
+def threshold_summary(report: Dict[str, Any], constants: Dict[str, float]) -> Dict[str, Dict[str, float]]:
+    """Median fitted threshold of the conditions that use each gen_trait_v3 constant."""
+    fitted: Dict[str, List[float]] = {name: [] for name in constants}
+    by_value = {round(value, 4): name for name, value in constants.items()}
+    for item in report["traits"]:
+        for cond in item.get("conditions", []):
+            name = by_value.get(round(cond["original_threshold"], 4))
+            if name:
+                fitted[name].append(cond["threshold"])
+    return {
+        name: {"current": constants[name], "median_fitted": float(np.median(values)), "conditions": len(values)}
+        for name, values in fitted.items()
+        if values
+    }
+
+
+def _parse_targets(items: List[str]) -> Dict[str, float]:
+    targets = dict(TARGET_FREQUENCY)
+    for item in items:
+        tier, _sep, value = item.partition("=")
+        if tier not in targets or not value:
+            raise ValueError(f"bad --target {item!r}; expected <tier>=<frequency>, tier in {sorted(targets)}")
+        targets[tier] = float(value)
+    return targets
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--project-root", default=".", help="WorldSim project root")
+    parser.add_argument("--agents", type=int, default=2000000, help="total synthetic agents")
+    parser.add_argument(
+        "--chunk",
+        type=int,
+        default=50000,
+        help="agents sampled per chunk; peak memory is about conditions * chunk * 8 bytes",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="sampling seed")
+    parser.add_argument("--sd-lo", type=float, default=0.15, help="lowest per-agent sd")
+    parser.add_argument("--sd-hi", type=float, default=0.25, help="highest per-agent sd")
+    parser.add_argument(
+        "--target",
+        action="append",
+        default=[],
+        help="override a tier's target frequency, e.g. legendary=0.0001 (repeatable)",
+    )
+    parser.add_argument("--top", type=int, default=10, help="print the N traits furthest from target")
+    parser.add_argument("--report-json", default="", help="optional per-trait calibration report")
+    args = parser.parse_args()
+
+    from gen_trait_v3 import T_H, T_HH, T_L, T_LL
+
+    project_root = Path(args.project_root).resolve()
+    matcher = TraitMatcher.load(project_root)
+    targets = _parse_targets(args.target)
+    started = time.perf_counter()
+    report = calibrate(
+        matcher,
+        sample_chunks(matcher.columns, args.agents, max(args.chunk, 1), args.seed, (args.sd_lo, args.sd_hi)),
+        targets,
+    )
+    elapsed_s = time.perf_counter() - started
+    constants = {"T_HH": T_HH, "T_H": T_H, "T_L": T_L, "T_LL": T_LL}
+    report["constants"] = threshold_summary(report, constants)
+    print(
+        f"[trait_calibrate] agents={report['agents']} chunk={args.chunk} traits={len(matcher)} "
+        f"elapsed_s={elapsed_s:.1f} agents_per_s={report['agents'] / max(elapsed_s, 1e-9):,.0f}"
+    )
+    for tier in targets:
+        rows = [item for item in report["traits"] if item["rarity"] == tier]
+        if rows:
+            median = float(np.median([item["frequency"] for item in rows]))
+            print(f"  {tier}: traits={len(rows)} median_frequency={median:.5f} target={targets[tier]:g}")
+    for name, item in report["constants"].items():
+        print(
+            f"  {name}: current={item['current']:.3f} median_fitted={item['median_fitted']:.3f} "
+            f"(conditions={item['conditions']})"
+        )
+    fitted = [item for item in report["traits"] if "delta" in item]
+    unreachable = [item["id"] for item in fitted if not item["reachable"]]
+    if unreachable:
+        print(f"[trait_calibrate] target not reachable within [0, 1]: {', '.join(unreachable)}")
+    for item in sorted(fitted, key=lambda item: -abs(item["delta"]))[: args.top]:
+        print(
+            f"  {item['id']} ({item['rarity']}): frequency={item['frequency']:.5f} "
+            f"-> {item['fitted_frequency']:.5f} delta={item['delta']:+.4f}"
+        )
+    if args.report_json:
+        out_path = (project_root / args.report_json).resolve()
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        with out_path.open("w", encoding="utf-8") as fp:
+            json.dump(report, fp, indent=2, ensure_ascii=False)
+            fp.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""Inverted condition index for incremental trait re-evaluation.
+
+TraitIndex maps every (source, key) population column to the matched traits
+whose acquisition conditions read it (synergy traits follow their required
+traits), so a stat delta re-tests only those traits for the agents it
+touched instead of every trait.
+
+It also applies `incompatible_with`: among the traits an agent is eligible
+for, traits are granted greedily in priority order (rarer tier first, then
+definition order) and a trait is skipped when an incompatible trait was
+already granted. The rule depends only on eligibility, so the incremental
+state always equals a full re-match followed by resolve().
+
+Usage:
+  python3 tools/trait_index.py --project-root . --agents 100000 --deltas 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from trait_matcher import RARITY_TIERS, SOURCE_SCALE, TraitMatcher, synthetic_population
+
+
+def _csr(groups: List[List[int]]) -> Tuple[np.ndarray, np.ndarray]:
+    indptr = np.zeros(len(groups) + 1, dtype=np.intp)
+    indptr[1:] = np.cumsum([len(group) for group in groups])
+    flat = np.array([item for group in groups for item in group], dtype=np.intp)
+    return indptr, flat
+
+
+def _expand(indptr: np.ndarray, flat: np.ndarray, keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """For each key, its CSR members: (position of the key, member) pairs."""
+    lengths = indptr[keys + 1] - indptr[keys]
+    owner = np.repeat(np.arange(len(keys)), lengths)
+    ends = np.cumsum(lengths)
+    local = np.arange(ends[-1] if len(ends) else 0) - np.repeat(ends - lengths, lengths)
+    return owner, flat[indptr[keys][owner] + local]
+
+
+class TraitIndex:
+    def __init__(self, matcher: TraitMatcher) -> None:
+        self.matcher = matcher
+        conditional = len(matcher.cond_starts)
+        self.conditional = conditional
+        self.cond_ends = np.r_[matcher.cond_starts[1:], len(matcher.cond_columns)].astype(np.intp)
+
+        readers: List[set] = [set() for _ in matcher.columns]
+        for trait in range(conditional):
+            for column in matcher.cond_columns[matcher.cond_starts[trait] : self.cond_ends[trait]]:
+                readers[column].add(trait)
+        # Synergy traits are ordered after their requirements, so one pass
+        # propagates readers through chains of synergies.
+        self.synergy_depth = np.zeros(len(matcher), dtype=np.intp)
+        for offset, (_trait_id, required) in enumerate(matcher.synergy):
+            row = conditional + offset
+            self.synergy_depth[row] = 1 + max(int(self.synergy_depth[r]) for r in required)
+            for column_readers in readers:
+                if column_readers.intersection(required):
+                    column_readers.add(row)
+        self.column_indptr, self.column_traits = _csr([sorted(item) for item in readers])
+        self.by_column: Dict[Tuple[str, str], List[str]] = {
+            column: [matcher.ids[row] for row in sorted(readers[idx])]
+            for idx, column in enumerate(matcher.columns)
+        }
+        self.required_indptr, self.required_rows = _csr(
+            [[] for _ in range(conditional)] + [required for _trait_id, required in matcher.synergy]
+        )
+
+        self.incompatible: Dict[int, List[int]] = {}
+        for trait_id, row in matcher.index.items():
+            for other in matcher.traits[trait_id].get("incompatible_with") or []:
+                if other in matcher.index and other != trait_id:
+                    self.incompatible.setdefault(row, []).append(matcher.index[other])
+                    self.incompatible.setdefault(matcher.index[other], []).append(row)
+        tier = {name: rank for rank, name in enumerate(RARITY_TIERS)}
+
+        def rank(row: int) -> Tuple[int, int]:
+            rarity = str(matcher.traits[matcher.ids[row]].get("rarity", ""))
+            return (-tier.get(rarity, -1), row)
+
+        self.priority: List[Tuple[int, np.ndarray]] = []
+        for row in sorted(self.incompatible, key=rank):
+            blockers = sorted({other for other in self.incompatible[row] if rank(other) < rank(row)})
+            self.priority.append((row, np.array(blockers, dtype=np.intp)))
+        self.has_incompatible = np.zeros(len(matcher), dtype=bool)
+        self.has_incompatible[list(self.incompatible)] = True
+
+        # Plain-list copies for apply_one(), where numpy call overhead would
+        # dominate a handful of scalar comparisons.
+        self._readers: List[List[int]] = [sorted(item) for item in readers]
+        self._tests: List[List[Tuple[int, float, float]]] = [
+            [
+                (
+                    int(matcher.cond_columns[c]),
+                    float(matcher.cond_sign[c, 0]),
+                    float(matcher.cond_level[c, 0]),
+                )
+                for c in range(matcher.cond_starts[trait], self.cond_ends[trait])
+            ]
+            for trait in range(conditional)
+        ]
+        self._any_of: List[bool] = [bool(item) for item in matcher.any_of]
+        self._required: List[List[int]] = [required for _trait_id, required in matcher.synergy]
+        self._priority: List[Tuple[int, List[int]]] = [
+            (row, blockers.tolist()) for row, blockers in self.priority
+        ]
+
+        self.population = np.zeros((len(matcher.columns), 0))
+        self.eligible = np.zeros((len(matcher), 0), dtype=bool)
+        self.held = np.zeros((len(matcher), 0), dtype=bool)
+
+    @classmethod
+    def load(cls, project_root: Path) -> "TraitIndex":
+        return cls(TraitMatcher.load(project_root))
+
+    def resolve(self, eligible: np.ndarray) -> np.ndarray:
+        """Held traits for (traits, agents) eligibility under the incompatibility rule."""
+        held = eligible.copy()
+        for row, blockers in self.priority:
+            if len(blockers):
+                held[row] &= ~held[blockers].any(axis=0)
+        return held
+
+    def reset(self, population: np.ndarray) -> None:
+        self.population = np.array(population, dtype=float)
+        self.eligible = self.matcher.match(self.population)
+        self.held = self.resolve(self.eligible)
+
+    def _retest(self, agents: np.ndarray, traits: np.ndarray) -> np.ndarray:
+        """Recompute eligibility of (agent, trait) pairs in place; returns it."""
+        matcher = self.matcher
+        agent_count = self.population.shape[1]
+        eligible = self.eligible.reshape(-1)
+        result = np.empty(len(traits), dtype=bool)
+        plain = traits < self.conditional
+        if plain.all():
+            plain = slice(None)
+        pair_agents, pair_traits = agents[plain], traits[plain]
+        if len(pair_traits):
+            starts = matcher.cond_starts[pair_traits]
+            lengths = self.cond_ends[pair_traits] - starts
+            ends = np.cumsum(lengths)
+            offsets = ends - lengths
+            conds = np.arange(ends[-1]) + np.repeat(starts - offsets, lengths)
+            flat = matcher.cond_columns[conds] * agent_count + np.repeat(pair_agents, lengths)
+            values = np.take(self.population.reshape(-1), flat)
+            values *= np.take(matcher.cond_sign[:, 0], conds)
+            holds = values >= np.take(matcher.cond_level[:, 0], conds)
+            part = np.logical_and.reduceat(holds, offsets)
+            any_of = matcher.any_of[pair_traits]
+            if any_of.any():
+                part[any_of] = np.logical_or.reduceat(holds, offsets)[any_of]
+            eligible[pair_traits * agent_count + pair_agents] = part
+            result[plain] = part
+        if isinstance(plain, slice):
+            return result
+        synergy = ~plain
+        depth = self.synergy_depth[traits]
+        for level in range(1, int(depth[synergy].max()) + 1):
+            at_level = synergy & (depth == level)
+            pair_agents, pair_traits = agents[at_level], traits[at_level]
+            owner, required = _expand(self.required_indptr, self.required_rows, pair_traits)
+            ok = eligible[required * agent_count + pair_agents[owner]]
+            offsets = np.r_[0, np.cumsum(np.bincount(owner, minlength=len(pair_traits)))[:-1]]
+            part = np.logical_and.reduceat(ok, offsets)
+            eligible[pair_traits * agent_count + pair_agents] = part
+            result[at_level] = part
+        return result
+
+    def _resolve_agents(self, agents: np.ndarray) -> None:
+        held = self.held
+        eligible = self.eligible
+        for row, blockers in self.priority:
+            current = eligible[row, agents]
+            if len(blockers):
+                current &= ~held[blockers][:, agents].any(axis=0)
+            held[row, agents] = current
+
+    def apply(self, agents: np.ndarray, columns: np.ndarray, values: np.ndarray) -> int:
+        """Apply a batch of (agent, column, new raw value) deltas; returns re-tested pairs.
+
+        Pairs are not de-duplicated: repeats re-test against the same final
+        values, which costs less than sorting them away.
+        """
+        agents = np.asarray(agents, dtype=np.intp)
+        columns = np.asarray(columns, dtype=np.intp)
+        self.population[columns, agents] = values
+        owner, traits = _expand(self.column_indptr, self.column_traits, columns)
+        if not len(traits):
+            return 0
+        pair_agents = agents[owner]
+        result = self._retest(pair_agents, traits)
+        self.held.reshape(-1)[traits * self.population.shape[1] + pair_agents] = result
+        contested = self.has_incompatible[traits]
+        if contested.any():
+            self._resolve_agents(np.unique(pair_agents[contested]))
+        return len(traits)
+
+    def apply_one(self, agent: int, column: int, value: float) -> None:
+        """Scalar path for a single delta: re-tests the column's readers for one agent."""
+        population = self.population
+        eligible = self.eligible
+        held = self.held
+        population[column, agent] = value
+        contested = False
+        for row in self._readers[column]:
+            if row < self.conditional:
+                tests = (sign * population[c, agent] >= level for c, sign, level in self._tests[row])
+                ok = any(tests) if self._any_of[row] else all(tests)
+            else:
+                ok = all(eligible[r, agent] for r in self._required[row - self.conditional])
+            eligible[row, agent] = ok
+            held[row, agent] = ok
+            contested = contested or row in self.incompatible
+        if contested:
+            for row, blockers in self._priority:
+                held[row, agent] = eligible[row, agent] and not any(held[b, agent] for b in blockers)
+
+
+def synthetic_deltas(
+    index: TraitIndex,
+    count: int,
+    seed: int = 0,
+    step: float = 0.05,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Random single-column nudges of `step` sd (normalized units), one per delta."""
+    rng = np.random.default_rng(seed)
+    agent_count = index.population.shape[1]
+    agents = rng.integers(0, agent_count, size=count)
+    columns = rng.integers(0, len(index.matcher.columns), size=count)
+    scale = np.array([SOURCE_SCALE[source] for source, _key in index.matcher.columns])[columns]
+    values = index.population[columns, agents] + rng.normal(0.0, step, size=count) * scale
+    return agents, columns, np.clip(values, 0.0, scale)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--project-root", default=".", help="WorldSim project root")
+    parser.add_argument("--agents", type=int, default=100000, help="synthetic population size")
+    parser.add_argument("--deltas", type=int, default=200000, help="synthetic stat deltas to apply")
+    parser.add_argument("--batch", type=int, default=1000, help="deltas applied per apply() call")
+    parser.add_argument("--seed", type=int, default=0, help="population/delta seed")
+    args = parser.parse_args()
+
+    index = TraitIndex.load(Path(args.project_root).resolve())
+    matcher = index.matcher
+    fanout = np.diff(index.column_indptr)
+    print(
+        f"[trait_index] columns={len(matcher.columns)} traits={len(matcher)} "
+        f"fanout_mean={fanout.mean():.1f} fanout_max={int(fanout.max())} "
+        f"incompatible_traits={len(index.incompatible)}"
+    )
+    index.reset(synthetic_population(matcher.columns, args.agents, seed=args.seed))
+    agents, columns, values = synthetic_deltas(index, args.deltas, seed=args.seed + 1)
+    batch = max(args.batch, 1)
+
+    started = time.perf_counter()
+    retested = 0
+    for start in range(0, args.deltas, batch):
+        part = slice(start, start + batch)
+        retested += index.apply(agents[part], columns[part], values[part])
+    batch_s = time.perf_counter() - started
+
+    # Baseline: re-check every trait of the touched agents, as before the index.
+    sample = min(args.deltas, 20 * batch)
+    started = time.perf_counter()
+    for start in range(0, sample, batch):
+        touched = np.unique(agents[start : start + batch])
+        index.resolve(matcher.match(index.population[:, touched]))
+    baseline_s = (time.perf_counter() - started) / max(sample, 1)
+    consistent = bool(np.array_equal(index.resolve(matcher.match(index.population)), index.held))
+    print(
+        f"[trait_index] batch={batch} deltas={args.deltas} retested_pairs={retested} "
+        f"indexed_deltas_per_s={args.deltas / batch_s:,.0f} "
+        f"full_recheck_deltas_per_s={1.0 / baseline_s:,.0f} consistent={consistent}"
+    )
+
+    singles = min(args.deltas, 20000)
+    agents, columns, values = synthetic_deltas(index, singles, seed=args.seed + 2)
+    started = time.perf_counter()
+    for agent, column, value in zip(agents.tolist(), columns.tolist(), values.tolist()):
+        index.apply_one(agent, column, value)
+    single_s = (time.perf_counter() - started) / singles
+    started = time.perf_counter()
+    for agent in agents[:1000].tolist():
+        index.resolve(matcher.match(index.population[:, agent : agent + 1]))
+    single_baseline_s = (time.perf_counter() - started) / min(singles, 1000)
+    consistent = bool(np.array_equal(index.resolve(matcher.match(index.population)), index.held))
+    print(
+        f"[trait_index] single deltas={singles} indexed_us={single_s * 1e6:.1f} "
+        f"full_recheck_us={single_baseline_s * 1e6:.1f} consistent={consistent}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""Batch matcher for trait_defs_v3 acquisition conditions.
+
+Personality, physical and cognitive traits in gen_trait_v3.py carry
+  "acquisition": {"conditions": [{"source": "hexaco", "axis": "H",
+                                  "direction": "high", "threshold": 0.88}, ...],
+                  "require_all": true}
+and synergy traits carry "required_traits" instead. TraitMatcher compiles
+every condition into one row of a (conditions, agents) boolean mask:
+"high" holds at value >= threshold, "low" at value <= threshold, with body
+stats (int 0-10000) divided by 10000 first. Trait masks are an AND (or OR for
+require_all false) over each trait's condition rows, and synergy masks an AND
+over their required traits, so a whole population is matched in one pass.
+
+Event, genetic, skill, relationship and fate traits have no stat conditions;
+they are granted by game systems and are listed as unmatched. Synergy traits
+that require one of those (or sit in a requirement cycle) cannot be matched
+either and are listed separately as unresolved_synergy.
+
+Population arrays are (columns, agents) in TraitMatcher.columns order, raw
+units, like the stats-major arrays of stat_curves.py. An .npz population
+holds one array per column named "<source>.<key>" (e.g. "hexaco.H").
+
+Usage:
+  python3 tools/trait_matcher.py --project-root . --agents 200000
+  python3 tools/trait_matcher.py --project-root . --population pop.npz --report-json report.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+SOURCES: tuple[str, ...] = ("hexaco", "value", "body", "intelligence")
+SOURCE_SCALE: Dict[str, float] = {"hexaco": 1.0, "value": 1.0, "body": 10000.0, "intelligence": 1.0}
+RARITY_TIERS: tuple[str, ...] = ("common", "uncommon", "rare", "epic", "legendary")
+TRAIT_DEFS_PATH = Path("data/personality/trait_defs_v3.json")
+
+
+def load_traits(project_root: Path) -> List[Dict[str, Any]]:
+    """trait_defs_v3.json if it was generated, else the gen_trait_v3 definitions."""
+    path = project_root / TRAIT_DEFS_PATH
+    if path.is_file():
+        with path.open("r", encoding="utf-8") as fp:
+            return json.load(fp)
+    from gen_trait_v3 import build_traits
+
+    traits, _effects = build_traits()
+    return traits
+
+
+def condition_column(cond: Dict[str, Any]) -> Tuple[str, str]:
+    source = str(cond.get("source", ""))
+    if source not in SOURCES:
+        raise ValueError(f"unsupported condition source {source!r}")
+    key = str(cond.get("axis", cond.get("key", "")))
+    if not key:
+        raise ValueError(f"{source} condition without axis/key")
+    return source, key
+
+
+class TraitMatcher:
+    def __init__(self, traits: List[Dict[str, Any]]) -> None:
+        self.traits = {str(trait["id"]): trait for trait in traits}
+        if len(self.traits) != len(traits):
+            raise ValueError("duplicate trait ids")
+        conditional = [t for t in traits if (t.get("acquisition") or {}).get("conditions")]
+        self.columns: List[Tuple[str, str]] = sorted(
+            {condition_column(cond) for t in conditional for cond in t["acquisition"]["conditions"]}
+        )
+        self.column_index = {column: idx for idx, column in enumerate(self.columns)}
+
+        cond_columns: List[int] = []
+        thresholds: List[float] = []
+        signs: List[float] = []
+        starts: List[int] = []
+        for trait in conditional:
+            starts.append(len(cond_columns))
+            for cond in trait["acquisition"]["conditions"]:
+                column = condition_column(cond)
+                direction = str(cond.get("direction", ""))
+                if direction not in ("high", "low"):
+                    raise ValueError(f"{trait['id']}: unsupported direction {direction!r}")
+                cond_columns.append(self.column_index[column])
+                thresholds.append(float(cond["threshold"]) * SOURCE_SCALE[column[0]])
+                # "low" is compared as -value >= -threshold, so one >= serves both.
+                signs.append(1.0 if direction == "high" else -1.0)
+        self.cond_columns = np.array(cond_columns, dtype=np.intp)
+        self.cond_sign = np.array(signs).reshape(-1, 1)
+        self.cond_level = (np.array(thresholds) * np.array(signs)).reshape(-1, 1)
+        self.cond_starts = np.array(starts, dtype=np.intp)
+        self.any_of = np.array(
+            [not trait["acquisition"].get("require_all", True) for trait in conditional], dtype=bool
+        )
+
+        self.ids: List[str] = [str(trait["id"]) for trait in conditional]
+        self.unresolved_synergy: List[str] = []
+        self.synergy = self._resolve_synergy(traits)
+        self.ids.extend(trait_id for trait_id, _required in self.synergy)
+        self.index = {trait_id: idx for idx, trait_id in enumerate(self.ids)}
+        self.unmatched: List[str] = [trait_id for trait_id in self.traits if trait_id not in self.index]
+
+    @classmethod
+    def load(cls, project_root: Path) -> "TraitMatcher":
+        return cls(load_traits(project_root))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _resolve_synergy(self, traits: List[Dict[str, Any]]) -> List[Tuple[str, List[int]]]:
+        """(trait id, required rows) in an order where every requirement comes first."""
+        known = {trait_id: idx for idx, trait_id in enumerate(self.ids)}
+        pending = {
+            str(t["id"]): [str(r) for r in t["acquisition"]["required_traits"]]
+            for t in traits
+            if (t.get("acquisition") or {}).get("required_traits")
+        }
+        for trait_id, required in pending.items():
+            missing = [r for r in required if r not in self.traits]
+            if missing:
+                raise ValueError(f"{trait_id}: unknown required_traits {missing}")
+        ordered: List[Tuple[str, List[int]]] = []
+        progress = True
+        while pending and progress:
+            progress = False
+            for trait_id in sorted(pending):
+                required = pending[trait_id]
+                if all(r in known for r in required):
+                    known[trait_id] = len(known)
+                    ordered.append((trait_id, [known[r] for r in required]))
+                    del pending[trait_id]
+                    progress = True
+        # Whatever is left needs an unmatched (event) trait or forms a cycle.
+        self.unresolved_synergy = sorted(pending)
+        return ordered
+
+    def _check(self, population: np.ndarray) -> None:
+        if population.ndim != 2 or population.shape[0] != len(self.columns):
+            raise ValueError(
+                f"expected ({len(self.columns)}, agents) population, got {population.shape}"
+            )
+
+    def condition_masks(self, population: np.ndarray) -> np.ndarray:
+        """(conditions, agents) bool, one row per compiled condition."""
+        population = np.asarray(population, dtype=float)
+        self._check(population)
+        values = population[self.cond_columns]
+        values *= self.cond_sign
+        return values >= self.cond_level
+
+    def match(self, population: np.ndarray) -> np.ndarray:
+        """(traits, agents) bool in self.ids order."""
+        holds = self.condition_masks(population)
+        out = np.empty((len(self), holds.shape[1]), dtype=bool)
+        conditional = len(self.cond_starts)
+        if conditional:
+            out[:conditional] = np.logical_and.reduceat(holds, self.cond_starts, axis=0)
+            if self.any_of.any():
+                either = np.logical_or.reduceat(holds, self.cond_starts, axis=0)
+                out[:conditional][self.any_of] = either[self.any_of]
+        for offset, (_trait_id, required) in enumerate(self.synergy):
+            row = out[conditional + offset]
+            np.logical_and.reduce(out[required], axis=0, out=row)
+        return out
+
+    def count(self, chunks: Iterable[np.ndarray]) -> Tuple[np.ndarray, int]:
+        """Per-trait holder counts over a stream of population chunks."""
+        counts = np.zeros(len(self), dtype=np.int64)
+        agents = 0
+        for chunk in chunks:
+            counts += self.match(chunk).sum(axis=1)
+            agents += chunk.shape[1]
+        return counts, agents
+
+    def rarity_report(self, counts: np.ndarray, agents: int) -> Dict[str, Any]:
+        """Frequencies per trait and per rarity tier.
+
+        A trait is flagged `out_of_tier` when it is more frequent than the
+        median trait of the nearest lower tier, e.g. a legendary that shows up
+        more often than a typical epic.
+        """
+        frequency = counts / max(agents, 1)
+        rows = [
+            {
+                "id": trait_id,
+                "rarity": str(self.traits[trait_id].get("rarity", "")),
+                "category": str(self.traits[trait_id].get("category", "")),
+                "count": int(counts[idx]),
+                "frequency": float(frequency[idx]),
+            }
+            for idx, trait_id in enumerate(self.ids)
+        ]
+        tiers: Dict[str, Dict[str, Any]] = {}
+        for tier in RARITY_TIERS:
+            values = np.array([row["frequency"] for row in rows if row["rarity"] == tier])
+            if values.size:
+                tiers[tier] = {
+                    "traits": int(values.size),
+                    "min": float(values.min()),
+                    "median": float(np.median(values)),
+                    "max": float(values.max()),
+                }
+        out_of_tier = []
+        present = [tier for tier in RARITY_TIERS if tier in tiers]
+        for row in rows:
+            if row["rarity"] not in present:
+                continue
+            position = present.index(row["rarity"])
+            if position and row["frequency"] > tiers[present[position - 1]]["median"]:
+                out_of_tier.append(row["id"])
+        return {
+            "agents": agents,
+            "traits": sorted(rows, key=lambda row: -row["frequency"]),
+            "tiers": tiers,
+            "out_of_tier": out_of_tier,
+            "unmatched": list(self.unmatched),
+            "unresolved_synergy": list(self.unresolved_synergy),
+        }
+
+
+def synthetic_population(
+    columns: List[Tuple[str, str]],
+    agent_count: int,
+    seed: int = 0,
+    sd: float = 0.2,
+) -> np.ndarray:
+    """Independent N(0.5, sd) draws per column, clamped and scaled to each source's units."""
+    rng = np.random.default_rng(seed)
+    population = rng.normal(0.5, sd, size=(len(columns), agent_count))
+    for row, (source, _key) in enumerate(columns):
+        if source == "intelligence":
+            np.clip(population[row], 0.02, 0.98, out=population[row])
+        else:
+            np.clip(population[row], 0.0, 1.0, out=population[row])
+        population[row] *= SOURCE_SCALE[source]
+    return population
+
+
+def load_population(path: Path, columns: List[Tuple[str, str]]) -> np.ndarray:
+    with np.load(path) as data:
+        missing = [f"{source}.{key}" for source, key in columns if f"{source}.{key}" not in data]
+        if missing:
+            raise ValueError(f"{path}: missing population columns {missing}")
+        return np.stack([np.asarray(data[f"{source}.{key}"], dtype=float) for source, key in columns])
+
+
+def _chunks(population: np.ndarray, size: int) -> Iterable[np.ndarray]:
+    for start in range(0, population.shape[1], size):
+        yield population[:, start : start + size]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--project-root", default=".", help="WorldSim project root")
+    parser.add_argument("--population", default="", help="optional .npz population (<source>.<key> arrays)")
+    parser.add_argument("--agents", type=int, default=200000, help="synthetic population size")
+    parser.add_argument("--seed", type=int, default=0, help="synthetic population seed")
+    parser.add_argument("--sd", type=float, default=0.2, help="synthetic population sd (normalized units)")
+    parser.add_argument("--chunk", type=int, default=50000, help="agents matched per pass")
+    parser.add_argument("--top", type=int, default=10, help="print the N most frequent traits")
+    parser.add_argument("--report-json", default="", help="optional frequency/rarity report")
+    args = parser.parse_args()
+
+    project_root = Path(args.project_root).resolve()
+    matcher = TraitMatcher.load(project_root)
+    if args.population:
+        population = load_population((project_root / args.population).resolve(), matcher.columns)
+    else:
+        population = synthetic_population(matcher.columns, args.agents, seed=args.seed, sd=args.sd)
+
+    started = time.perf_counter()
+    counts, agents = matcher.count(_chunks(population, max(args.chunk, 1)))
+    match_ms = (time.perf_counter() - started) * 1000.0
+    report = matcher.rarity_report(counts, agents)
+    print(
+        f"[trait_matcher] traits={len(matcher.traits)} matched={len(matcher)} "
+        f"conditions={len(matcher.cond_columns)} columns={len(matcher.columns)} "
+        f"agents={agents} match_ms={match_ms:.1f}"
+    )
+    for tier, item in report["tiers"].items():
+        print(
+            f"  {tier}: traits={item['traits']} min={item['min']:.5f} "
+            f"median={item['median']:.5f} max={item['max']:.5f}"
+        )
+    for row in report["traits"][: args.top]:
+        print(f"  {row['id']} ({row['rarity']}): {row['frequency']:.5f}")
+    if report["unresolved_synergy"]:
+        print(
+            "[trait_matcher] synergy traits with unmatchable requirements: "
+            + ", ".join(report["unresolved_synergy"])
+        )
+    if report["out_of_tier"]:
+        print(f"[trait_matcher] more common than the tier below: {', '.join(report['out_of_tier'])}")
+    if args.report_json:
+        out_path = (project_root / args.report_json).resolve()
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        with out_path.open("w", encoding="utf-8") as fp:
+            json.dump(report, fp, indent=2)
+            fp.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,18 @@
 #!/usr/bin/env python3
-"""Trait migration script for 2-level hybrid trait model outputs."""
+"""Trait migration script for 2-level hybrid trait model outputs.
+
+Validation runs against a MigrationIndex built once per run (id -> trait and
+(action, trait_id) -> values for the violation and behavior maps). Spot checks
+are data rules; more can be added without code via --rules:
+  python3 tools/trait_migration.py --rules checks.json --check-only
+where checks.json is a list such as
+  [{"check": "trait_field", "trait": "f_sincere", "field": "t_on", "equals": 0.90},
+   {"check": "mapping", "map": "violation", "action": "lie", "trait": "f_sincere", "equals": 14}]
+"""
 
 from __future__ import annotations
 
+import argparse
 import json
 from pathlib import Path
 from typing import Any
@@ -332,20 +342,110 @@ def write_json(path: Path, data: Any) -> None:
         fp.write("\n")
 
 
-def find_new_trait(new_traits: list[dict[str, Any]], trait_id: str) -> dict[str, Any] | None:
-    for trait in new_traits:
-        if trait.get("id") == trait_id:
-            return trait
-    return None
-
+class MigrationIndex:
+    """Hash indexes over migration outputs, built once and shared by every check."""
+
+    def __init__(
+        self,
+        new_traits: list[dict[str, Any]],
+        violation_map: dict[str, list[dict[str, Any]]],
+        behavior_map: dict[str, list[dict[str, Any]]] | None = None,
+    ) -> None:
+        self.traits: dict[str, dict[str, Any]] = {}
+        for trait in new_traits:
+            # First occurrence wins, like the scan it replaces.
+            self.traits.setdefault(str(trait.get("id")), trait)
+        self.mappings: dict[str, dict[tuple[str, str], list[float]]] = {
+            "violation": self._pairs(violation_map, "base_stress"),
+            "behavior": self._pairs(behavior_map or {}, "extreme_val"),
+        }
+
+    @staticmethod
+    def _pairs(action_map: dict[str, list[dict[str, Any]]], field: str) -> dict[tuple[str, str], list[float]]:
+        pairs: dict[tuple[str, str], list[float]] = {}
+        for action, items in action_map.items():
+            for item in items:
+                pairs.setdefault((action, str(item.get("trait_id"))), []).append(float(item.get(field, -9999.0)))
+        return pairs
+
+    def trait(self, trait_id: str) -> dict[str, Any] | None:
+        return self.traits.get(trait_id)
+
+    def has_mapping(self, kind: str, action: str, trait_id: str, value: float, tolerance: float = 0.001) -> bool:
+        return any(abs(v - value) <= tolerance for v in self.mappings[kind].get((action, trait_id), ()))
+
+    def has_violation_entry(self, action: str, trait_id: str, base_stress: float) -> bool:
+        return self.has_mapping("violation", action, trait_id, base_stress)
+
+
+# Rule kind -> required keys. Optional on every rule: "tolerance" (numeric equals, default 0.001).
+RULE_CHECKS: dict[str, tuple[str, ...]] = {
+    "trait_exists": ("trait",),
+    "trait_field": ("trait", "field", "equals"),
+    "mapping": ("map", "action", "trait", "equals"),
+}
 
-def has_violation_entry(
-    violation_map: dict[str, list[dict[str, Any]]], action: str, trait_id: str, base_stress: float
-) -> bool:
-    for item in violation_map.get(action, []):
-        if item.get("trait_id") == trait_id and abs(float(item.get("base_stress", -9999.0)) - base_stress) <= 0.001:
-            return True
-    return False
+# Spot checks of the v2 migration; same shape as a --rules file.
+DEFAULT_RULES: list[dict[str, Any]] = [
+    {"check": "trait_field", "trait": "f_sincere", "field": "t_on", "equals": 0.90},
+    {"check": "trait_field", "trait": "f_sincere", "field": "t_off", "equals": 0.84},
+    {"check": "trait_field", "trait": "f_sincere", "field": "salience_center", "equals": 0.87},
+    {"check": "trait_field", "trait": "f_deceptive", "field": "t_on", "equals": 0.16},
+    {"check": "trait_field", "trait": "f_deceptive", "field": "t_off", "equals": 0.22},
+    {"check": "trait_field", "trait": "d_psychopath_primary", "field": "category", "equals": "dark"},
+    {"check": "trait_field", "trait": "d_psychopath_primary", "field": "violation_override", "equals": True},
+    {"check": "trait_field", "trait": "d_psychopath_primary", "field": "rarity_bonus", "equals": 1.2},
+    {"check": "mapping", "map": "violation", "action": "lie", "trait": "f_sincere", "equals": 14.0},
+    {"check": "mapping", "map": "violation", "action": "harm_innocent", "trait": "d_psychopath_primary", "equals": 0.0},
+]
+
+
+def load_rules(path: Path) -> list[dict[str, Any]]:
+    with path.open("r", encoding="utf-8") as fp:
+        rules = json.load(fp)
+    if not isinstance(rules, list):
+        raise ValueError(f"{path}: rules file must be a list")
+    for idx, rule in enumerate(rules):
+        check = rule.get("check") if isinstance(rule, dict) else None
+        if check not in RULE_CHECKS:
+            raise ValueError(f"{path}: rule {idx} has unknown check {check!r} (expected one of {list(RULE_CHECKS)})")
+        missing = [key for key in RULE_CHECKS[check] if key not in rule]
+        if missing:
+            raise ValueError(f"{path}: rule {idx} ({check}) missing {missing}")
+        if check == "mapping" and rule["map"] not in ("violation", "behavior"):
+            raise ValueError(f"{path}: rule {idx} has unknown map {rule['map']!r}")
+    return rules
+
+
+def _matches(actual: Any, expected: Any, tolerance: float) -> bool:
+    if isinstance(expected, bool) or not isinstance(expected, (int, float)):
+        return actual == expected
+    try:
+        return abs(float(actual) - float(expected)) <= tolerance
+    except (TypeError, ValueError):
+        return False
+
+
+def run_rules(index: MigrationIndex, rules: list[dict[str, Any]]) -> list[str]:
+    errors: list[str] = []
+    missing_reported: set[str] = set()
+    for rule in rules:
+        trait_id = str(rule["trait"])
+        tolerance = float(rule.get("tolerance", 0.001))
+        if rule["check"] == "mapping":
+            value = float(rule["equals"])
+            if not index.has_mapping(rule["map"], str(rule["action"]), trait_id, value, tolerance):
+                errors.append(f"{rule['map']}_mappings missing {rule['action']} -> {trait_id}({value:g})")
+            continue
+        trait = index.trait(trait_id)
+        if trait is None:
+            if trait_id not in missing_reported:
+                missing_reported.add(trait_id)
+                errors.append(f"Missing {trait_id}")
+            continue
+        if rule["check"] == "trait_field" and not _matches(trait.get(rule["field"]), rule["equals"], tolerance):
+            errors.append(f"{trait_id} {rule['field']} mismatch: {trait.get(rule['field'])} (expected {rule['equals']})")
+    return errors
 
 
 def validate_migration(
@@ -356,30 +456,27 @@ def validate_migration(
     violation_map: dict[str, list[dict[str, Any]]],
     ko_locale: dict[str, str],
     en_locale: dict[str, str],
+    rules: list[dict[str, Any]] | None = None,
 ) -> list[str]:
     errors: list[str] = []
+    index = MigrationIndex(new_traits, violation_map, behavior_map)
 
     if len(new_traits) != len(old_traits):
         errors.append(f"Count mismatch: {len(old_traits)} -> {len(new_traits)}")
 
     # violation_stress=0 보존
-    zero_pairs: list[tuple[str, str]] = []
     for trait in old_traits:
         violation = trait.get("effects", {}).get("stress_modifiers", {}).get("violation_stress", {})
         if not isinstance(violation, dict):
             continue
         for action, value in violation.items():
-            if abs(float(value)) <= 0.000001:
-                zero_pairs.append((trait["id"], action))
-
-    for trait_id, action in zero_pairs:
-        if not has_violation_entry(violation_map, action, trait_id, 0.0):
-            errors.append(f"Zero violation stress not preserved: {trait_id} / {action}")
+            if abs(float(value)) <= 0.000001 and not index.has_violation_entry(action, trait["id"], 0.0):
+                errors.append(f"Zero violation stress not preserved: {trait['id']} / {action}")
 
     # mutex_group 24쌍 설정
     for facet_key, (trait_a, trait_b) in MUTEX_PAIRS.items():
         for trait_id in (trait_a, trait_b):
-            migrated = find_new_trait(new_traits, trait_id)
+            migrated = index.trait(trait_id)
             if migrated is None:
                 errors.append(f"Missing mutex trait: {trait_id}")
                 continue
@@ -390,26 +487,8 @@ def validate_migration(
                     f"Wrong mutex_group for {trait_id}: {migrated.get('mutex_group')} (expected {facet_key})"
                 )
 
-    # f_sincere 기준값 검증
-    sincere = find_new_trait(new_traits, "f_sincere")
-    if sincere is None:
-        errors.append("Missing f_sincere")
-    else:
-        if abs(float(sincere.get("t_on", -1.0)) - 0.90) > 0.001:
-            errors.append(f"f_sincere t_on mismatch: {sincere.get('t_on')}")
-        if abs(float(sincere.get("t_off", -1.0)) - 0.84) > 0.001:
-            errors.append(f"f_sincere t_off mismatch: {sincere.get('t_off')}")
-        if abs(float(sincere.get("salience_center", -1.0)) - 0.87) > 0.001:
-            errors.append(f"f_sincere salience_center mismatch: {sincere.get('salience_center')}")
-
-    deceptive = find_new_trait(new_traits, "f_deceptive")
-    if deceptive is None:
-        errors.append("Missing f_deceptive")
-    else:
-        if abs(float(deceptive.get("t_on", -1.0)) - 0.16) > 0.001:
-            errors.append(f"f_deceptive t_on mismatch: {deceptive.get('t_on')}")
-        if abs(float(deceptive.get("t_off", -1.0)) - 0.22) > 0.001:
-            errors.append(f"f_deceptive t_off mismatch: {deceptive.get('t_off')}")
+    # f_sincere / f_deceptive 기준값, d_psychopath_primary, violation 항목
+    errors.extend(run_rules(index, DEFAULT_RULES + list(rules or [])))
 
     # rarity_bonus n=3 -> 1.1
     found_three_condition = False
@@ -422,23 +501,6 @@ def validate_migration(
     if not found_three_condition:
         errors.append("No 3-condition composite trait found to validate rarity_bonus=1.1")
 
-    psych = find_new_trait(new_traits, "d_psychopath_primary")
-    if psych is None:
-        errors.append("Missing d_psychopath_primary")
-    else:
-        if psych.get("category") != "dark":
-            errors.append("d_psychopath_primary category should be dark")
-        if psych.get("violation_override") is not True:
-            errors.append("d_psychopath_primary violation_override should be true")
-        if abs(float(psych.get("rarity_bonus", -1.0)) - 1.2) > 0.001:
-            errors.append(f"d_psychopath_primary rarity_bonus mismatch: {psych.get('rarity_bonus')}")
-
-    if not has_violation_entry(violation_map, "lie", "f_sincere", 14.0):
-        errors.append("violation_mappings missing lie -> f_sincere(14)")
-
-    if not has_violation_entry(violation_map, "harm_innocent", "d_psychopath_primary", 0.0):
-        errors.append("violation_mappings missing harm_innocent -> d_psychopath_primary(0)")
-
     if len(ko_locale) != 374:
         errors.append(f"ko locale key count mismatch: {len(ko_locale)}")
     if len(en_locale) != 374:
@@ -458,6 +520,19 @@ def validate_migration(
 
 
 def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--rules",
+        action="append",
+        default=[],
+        help="JSON list of extra validation rules (repeatable); see the module docstring",
+    )
+    parser.add_argument("--check-only", action="store_true", help="validate without writing outputs")
+    args = parser.parse_args()
+    rules: list[dict[str, Any]] = []
+    for path in args.rules:
+        rules.extend(load_rules(Path(path)))
+
     old_traits = load_traits(SOURCE_PATH)
 
     new_traits = build_trait_defs_v2(old_traits)
@@ -474,12 +549,16 @@ def main() -> int:
         violation_map,
         ko_locale,
         en_locale,
+        rules,
     )
     if errors:
         print("[FAIL] Migration validation failed:")
         for err in errors:
             print(f" - {err}")
         return 1
+    if args.check_only:
+        print(f"[OK] Validated {len(old_traits)} traits ({len(DEFAULT_RULES) + len(rules)} rules); nothing written")
+        return 0
 
     write_json(TRAIT_V2_PATH, new_traits)
     write_json(BEHAVIOR_PATH, behavior_map)